@@ -23,12 +23,26 @@ class Grafo:
 
         self.N = N
 
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+
+        # Índice de incidência: para cada vértice, um dicionário que associa o nome de cada aresta incidente ao vértice vizinho
+        self.incidencia = {}
+        for v in N:
+            self.incidencia[v] = {}
+
         for a in A:
             if not(self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
         self.A = A
 
+        for a in A:
+            self.__indexa_aresta(a, A[a])
+
     def arestaValida(self, aresta=''):
         '''
         Verifica se uma aresta passada como parâmetro está dentro do padrão estabelecido.
@@ -74,7 +88,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def existeAresta(self, aresta=''):
         '''
@@ -84,9 +98,11 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, aresta):
-            for k in self.A:
+            v = aresta[:aresta.index(Grafo.SEPARADOR_ARESTA)]
+            for k in self.incidencia[v]:
                 if aresta == self.A[k]:
                     existe = True
+                    break
 
         return existe
 
@@ -97,7 +113,9 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            self.indices[v] = len(self.N)
             self.N.append(v)
+            self.incidencia[v] = {}
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -108,10 +126,36 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            if nome in self.A:
+                self.__desindexa_aresta(nome, self.A[nome])
             self.A[nome] = a
+            self.__indexa_aresta(nome, a)
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
+    def __indexa_aresta(self, nome, a):
+        '''
+        Registra uma aresta no índice de incidência dos dois vértices que ela conecta.
+        Um laço é registrado uma única vez no seu vértice.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        v1 = a[:i_traco]
+        v2 = a[i_traco+1:]
+        self.incidencia[v1][nome] = v2
+        self.incidencia[v2][nome] = v1
+
+    def __desindexa_aresta(self, nome, a):
+        '''
+        Remove uma aresta do índice de incidência dos dois vértices que ela conecta.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        self.incidencia[a[:i_traco]].pop(nome, None)
+        self.incidencia[a[i_traco+1:]].pop(nome, None)
+
 
 # ======================================================================================================================
 #                                                       ROTEIRO 1
@@ -167,11 +211,7 @@ class Grafo:
         Resposta da D da Segunda questão pro primeiro roteiro " Qual o grau de um vértice arbitrário?"
         '''
 
-        cont = 0
-        for i in self.A.values():
-            if x in i:
-                cont += 1
-        return cont
+        return len(self.incidencia.get(x, {}))
 
     def arestas_sobre_vertice(self, x):
 
@@ -179,11 +219,7 @@ class Grafo:
         Resposta da E da Segunda questão pro primeiro roteiro " Quais arestas incidem sobre um vértice N arbitrário?"
         '''
 
-        arestas = []
-        for i in self.A.keys():
-            if x in self.A[i]:
-                arestas.append(i)
-        return arestas
+        return list(self.incidencia.get(x, {}))
 
     def eh_completo(self):
 
@@ -298,3 +334,21 @@ class TestGrafo(unittest.TestCase):
         self.assertFalse((self.g_l3.eh_completo()))
         self.assertTrue((self.g_l4.eh_completo()))
         self.assertTrue((self.g_l5.eh_completo()))
+
+    def test_indice_incidencia(self):
+        g = Grafo(['JP', 'CG', 'P'], {'a1': 'JP-CG'})
+        self.assertEqual(g.grau('P'), 0)
+        self.assertEqual(g.arestas_sobre_vertice('P'), [])
+
+        g.adicionaAresta('a2', 'CG-P')
+        g.adicionaAresta('a3', 'P-P')
+        self.assertEqual(g.grau('CG'), 2)
+        self.assertEqual(g.grau('P'), 2)
+        self.assertEqual(g.arestas_sobre_vertice('P'), ['a2', 'a3'])
+        self.assertTrue(g.existeAresta('CG-P'))
+        self.assertFalse(g.existeAresta('P-CG'))
+
+        # Renomear o destino de uma aresta existente atualiza o índice
+        g.adicionaAresta('a2', 'JP-P')
+        self.assertEqual(g.arestas_sobre_vertice('CG'), ['a1'])
+        self.assertEqual(set(g.arestas_sobre_vertice('JP')), set(['a1', 'a2']))
@@ -1,3 +1,5 @@
+from collections import deque
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -22,12 +24,26 @@ class Grafo:
 
         self.N = N
 
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+
+        # Índice de incidência: para cada vértice, um dicionário que associa o nome de cada aresta incidente ao vértice vizinho
+        self.incidencia = {}
+        for v in N:
+            self.incidencia[v] = {}
+
         for a in A:
             if not(self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
         self.A = A
 
+        for a in A:
+            self.__indexa_aresta(a, A[a])
+
     def arestaValida(self, aresta=''):
         '''
         Verifica se uma aresta passada como parâmetro está dentro do padrão estabelecido.
@@ -73,7 +89,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def existeAresta(self, aresta=''):
         '''
@@ -83,9 +99,11 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, aresta):
-            for k in self.A:
+            v = aresta[:aresta.index(Grafo.SEPARADOR_ARESTA)]
+            for k in self.incidencia[v]:
                 if aresta == self.A[k]:
                     existe = True
+                    break
 
         return existe
 
@@ -96,7 +114,9 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            self.indices[v] = len(self.N)
             self.N.append(v)
+            self.incidencia[v] = {}
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -107,10 +127,36 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            if nome in self.A:
+                self.__desindexa_aresta(nome, self.A[nome])
             self.A[nome] = a
+            self.__indexa_aresta(nome, a)
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
+    def __indexa_aresta(self, nome, a):
+        '''
+        Registra uma aresta no índice de incidência dos dois vértices que ela conecta.
+        Um laço é registrado uma única vez no seu vértice.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        v1 = a[:i_traco]
+        v2 = a[i_traco+1:]
+        self.incidencia[v1][nome] = v2
+        self.incidencia[v2][nome] = v1
+
+    def __desindexa_aresta(self, nome, a):
+        '''
+        Remove uma aresta do índice de incidência dos dois vértices que ela conecta.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        self.incidencia[a[:i_traco]].pop(nome, None)
+        self.incidencia[a[i_traco+1:]].pop(nome, None)
+
 
 # =======================================================================================================================
 #                                            Funções auxiliares
@@ -126,53 +172,61 @@ class Grafo:
         """
 
         aux = {}
-        for i in self.A.keys():
-            if vetor in self.A[i]:
-                if vetor == self.A[i][-1]:
-                    aux[i] = self.A[i][::-1]
-                else:
-                    aux[i] = self.A[i]
+        for i, vizinho in self.incidencia.get(vetor, {}).items():
+            aux[i] = vetor + Grafo.SEPARADOR_ARESTA + vizinho
         return aux
 
 
+#=======================================================================================================================
+#                                                       ROTEIRO 2
+#=======================================================================================================================
+
 
-    def seleciona_arestas(self, vetor):
+    def iter_dfs(self, vertice):
 
         """
-        Função auxiliar que seleciona as arestas que incidem em um determinado vertice.
-        :param vetor: Vetor sendo analisado;
-        :return: Um Dicionario contendo as aresta que incidem no vertice.
+        Gera os vértices da busca em profundidade à medida que são descobertos.
+        A busca é feita com uma pilha explícita, então não depende do limite de recursão do Python.
+        :param vertice: Vertice que o usuario deseja iniciar o caminho;
+        :return: Gerador de tuplas (vertice, aresta), onde aresta é o nome da aresta usada para chegar
+        ao vértice, ou None para o vértice inicial.
         """
 
-        aux = {}
-        for i in self.A.keys():
-            if vetor in self.A[i]:
-                if vetor == self.A[i][-1]:
-                    aux[i] = self.A[i][::-1]
-                else:
-                    aux[i] = self.A[i]
-        return aux
-
-
-#=======================================================================================================================
-#                                                       ROTEIRO 2
-#=======================================================================================================================
+        visitados = {vertice}
+        yield vertice, None
 
+        # Cada elemento da pilha percorre as arestas de um vértice do caminho atual
+        pilha = [iter(self.incidencia.get(vertice, {}).items())]
+        while pilha:
+            for aresta, vizinho in pilha[-1]:
+                if vizinho not in visitados:
+                    visitados.add(vizinho)
+                    yield vizinho, aresta
+                    pilha.append(iter(self.incidencia[vizinho].items()))
+                    break
+            else:
+                pilha.pop()
 
-    def controle(self, d, lista):
+    def iter_bfs(self, vertice):
 
         """
-        Função auxiliar para a função *DFS*.
-        :param d: Vertice sendo atualmente processado;
-        :param lista: Lista resultante para o DFS;
+        Gera os vértices da busca em largura à medida que são descobertos.
+        :param vertice: Vertice que o usuario deseja iniciar o caminho;
+        :return: Gerador de tuplas (vertice, aresta), onde aresta é o nome da aresta usada para chegar
+        ao vértice, ou None para o vértice inicial.
         """
 
-        aux = self.seleciona_arestas(d)
-        for aresta in aux.keys():
-            if aux[aresta][-1] not in lista:
-                lista.append(aresta)
-                lista.append(aux[aresta][-1])
-                self.controle(aux[aresta][-1], lista)
+        visitados = {vertice}
+        yield vertice, None
+
+        fila = deque([vertice])
+        while fila:
+            atual = fila.popleft()
+            for aresta, vizinho in self.incidencia.get(atual, {}).items():
+                if vizinho not in visitados:
+                    visitados.add(vizinho)
+                    yield vizinho, aresta
+                    fila.append(vizinho)
 
     def DFS(self, vertice):
 
@@ -182,9 +236,11 @@ class Grafo:
         :return: Lista contendo o DFS
         """
 
-
-        lista = [vertice]
-        self.controle(vertice, lista)
+        lista = []
+        for v, aresta in self.iter_dfs(vertice):
+            if aresta is not None:
+                lista.append(aresta)
+            lista.append(v)
 
         return lista
 
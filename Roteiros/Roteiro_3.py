@@ -1,3 +1,5 @@
+from collections import deque
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -22,12 +24,32 @@ class Grafo:
 
         self.N = N
 
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+
+        # Floresta de conjuntos disjuntos com as componentes conexas, atualizada a cada aresta adicionada
+        self.__pai = list(range(len(N)))
+        self.__tamanho = [1] * len(N)
+        self.__quantidade_componentes = len(self.indices)
+        self.__componentes_desatualizadas = False
+
+        # Índice de incidência: para cada vértice, um dicionário que associa o nome de cada aresta incidente ao vértice vizinho
+        self.incidencia = {}
+        for v in N:
+            self.incidencia[v] = {}
+
         for a in A:
             if not(self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
 
         self.A = A
 
+        for a in A:
+            self.__indexa_aresta(a, A[a])
+
     def arestaValida(self, aresta=''):
         '''
         Verifica se uma aresta passada como parâmetro está dentro do padrão estabelecido.
@@ -73,7 +95,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def existeAresta(self, aresta=''):
         '''
@@ -83,9 +105,11 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, aresta):
-            for k in self.A:
+            v = aresta[:aresta.index(Grafo.SEPARADOR_ARESTA)]
+            for k in self.incidencia[v]:
                 if aresta == self.A[k]:
                     existe = True
+                    break
         return existe
 
     def adicionaVertice(self, v):
@@ -95,7 +119,12 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            self.indices[v] = len(self.N)
             self.N.append(v)
+            self.incidencia[v] = {}
+            self.__pai.append(self.indices[v])
+            self.__tamanho.append(1)
+            self.__quantidade_componentes += 1
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -106,10 +135,85 @@ class Grafo:
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
         if self.arestaValida(a):
+            if nome in self.A:
+                self.__desindexa_aresta(nome, self.A[nome])
             self.A[nome] = a
+            self.__indexa_aresta(nome, a)
         else:
             ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
 
+    def __indexa_aresta(self, nome, a):
+        '''
+        Registra uma aresta no índice de incidência dos dois vértices que ela conecta.
+        Um laço é registrado uma única vez no seu vértice.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        v1 = a[:i_traco]
+        v2 = a[i_traco+1:]
+        self.incidencia[v1][nome] = v2
+        self.incidencia[v2][nome] = v1
+        if not self.__componentes_desatualizadas:
+            self.__une(self.indices[v1], self.indices[v2])
+
+    def __desindexa_aresta(self, nome, a):
+        '''
+        Remove uma aresta do índice de incidência dos dois vértices que ela conecta.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        '''
+        i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+        self.incidencia[a[:i_traco]].pop(nome, None)
+        self.incidencia[a[i_traco+1:]].pop(nome, None)
+
+        # Sem a aresta as componentes podem se separar, então elas são refeitas na próxima consulta
+        self.__componentes_desatualizadas = True
+
+    def __raiz(self, x):
+        '''
+        Encontra o representante da componente do vértice de índice x, comprimindo o caminho percorrido.
+        :param x: O índice do vértice
+        :return: O índice do representante da componente
+        '''
+        pai = self.__pai
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    def __une(self, a, b):
+        '''
+        Une as componentes dos vértices de índices a e b, pendurando a menor componente na maior.
+        :param a: O índice de um dos vértices
+        :param b: O índice do outro vértice
+        '''
+        a = self.__raiz(a)
+        b = self.__raiz(b)
+        if a == b:
+            return
+        if self.__tamanho[a] < self.__tamanho[b]:
+            a, b = b, a
+        self.__pai[b] = a
+        self.__tamanho[a] += self.__tamanho[b]
+        self.__quantidade_componentes -= 1
+
+    def __atualiza_componentes(self):
+        '''
+        Refaz a floresta de componentes a partir das arestas do grafo, se alguma aresta foi substituída desde a última vez.
+        '''
+        if not self.__componentes_desatualizadas:
+            return
+        self.__pai = list(range(len(self.N)))
+        self.__tamanho = [1] * len(self.N)
+        self.__quantidade_componentes = len(self.indices)
+        for a in self.A.values():
+            i_traco = a.index(Grafo.SEPARADOR_ARESTA)
+            self.__une(self.indices[a[:i_traco]], self.indices[a[i_traco+1:]])
+        self.__componentes_desatualizadas = False
+
 
 # ======================================================================================================================
 #                                                       ROTEIRO 1
@@ -165,11 +269,7 @@ class Grafo:
         Resposta da D da Segunda questão pro primeiro roteiro " Qual o grau de um vértice arbitrário?"
         '''
 
-        cont = 0
-        for i in self.A.values():
-            if x in i:
-                cont += 1
-        return cont
+        return len(self.incidencia.get(x, {}))
 
     def arestas_sobre_vertice(self, x):
 
@@ -177,11 +277,7 @@ class Grafo:
         Resposta da E da Segunda questão pro primeiro roteiro " Quais arestas incidem sobre um vértice N arbitrário?"
         '''
 
-        arestas = []
-        for i in self.A.keys():
-            if x in self.A[i]:
-                arestas.append(i)
-        return arestas
+        return list(self.incidencia.get(x, {}))
 
     def eh_completo(self):
 
@@ -218,12 +314,8 @@ class Grafo:
         """
 
         aux = {}
-        for i in self.A.keys():
-            if vetor in self.A[i]:
-                if vetor == self.A[i][-1]:
-                    aux[i] = self.A[i][::-1]
-                else:
-                    aux[i] = self.A[i]
+        for i, vizinho in self.incidencia.get(vetor, {}).items():
+            aux[i] = vetor + Grafo.SEPARADOR_ARESTA + vizinho
         return aux
 
 
@@ -232,20 +324,51 @@ class Grafo:
 #=======================================================================================================================
 
 
-    def controle(self, d, lista):
+    def iter_dfs(self, vertice):
 
         """
-        Função auxiliar para a função *DFS*.
-        :param d: Vertice sendo atualmente processado;
-        :param lista: Lista resultante para o DFS;
+        Gera os vértices da busca em profundidade à medida que são descobertos.
+        A busca é feita com uma pilha explícita, então não depende do limite de recursão do Python.
+        :param vertice: Vertice que o usuario deseja iniciar o caminho;
+        :return: Gerador de tuplas (vertice, aresta), onde aresta é o nome da aresta usada para chegar
+        ao vértice, ou None para o vértice inicial.
         """
 
-        aux = self.seleciona_arestas(d)
-        for aresta in aux.keys():
-            if aux[aresta][-1] not in lista:
-                lista.append(aresta)
-                lista.append(aux[aresta][-1])
-                self.controle(aux[aresta][-1], lista)
+        visitados = {vertice}
+        yield vertice, None
+
+        # Cada elemento da pilha percorre as arestas de um vértice do caminho atual
+        pilha = [iter(self.incidencia.get(vertice, {}).items())]
+        while pilha:
+            for aresta, vizinho in pilha[-1]:
+                if vizinho not in visitados:
+                    visitados.add(vizinho)
+                    yield vizinho, aresta
+                    pilha.append(iter(self.incidencia[vizinho].items()))
+                    break
+            else:
+                pilha.pop()
+
+    def iter_bfs(self, vertice):
+
+        """
+        Gera os vértices da busca em largura à medida que são descobertos.
+        :param vertice: Vertice que o usuario deseja iniciar o caminho;
+        :return: Gerador de tuplas (vertice, aresta), onde aresta é o nome da aresta usada para chegar
+        ao vértice, ou None para o vértice inicial.
+        """
+
+        visitados = {vertice}
+        yield vertice, None
+
+        fila = deque([vertice])
+        while fila:
+            atual = fila.popleft()
+            for aresta, vizinho in self.incidencia.get(atual, {}).items():
+                if vizinho not in visitados:
+                    visitados.add(vizinho)
+                    yield vizinho, aresta
+                    fila.append(vizinho)
 
     def DFS(self, vertice):
 
@@ -255,9 +378,11 @@ class Grafo:
         :return: Lista contendo o DFS
         """
 
-
-        lista = [vertice]
-        self.controle(vertice, lista)
+        lista = []
+        for v, aresta in self.iter_dfs(vertice):
+            if aresta is not None:
+                lista.append(aresta)
+            lista.append(v)
 
         return lista
 
@@ -267,53 +392,58 @@ class Grafo:
 # =======================================================================================================================
 
 
-    def ha_ciclo(self):
+    def ha_ciclo(self, base=False):
 
         """
-        Função para achar ciclos no grafo.
-        :return: O ciclo em forma de lista, ou False caso não haja ciclos.
+        Função para achar ciclos no grafo, com uma única busca em profundidade iterativa, em tempo O(V + E).
+        Laços e arestas paralelas também formam ciclos.
+        :param base: Se verdadeiro, retorna todos os ciclos fundamentais da floresta da busca, que formam uma base
+        dos ciclos do grafo, em vez de só o primeiro ciclo encontrado.
+        :return: O ciclo em forma de lista, alternando vértices e arestas e terminando no vértice em que começa,
+        ou False caso não haja ciclos. Com base verdadeiro, uma lista com os ciclos da base, vazia se não houver ciclos.
         """
 
-        for i in self.N:
-            INICIO = 0 #indice do primeiro vertice a ser processado
-
-            cicla = [i]
-            arestasverificadas = []
-            lista = self.verifica_ciclo(i, cicla, arestasverificadas)
+        ciclos = []
+        visitados = set()
+
+        for raiz in self.N:
+            if raiz in visitados:
+                continue
+            visitados.add(raiz)
+
+            # O caminho atual da busca: cada elemento guarda o vértice, a aresta usada para chegar a ele e as arestas
+            # que ainda faltam percorrer. posicao guarda o índice de cada vértice do caminho
+            caminho = [(raiz, None, iter(self.incidencia[raiz].items()))]
+            posicao = {raiz: 0}
+            while caminho:
+                atual, chegada, arestas = caminho[-1]
+                for aresta, vizinho in arestas:
+                    if aresta == chegada:
+                        continue
+                    if vizinho in posicao:
+                        # Aresta de volta para um vértice do caminho (ou laço): o ciclo é o trecho do caminho a partir dele
+                        ciclo = [vizinho]
+                        for k in range(posicao[vizinho] + 1, len(caminho)):
+                            ciclo.append(caminho[k][1])
+                            ciclo.append(caminho[k][0])
+                        ciclo.append(aresta)
+                        ciclo.append(vizinho)
+                        if not base:
+                            return ciclo
+                        ciclos.append(ciclo)
+                    elif vizinho not in visitados:
+                        visitados.add(vizinho)
+                        posicao[vizinho] = len(caminho)
+                        caminho.append((vizinho, aresta, iter(self.incidencia[vizinho].items())))
+                        break
+                else:
+                    caminho.pop()
+                    del posicao[atual]
 
-            if lista != False:
-                return lista
+        if base:
+            return ciclos
         return False
 
-    def verifica_ciclo(self, atual, ciclo, arestasVerificadas):
-
-        """
-        Função auxiliar da função *ha_ciclo*, com intuito de gerar recursivamente a lista de ciclo. Caso a mesma exista;
-        :param atual: Vertice sendo verificado;
-        :param ciclo: Lista para alocar o ciclo;
-        :param arestasVerificadas: Lista de arestas já verificadas;
-        :return: Retorna uma lista contendo o caminho do ciclo, ou False caso o mesmo nao exista;
-        """
-
-        aux = self.seleciona_arestas(atual)
-        for i in aux.keys():
-            if i not in arestasVerificadas:
-                if aux[i][-1] in ciclo:
-                    ciclo = ciclo[ciclo.index(aux[i][-1]):]
-                    ciclo.append(i)
-                    ciclo.append(aux[i][-1])
-                    return ciclo
-                else:
-                    arestasVerificadas.append(i)
-                    ciclo.append(i)
-                    ciclo.append(aux[i][-1])
-                    return self.verifica_ciclo(aux[i][-1], ciclo, arestasVerificadas)
-        ciclo = ciclo[0:-2]
-        if len(ciclo) == 1:
-            return False
-        else:
-            return self.verifica_ciclo(aux[i][-1], ciclo, arestasVerificadas)
-
     def recursivaCaminho(self, d, lista, arestasverificadas, cont, n):
         """
         Função auxiliar da Função *caminho*, para processar recursivamente o vertice passado.
@@ -364,14 +494,44 @@ class Grafo:
     def conexo(self):
         """
         Função para verificar se o grafo é conexo.
-        :return:
+        Consulta a quantidade de componentes mantida a cada aresta adicionada, sem percorrer o grafo.
+        :return: Um valor booleano que indica se o grafo é conexo.
         """
-        aux = self.DFS(self.N[0])
-        cond = True
-        for i in self.N:
-            if i not in aux:
-                cond = False
-        return cond
+        self.__atualiza_componentes()
+        return self.__quantidade_componentes <= 1
+
+    def componentes(self):
+        """
+        Rotula cada vértice com o número da sua componente conexa. As componentes são numeradas na ordem em que
+        aparece o primeiro vértice de cada uma na lista de vértices.
+        :return: Uma tupla (rotulos, tamanhos), onde rotulos é um dicionário que associa cada vértice ao número da sua
+        componente e tamanhos[c] é a quantidade de vértices da componente c.
+        """
+        self.__atualiza_componentes()
+        rotulos = {}
+        tamanhos = []
+        numeros = {}
+        for v in self.N:
+            raiz = self.__raiz(self.indices[v])
+            if raiz not in numeros:
+                numeros[raiz] = len(tamanhos)
+                tamanhos.append(self.__tamanho[raiz])
+            rotulos[v] = numeros[raiz]
+        return rotulos, tamanhos
+
+    def mesma_componente(self, u, v):
+        """
+        Verifica se existe um caminho entre dois vértices.
+        :param u: Um vértice
+        :param v: Outro vértice
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        """
+        for x in (u, v):
+            if not self.existeVertice(x):
+                raise VerticeInvalidoException('O vértice ' + str(x) + ' é inválido')
+        self.__atualiza_componentes()
+        return self.__raiz(self.indices[u]) == self.__raiz(self.indices[v])
 
     def to_string(self):
         print("Ciclo:")
@@ -1,3 +1,10 @@
+from conectividade_dinamica import ConectividadeDinamica
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -13,12 +20,15 @@ class Grafo:
     SEPARADOR_ARESTA = '-'
     __maior_vertice = 0
 
-    def __init__(self, V=None, A=None):
+    def __init__(self, V=None, A=None, armazenamento='lista', dtype='uint16', simetrica=False):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param V: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices
+        :param armazenamento: 'lista' guarda a matriz como uma lista de listas; 'numpy' guarda a matriz em um array contíguo do NumPy.
+        :param dtype: O tipo inteiro dos elementos do array (ex.: 'uint8', 'uint16', 'int32'). Só é usado com o armazenamento 'numpy'.
+        :param simetrica: Se True, o array guarda cada aresta dos dois lados da diagonal principal. Só é usado com o armazenamento 'numpy'.
         '''
 
         if V == None:
@@ -26,29 +36,17 @@ class Grafo:
         if A == None:
             A = dict()
 
-        for v in V:
-            if not(Grafo.verticeValido(v)):
-                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
-            if len(v) > self.__maior_vertice:
-                self.__maior_vertice = len(v)
-
-        self.N = list(V)
-        self.quantVertices = len(self.N)
-        M = []
-
-        for k in range(len(V)):
-            M.append(list())
-            for l in range(len(V)):
-                if k > l:
-                    M[k].append('-')
-                else:
-                    M[k].append(0)
+        self.__inicializa(V, True, armazenamento, dtype, simetrica)
+        M = self.M
 
         for i in A.values():
-            if V.index(i[0]) <= V.index(i[-1]):
-                M[V.index(i[0])][V.index(i[-1])] += 1
-            else:
-                M[V.index(i[-1])][V.index(i[0])] += 1
+            if not(self.arestaValida(i)):
+                raise ArestaInvalidaException('A aresta ' + i + ' é inválida')
+            self.__soma_aresta(self.__indice_primeiro_vertice_aresta(i), self.__indice_segundo_vertice_aresta(i), 1)
+
+        # O array do NumPy é construído já no formato correto, então só a matriz de listas precisa ser verificada
+        if self.armazenamento == 'numpy':
+            return
 
         if len(M) != len(V):
             raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
@@ -73,6 +71,155 @@ class Grafo:
 
         self.M = M
 
+    @classmethod
+    def from_edges(cls, V, arestas, validate='fast', armazenamento='lista', dtype='uint16', simetrica=False):
+        '''
+        Constrói um Grafo a partir de uma lista de vértices e de uma coleção de arestas, preenchendo a matriz em uma única passada.
+        Diferente do construtor, não verifica todos os pares de vértices: cada vértice e cada aresta são validados uma única vez.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param arestas: As arestas no formato X-Y. Pode ser uma lista de strings ou um dicionário no mesmo formato do construtor.
+        :param validate: 'fast' valida cada vértice e cada aresta uma única vez; 'none' confia nos dados e não valida nada.
+        :param armazenamento: 'lista' ou 'numpy', como no construtor.
+        :param dtype: O tipo inteiro dos elementos do array, como no construtor.
+        :param simetrica: Se o array guarda as arestas dos dois lados da diagonal principal, como no construtor.
+        :return: O Grafo construído.
+        :raises: VerticeInvalidoException se algum vértice for inválido ou repetido, ArestaInvalidaException se alguma aresta for inválida.
+        '''
+        if validate not in ('fast', 'none'):
+            raise ValueError("O parâmetro validate deve ser 'fast' ou 'none'")
+        valida = validate == 'fast'
+
+        if isinstance(arestas, dict):
+            arestas = arestas.values()
+
+        grafo = cls.__new__(cls)
+        grafo.__inicializa(V, valida, armazenamento, dtype, simetrica)
+
+        if valida and len(grafo.indices) != len(grafo.N):
+            for v in grafo.N:
+                if grafo.N.count(v) > 1:
+                    raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+
+        linhas = []
+        colunas = []
+        for a in arestas:
+            if valida and not(grafo.arestaValida(a)):
+                raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+            i_a1 = grafo.__indice_primeiro_vertice_aresta(a)
+            i_a2 = grafo.__indice_segundo_vertice_aresta(a)
+            if i_a1 > i_a2:
+                i_a1, i_a2 = i_a2, i_a1
+            if grafo.armazenamento == 'numpy':
+                linhas.append(i_a1)
+                colunas.append(i_a2)
+            else:
+                grafo.M[i_a1][i_a2] += 1
+
+        if grafo.armazenamento == 'numpy' and linhas:
+            # Conta as arestas de cada par de vértices, inclusive as paralelas, antes de escrever no array,
+            # para que o tipo do array seja alargado se alguma contagem não couber nele
+            pares, quantidades = np.unique(np.array(linhas, dtype=np.int64) * len(grafo.N) + np.array(colunas),
+                                           return_counts=True)
+            grafo.__garante_capacidade(int(quantidades.max()))
+            linhas = pares // len(grafo.N)
+            colunas = pares % len(grafo.N)
+            grafo.M[linhas, colunas] += quantidades.astype(grafo.M.dtype)
+            if grafo.simetrica:
+                fora_diagonal = linhas != colunas
+                grafo.M[colunas[fora_diagonal], linhas[fora_diagonal]] += quantidades[fora_diagonal].astype(grafo.M.dtype)
+
+        return grafo
+
+    def __inicializa(self, V, valida=True, armazenamento='lista', dtype='uint16', simetrica=False):
+        '''
+        Inicializa a lista de vértices, o índice dos vértices e uma matriz de adjacência sem nenhuma aresta.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param valida: Indica se cada vértice deve ser verificado antes de ser incluído.
+        :param armazenamento: 'lista' ou 'numpy'.
+        :param dtype: O tipo inteiro dos elementos do array do NumPy.
+        :param simetrica: Se o array do NumPy guarda as arestas dos dois lados da diagonal principal.
+        :raises: VerticeInvalidoException se algum vértice não estiver no formato válido.
+        '''
+        if armazenamento not in ('lista', 'numpy'):
+            raise ValueError("O armazenamento deve ser 'lista' ou 'numpy'")
+        if armazenamento == 'numpy' and np is None:
+            raise ImportError("O armazenamento 'numpy' precisa do pacote numpy instalado")
+
+        self.armazenamento = armazenamento
+        self.simetrica = simetrica and armazenamento == 'numpy'
+
+        for v in V:
+            if valida and not(Grafo.verticeValido(v)):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            if len(v) > self.__maior_vertice:
+                self.__maior_vertice = len(v)
+
+        self.N = list(V)
+        self.quantVertices = len(self.N)
+
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(self.N)):
+            if self.N[i] not in self.indices:
+                self.indices[self.N[i]] = i
+
+        # Montada só na primeira consulta de conectividade e, a partir daí, atualizada a cada aresta
+        self.__conectividade = None
+
+        if armazenamento == 'numpy':
+            self.M = np.zeros((len(self.N), len(self.N)), dtype=dtype)
+            return
+
+        # Os elementos abaixo da diagonal principal são preenchidos com um traço
+        M = []
+        for k in range(len(self.N)):
+            M.append(['-'] * k + [0] * (len(self.N) - k))
+        self.M = M
+
+    def __soma_aresta(self, i_a1, i_a2, quantidade):
+        '''
+        Soma uma quantidade ao número de arestas que ligam os vértices de índices i_a1 e i_a2.
+        :param i_a1: O índice de um dos vértices da aresta
+        :param i_a2: O índice do outro vértice da aresta
+        :param quantidade: O valor a ser somado (negativo para remover arestas)
+        :raises: ArestaInvalidaException se a quantidade de arestas entre os vértices não couber em nenhum tipo inteiro do NumPy
+        '''
+        i, j = (i_a1, i_a2) if i_a1 <= i_a2 else (i_a2, i_a1)
+        if quantidade >= 0:
+            if self.armazenamento == 'numpy':
+                self.__garante_capacidade(int(self.M[i][j]) + quantidade)
+            self.M[i][j] += quantidade
+            if self.simetrica and i != j:
+                self.M[j][i] += quantidade
+        else:
+            # Os tipos sem sinal do NumPy não aceitam a soma de um número negativo
+            self.M[i][j] -= -quantidade
+            if self.simetrica and i != j:
+                self.M[j][i] -= -quantidade
+
+        # Só depois que a matriz aceitou a alteração, para que as duas estruturas não discordem
+        if self.__conectividade is not None:
+            for k in range(quantidade):
+                self.__conectividade.adiciona_aresta(i_a1, i_a2)
+            for k in range(-quantidade):
+                self.__conectividade.remove_aresta(i_a1, i_a2)
+
+    def __garante_capacidade(self, maior):
+        '''
+        Troca o array do NumPy por um de tipo inteiro mais largo, com ou sem sinal como o atual, se o valor maior não
+        couber no tipo atual. Assim uma quantidade grande de arestas paralelas nunca dá a volta no limite do tipo.
+        :param maior: O maior valor que o array precisa guardar
+        :raises: ArestaInvalidaException se o valor não couber em nenhum tipo inteiro do NumPy
+        '''
+        if maior <= np.iinfo(self.M.dtype).max:
+            return
+        tipos = (np.uint16, np.uint32, np.uint64) if self.M.dtype.kind == 'u' else (np.int16, np.int32, np.int64)
+        for tipo in tipos:
+            if maior <= np.iinfo(tipo).max:
+                self.M = self.M.astype(tipo)
+                return
+        raise ArestaInvalidaException('A quantidade de arestas entre dois vértices passa do limite de {}'.format(np.iinfo(tipos[-1]).max))
+
     def arestaValida(self, aresta=''):
         '''
         Verifica se uma aresta passada como parâmetro está dentro do padrão estabelecido.
@@ -117,7 +264,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -141,7 +288,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -149,7 +296,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
@@ -159,10 +306,13 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, a):
-            for i in range(len(self.M)):
-                for j in range(len(self.M)):
-                    if self.M[self.__indice_primeiro_vertice_aresta(a)][self.__indice_segundo_vertice_aresta(a)]:
-                        existe = True
+            i_a1 = self.__indice_primeiro_vertice_aresta(a)
+            i_a2 = self.__indice_segundo_vertice_aresta(a)
+            # Só a parte de cima da diagonal principal guarda as arestas
+            if i_a1 > i_a2:
+                i_a1, i_a2 = i_a2, i_a1
+            if self.M[i_a1][i_a2]:
+                existe = True
         return existe
 
     def adicionaVertice(self, v):
@@ -171,22 +321,36 @@ class Grafo:
         :param v: O vértice a ser incluído no grafo.
         :raises VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido.
         '''
-        if v in self.N:
+        if v in self.indices:
             raise VerticeInvalidoException('O vértice {} já existe'.format(v))
 
         if self.verticeValido(v):
             if len(v) > self.__maior_vertice:
                 self.__maior_vertice = len(v)
 
+            self.indices[v] = len(self.N)
             self.N.append(v) # Adiciona vértice na lista de vértices
+            if self.__conectividade is not None:
+                self.__conectividade.adiciona_vertice()
+
+            if self.armazenamento == 'numpy':
+                # O array tem tamanho fixo, então é preciso copiá-lo para um array maior
+                M = np.zeros((len(self.N), len(self.N)), dtype=self.M.dtype)
+                M[:-1, :-1] = self.M
+                self.M = M
+                self.quantVertices = len(self.N)
+                return
+
             self.M.append([]) # Adiciona a linha
 
             for k in range(len(self.N)):
                 if k != len(self.N) -1:
                     self.M[k].append(0) # adiciona os elementos da coluna do vértice
-                    self.M[self.N.index(v)].append('-') # adiciona os elementos da linha do vértice
+                    self.M[self.indices[v]].append('-') # adiciona os elementos da linha do vértice
                 else:
-                    self.M[self.N.index(v)].append(0)  # adiciona um zero no último elemento da linha
+                    self.M[self.indices[v]].append(0)  # adiciona um zero no último elemento da linha
+
+            self.quantVertices = len(self.N)
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -197,12 +361,7 @@ class Grafo:
         :raise: lança uma exceção caso a aresta não estiver em um formato válido
         '''
         if self.arestaValida(a):
-            i_a1 = self.__indice_primeiro_vertice_aresta(a)
-            i_a2 = self.__indice_segundo_vertice_aresta(a)
-            if i_a1 < i_a2:
-                self.M[i_a1][i_a2] += 1
-            else:
-                self.M[i_a2][i_a1] += 1
+            self.__soma_aresta(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a), 1)
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -214,12 +373,7 @@ class Grafo:
         '''
         if self.arestaValida(a):
             if self.existeAresta(a):
-                i_a1 = self.__indice_primeiro_vertice_aresta(a)
-                i_a2 = self.__indice_segundo_vertice_aresta(a)
-                if i_a1 < i_a2:
-                    self.M[i_a1][i_a2] -= 1
-                else:
-                    self.M[i_a2][i_a1] -= 1
+                self.__soma_aresta(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a), -1)
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -245,7 +399,10 @@ class Grafo:
         for l in range(len(self.M)):
             grafo_str += self.N[l] + ' '
             for c in range(len(self.M)):
-                grafo_str += str(self.M[l][c]) + ' '
+                if self.armazenamento == 'numpy' and l > c:
+                    grafo_str += '-' + ' '
+                else:
+                    grafo_str += str(self.M[l][c]) + ' '
             grafo_str += '\n'
 
         return grafo_str
@@ -255,6 +412,9 @@ class Grafo:
 # =======================================================================================================================
 
     def vertices_nao_adjacentes(self):
+        if self.armazenamento == 'numpy':
+            return self.__vertices_nao_adjacentes_numpy()
+
         lista = []
         for i in range(self.quantVertices):
             for p in range(i, self.quantVertices):
@@ -263,13 +423,21 @@ class Grafo:
         return lista
 
     def ha_laco(self):
+        if self.armazenamento == 'numpy':
+            return bool(np.diagonal(self.M).any())
+
         for i in range(self.quantVertices):
             if self.M[i][i] >= 1:
                 return True
         return False
 
     def grau(self, d):
-        aux = self.N.index(d)
+        aux = self.indices[d]
+        if self.armazenamento == 'numpy':
+            if self.simetrica:
+                return int(self.M[aux].sum())
+            return int(self.M[aux, aux:].sum() + self.M[:aux, aux].sum())
+
         soma = 0
         for i in range(self.quantVertices):
             if i > aux:
@@ -279,6 +447,9 @@ class Grafo:
         return soma
 
     def ha_paralelas(self):
+        if self.armazenamento == 'numpy':
+            return self.M.size > 0 and bool(self.M.max() >= 2)
+
         for i in range(self.quantVertices):
             for p in range(i, self.quantVertices):
                 if self.M[i][p] >= 2:
@@ -287,7 +458,19 @@ class Grafo:
 
     def arestas_sobre_vertice(self, d):
         lista = []
-        aux = self.N.index(d)
+        aux = self.indices[d]
+        if self.armazenamento == 'numpy':
+            if self.simetrica:
+                vizinhos = np.flatnonzero(self.M[aux])
+            else:
+                vizinhos = np.concatenate((np.flatnonzero(self.M[:aux + 1, aux]), np.flatnonzero(self.M[aux, aux + 1:]) + aux + 1))
+            for i in vizinhos.tolist():
+                if i <= aux:
+                    lista.append("%s-%s" % (self.N[i], self.N[aux]))
+                else:
+                    lista.append("%s-%s" % (self.N[aux], self.N[i]))
+            return lista
+
         for i in range(self.quantVertices):
             if i > aux:
                 if self.M[aux][i] >= 1:
@@ -298,12 +481,75 @@ class Grafo:
         return lista
 
     def eh_completo(self):
+        if self.armazenamento == 'numpy':
+            # Conta os pares de vértices distintos que são adjacentes sem criar nenhum array temporário do tamanho da matriz
+            adjacentes = np.count_nonzero(self.M) - np.count_nonzero(np.diagonal(self.M))
+            pares = self.quantVertices * (self.quantVertices - 1) // 2
+            if self.simetrica:
+                pares *= 2
+            return adjacentes == pares
+
         for i in range(self.quantVertices):
             for p in range(i+1, self.quantVertices):
                 if self.M[i][p] == 0:
                     return False
         return True
 
+    def __conectividade_dinamica(self):
+        '''
+        Retorna a ConectividadeDinamica do grafo, montando-a a partir da matriz na primeira vez.
+        :return: Um objeto do tipo ConectividadeDinamica
+        '''
+        if self.__conectividade is None:
+            if self.armazenamento == 'numpy':
+                # Sem simetrica a parte de baixo já é zero; com ela, cada aresta aparece uma vez em cada lado
+                linhas, colunas = np.nonzero(self.M)
+                acima = linhas <= colunas
+                pares = zip(linhas[acima].tolist(), colunas[acima].tolist())
+            else:
+                pares = [(i, j) for i in range(len(self.N)) for j in range(i, len(self.N)) if self.M[i][j]]
+
+            conectividade = ConectividadeDinamica(len(self.N))
+            for i, j in pares:
+                for k in range(int(self.M[i][j])):
+                    conectividade.adiciona_aresta(i, j)
+            self.__conectividade = conectividade
+        return self.__conectividade
+
+    def mesma_componente(self, u, v):
+        '''
+        Verifica se existe um caminho entre dois vértices. A estrutura usada acompanha as arestas adicionadas e removidas,
+        então a consulta não percorre o grafo.
+        :param u: Um vértice
+        :param v: Outro vértice
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        for x in (u, v):
+            if x not in self.indices:
+                raise VerticeInvalidoException('O vértice ' + str(x) + ' é inválido')
+        return self.__conectividade_dinamica().conectados(self.indices[u], self.indices[v])
+
+    def conexo(self):
+        '''
+        Verifica se o grafo é conexo, consultando a quantidade de componentes mantida a cada aresta adicionada ou removida.
+        :return: Um valor booleano que indica se o grafo é conexo.
+        '''
+        # Os índices de vértices repetidos em N não têm arestas e não contam como componentes
+        quantidade = self.__conectividade_dinamica().quantidade_componentes - (len(self.N) - len(self.indices))
+        return quantidade <= 1
+
+    def __vertices_nao_adjacentes_numpy(self):
+        '''
+        Versão de *vertices_nao_adjacentes* para o armazenamento 'numpy', que procura os zeros de cada linha da parte de cima da matriz de uma só vez.
+        :return: A mesma lista de pares de vértices não adjacentes.
+        '''
+        lista = []
+        for i in range(self.quantVertices):
+            for p in (np.flatnonzero(self.M[i, i:] == 0) + i).tolist():
+                lista.append("%s-%s" % (self.N[i], self.N[p]))
+        return lista
+
 
 g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
                  {'a1':'J-C', 'a2':'C-E', 'a3':'C-E', 'a4':'C-P', 'a5':'C-P', 'a6':'C-M', 'a8':'M-T', 'a9':'T-Z'})
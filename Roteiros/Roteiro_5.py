@@ -1,3 +1,7 @@
+from collections import deque
+
+from conectividade_dinamica import ConectividadeDinamica
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -13,12 +17,13 @@ class Grafo:
     SEPARADOR_ARESTA = '-'
     __maior_vertice = 0
 
-    def __init__(self, V=None, A=None):
+    def __init__(self, V=None, A=None, armazenamento='lista'):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param V: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices
+        :param armazenamento: 'lista' guarda uma matriz de adjacência V x V; 'esparsa' guarda, para cada vértice, só os vizinhos e a quantidade de arestas até cada um deles.
         '''
 
         if V == None:
@@ -26,28 +31,20 @@ class Grafo:
         if A == None:
             A = dict()
 
-        for v in V:
-            if not(Grafo.verticeValido(v)):
-                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
-            if len(v) > self.__maior_vertice:
-                self.__maior_vertice = len(v)
+        self.__inicializa(V, True, armazenamento)
+        self.len = len(self.N)
+        self.quantVertices = len(self.N)
 
-        self.N = list(V)
-        M = []
+        for i in A.values():
+            if not(self.arestaValida(i)):
+                raise ArestaInvalidaException('A aresta ' + i + ' é inválida')
+            self.__soma_aresta(self.__indice_primeiro_vertice_aresta(i), self.__indice_segundo_vertice_aresta(i), 1)
 
-        for k in range(len(V)):
-            M.append(list())
-            for l in range(len(V)):
-                if k > l:
-                    M[k].append('-')
-                else:
-                    M[k].append(0)
+        # A lista de adjacência é construída já no formato correto, então só a matriz precisa ser verificada
+        if self.armazenamento == 'esparsa':
+            return
 
-        for i in A.values():
-            if V.index(i[0]) <= V.index(i[-1]):
-                M[V.index(i[0])][V.index(i[-1])] += 1
-            else:
-                M[V.index(i[-1])][V.index(i[0])] += 1
+        M = self.M
 
         if len(M) != len(V):
             raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
@@ -71,9 +68,159 @@ class Grafo:
                     raise ArestaInvalidaException('A aresta ' + aresta + ' é inválida')
 
         self.M = M
-        self.len = len(self.N)
-        self.quantVertices = len(self.N)
-        self.perc = self.copy(self.M)
+
+    @classmethod
+    def from_edges(cls, V, arestas, validate='fast', armazenamento='lista'):
+        '''
+        Constrói um Grafo a partir de uma lista de vértices e de uma coleção de arestas, preenchendo a matriz em uma única passada.
+        Diferente do construtor, não verifica todos os pares de vértices: cada vértice e cada aresta são validados uma única vez.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param arestas: As arestas no formato X-Y. Pode ser uma lista de strings ou um dicionário no mesmo formato do construtor.
+        :param validate: 'fast' valida cada vértice e cada aresta uma única vez; 'none' confia nos dados e não valida nada.
+        :param armazenamento: 'lista' ou 'esparsa', como no construtor.
+        :return: O Grafo construído.
+        :raises: VerticeInvalidoException se algum vértice for inválido ou repetido, ArestaInvalidaException se alguma aresta for inválida.
+        '''
+        if validate not in ('fast', 'none'):
+            raise ValueError("O parâmetro validate deve ser 'fast' ou 'none'")
+        valida = validate == 'fast'
+
+        if isinstance(arestas, dict):
+            arestas = arestas.values()
+
+        grafo = cls.__new__(cls)
+        grafo.__inicializa(V, valida, armazenamento)
+        grafo.len = len(grafo.N)
+        grafo.quantVertices = len(grafo.N)
+
+        if valida and len(grafo.indices) != len(grafo.N):
+            for v in grafo.N:
+                if grafo.N.count(v) > 1:
+                    raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+
+        for a in arestas:
+            if valida and not(grafo.arestaValida(a)):
+                raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+            grafo.__soma_aresta(grafo.__indice_primeiro_vertice_aresta(a), grafo.__indice_segundo_vertice_aresta(a), 1)
+
+        return grafo
+
+    def __inicializa(self, V, valida=True, armazenamento='lista'):
+        '''
+        Inicializa a lista de vértices, o índice dos vértices e uma matriz (ou lista) de adjacência sem nenhuma aresta.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param valida: Indica se cada vértice deve ser verificado antes de ser incluído.
+        :param armazenamento: 'lista' ou 'esparsa'.
+        :raises: VerticeInvalidoException se algum vértice não estiver no formato válido.
+        '''
+        if armazenamento not in ('lista', 'esparsa'):
+            raise ValueError("O armazenamento deve ser 'lista' ou 'esparsa'")
+        self.armazenamento = armazenamento
+
+        for v in V:
+            if valida and not(Grafo.verticeValido(v)):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            if len(v) > self.__maior_vertice:
+                self.__maior_vertice = len(v)
+
+        self.N = list(V)
+
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(self.N)):
+            if self.N[i] not in self.indices:
+                self.indices[self.N[i]] = i
+
+        # Montada só na primeira consulta de conectividade e, a partir daí, atualizada a cada aresta
+        self.__conectividade = None
+
+        if armazenamento == 'esparsa':
+            # Para cada vértice, um dicionário que associa o índice de cada vizinho à quantidade de arestas que os ligam
+            self.M = None
+            self.adjacencia = []
+            for k in range(len(self.N)):
+                self.adjacencia.append({})
+            return
+
+        # Os elementos abaixo da diagonal principal são preenchidos com um traço
+        M = []
+        for k in range(len(self.N)):
+            M.append(['-'] * k + [0] * (len(self.N) - k))
+        self.M = M
+
+    def __soma_aresta(self, i_a1, i_a2, quantidade):
+        '''
+        Soma uma quantidade ao número de arestas que ligam os vértices de índices i_a1 e i_a2.
+        :param i_a1: O índice de um dos vértices da aresta
+        :param i_a2: O índice do outro vértice da aresta
+        :param quantidade: O valor a ser somado (negativo para remover arestas)
+        '''
+        if self.__conectividade is not None:
+            for k in range(quantidade):
+                self.__conectividade.adiciona_aresta(i_a1, i_a2)
+            for k in range(-quantidade):
+                self.__conectividade.remove_aresta(i_a1, i_a2)
+
+        if self.armazenamento == 'esparsa':
+            total = self.adjacencia[i_a1].get(i_a2, 0) + quantidade
+            if total > 0:
+                self.adjacencia[i_a1][i_a2] = total
+                self.adjacencia[i_a2][i_a1] = total
+            else:
+                self.adjacencia[i_a1].pop(i_a2, None)
+                self.adjacencia[i_a2].pop(i_a1, None)
+            return
+
+        if i_a1 > i_a2:
+            i_a1, i_a2 = i_a2, i_a1
+        self.M[i_a1][i_a2] += quantidade
+
+    def __multiplicidade(self, i_a1, i_a2):
+        '''
+        Retorna a quantidade de arestas que ligam os vértices de índices i_a1 e i_a2.
+        :param i_a1: O índice de um dos vértices
+        :param i_a2: O índice do outro vértice
+        :return: O número de arestas entre os dois vértices
+        '''
+        if self.armazenamento == 'esparsa':
+            return self.adjacencia[i_a1].get(i_a2, 0)
+
+        if i_a1 > i_a2:
+            i_a1, i_a2 = i_a2, i_a1
+        return self.M[i_a1][i_a2]
+
+    def __conectividade_dinamica(self):
+        '''
+        Retorna a ConectividadeDinamica do grafo, montando-a a partir das arestas na primeira vez. A partir daí ela
+        acompanha cada aresta adicionada ou removida, sem que o grafo precise ser percorrido de novo.
+        :return: Um objeto do tipo ConectividadeDinamica
+        '''
+        if self.__conectividade is None:
+            conectividade = ConectividadeDinamica(self.len)
+            for i in range(self.len):
+                for j, quantidade in self.__vizinhos(i):
+                    if j >= i:
+                        for k in range(quantidade):
+                            conectividade.adiciona_aresta(i, j)
+            self.__conectividade = conectividade
+        return self.__conectividade
+
+    def __vizinhos(self, i):
+        '''
+        Retorna os vizinhos do vértice de índice i em ordem crescente de índice.
+        No armazenamento 'esparsa' só os vizinhos são percorridos; na matriz é preciso percorrer a linha e a coluna do vértice.
+        :param i: O índice do vértice
+        :return: Uma lista de tuplas (índice do vizinho, quantidade de arestas até ele)
+        '''
+        if self.armazenamento == 'esparsa':
+            return sorted(self.adjacencia[i].items())
+
+        lista = []
+        for j in range(self.len):
+            quantidade = self.M[j][i] if j <= i else self.M[i][j]
+            if quantidade > 0:
+                lista.append((j, quantidade))
+        return lista
 
     def arestaValida(self, aresta=''):
         '''
@@ -119,7 +266,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -143,7 +290,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -151,7 +298,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
@@ -161,11 +308,10 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, a):
-            for i in range(len(self.M)):
-                for j in range(len(self.M)):
-                    if self.M[self.__indice_primeiro_vertice_aresta(a)][self.__indice_segundo_vertice_aresta(a)]:
-                        existe = True
-
+            i_a1 = self.__indice_primeiro_vertice_aresta(a)
+            i_a2 = self.__indice_segundo_vertice_aresta(a)
+            if self.__multiplicidade(i_a1, i_a2):
+                existe = True
         return existe
 
     def adicionaVertice(self, v):
@@ -174,22 +320,32 @@ class Grafo:
         :param v: O vértice a ser incluído no grafo.
         :raises VerticeInvalidoException se o vértice já existe ou se ele não estiver no formato válido.
         '''
-        if v in self.N:
+        if v in self.indices:
             raise VerticeInvalidoException('O vértice {} já existe'.format(v))
 
         if self.verticeValido(v):
             if len(v) > self.__maior_vertice:
                 self.__maior_vertice = len(v)
 
+            self.indices[v] = len(self.N)
             self.N.append(v) # Adiciona vértice na lista de vértices
-            self.M.append([]) # Adiciona a linha
+            if self.__conectividade is not None:
+                self.__conectividade.adiciona_vertice()
 
-            for k in range(len(self.N)):
-                if k != len(self.N) -1:
-                    self.M[k].append(0) # adiciona os elementos da coluna do vértice
-                    self.M[self.N.index(v)].append('-') # adiciona os elementos da linha do vértice
-                else:
-                    self.M[self.N.index(v)].append(0)  # adiciona um zero no último elemento da linha
+            if self.armazenamento == 'esparsa':
+                self.adjacencia.append({})
+            else:
+                self.M.append([]) # Adiciona a linha
+
+                for k in range(len(self.N)):
+                    if k != len(self.N) -1:
+                        self.M[k].append(0) # adiciona os elementos da coluna do vértice
+                        self.M[self.indices[v]].append('-') # adiciona os elementos da linha do vértice
+                    else:
+                        self.M[self.indices[v]].append(0)  # adiciona um zero no último elemento da linha
+
+            self.len = len(self.N)
+            self.quantVertices = len(self.N)
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
@@ -200,12 +356,7 @@ class Grafo:
         :raise: lança uma exceção caso a aresta não estiver em um formato válido
         '''
         if self.arestaValida(a):
-            i_a1 = self.__indice_primeiro_vertice_aresta(a)
-            i_a2 = self.__indice_segundo_vertice_aresta(a)
-            if i_a1 < i_a2:
-                self.M[i_a1][i_a2] += 1
-            else:
-                self.M[i_a2][i_a1] += 1
+            self.__soma_aresta(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a), 1)
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -217,12 +368,7 @@ class Grafo:
         '''
         if self.arestaValida(a):
             if self.existeAresta(a):
-                i_a1 = self.__indice_primeiro_vertice_aresta(a)
-                i_a2 = self.__indice_segundo_vertice_aresta(a)
-                if i_a1 < i_a2:
-                    self.M[i_a1][i_a2] -= 1
-                else:
-                    self.M[i_a2][i_a1] -= 1
+                self.__soma_aresta(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a), -1)
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -245,10 +391,13 @@ class Grafo:
 
         grafo_str += '\n'
 
-        for l in range(len(self.M)):
+        for l in range(self.len):
             grafo_str += self.N[l] + ' '
-            for c in range(len(self.M)):
-                grafo_str += str(self.M[l][c]) + ' '
+            for c in range(self.len):
+                if self.armazenamento == 'esparsa':
+                    grafo_str += ('-' if l > c else str(self.__multiplicidade(l, c))) + ' '
+                else:
+                    grafo_str += str(self.M[l][c]) + ' '
             grafo_str += '\n'
         return grafo_str
 
@@ -257,7 +406,10 @@ class Grafo:
 # ======================================================================================================================
 
     def grau(self, d):
-        aux = self.N.index(d)
+        aux = self.indices[d]
+        if self.armazenamento == 'esparsa':
+            return sum(self.adjacencia[aux].values())
+
         soma = 0
         for i in range(self.quantVertices):
             if i > aux:
@@ -268,14 +420,9 @@ class Grafo:
 
     def arestas_sobre_vertice(self, d):
         lista = []
-        aux = self.N.index(d)
-        for i in range(self.quantVertices):
-            if i > aux:
-                if self.M[aux][i] >= 1:
-                    lista.append("%s-%s" % (self.N[aux], self.N[i]))
-            if i <= aux:
-                if self.M[i][aux] >= 1:
-                    lista.append("%s-%s" % (self.N[aux], self.N[i]))
+        aux = self.indices[d]
+        for i, quantidade in self.__vizinhos(aux):
+            lista.append("%s-%s" % (self.N[aux], self.N[i]))
         return lista
 
 
@@ -291,36 +438,170 @@ class Grafo:
                 aux[i].append(m[i][p])
         return aux
 
-    def dfsAux(self, d, lista, arestasv):
-        aux = self.arestas_sobre_vertice(d)
-        for aresta in aux:
-            if aresta[-1] not in lista:
-                lista.append(aresta[-1])
-                self.dfsAux(aresta[-1], lista, arestasv)
+    def iter_dfs(self, d):
+        '''
+        Gera os vértices da busca em profundidade à medida que são descobertos, usando uma pilha explícita.
+        :param d: O vértice de onde a busca começa.
+        :return: Um gerador de tuplas (vertice, aresta), onde aresta é a aresta no formato X-Y usada para
+        chegar ao vértice, ou None para o vértice inicial.
+        '''
+        visitado = [False] * self.len
+        visitado[self.indices[d]] = True
+        yield d, None
+
+        # Cada elemento da pilha percorre os vizinhos de um vértice do caminho atual
+        pilha = [(self.indices[d], iter(self.__vizinhos(self.indices[d])))]
+        while pilha:
+            pai, vizinhos = pilha[-1]
+            for i, quantidade in vizinhos:
+                if not visitado[i]:
+                    visitado[i] = True
+                    yield self.N[i], "%s%s%s" % (self.N[pai], self.SEPARADOR_ARESTA, self.N[i])
+                    pilha.append((i, iter(self.__vizinhos(i))))
+                    break
+            else:
+                pilha.pop()
+
+    def iter_bfs(self, d):
+        '''
+        Gera os vértices da busca em largura à medida que são descobertos.
+        :param d: O vértice de onde a busca começa.
+        :return: Um gerador de tuplas (vertice, aresta), onde aresta é a aresta no formato X-Y usada para
+        chegar ao vértice, ou None para o vértice inicial.
+        '''
+        visitado = [False] * self.len
+        visitado[self.indices[d]] = True
+        yield d, None
+
+        fila = deque([self.indices[d]])
+        while fila:
+            pai = fila.popleft()
+            for i, quantidade in self.__vizinhos(pai):
+                if not visitado[i]:
+                    visitado[i] = True
+                    yield self.N[i], "%s%s%s" % (self.N[pai], self.SEPARADOR_ARESTA, self.N[i])
+                    fila.append(i)
 
     def dfs(self, d):
-        lista = [d]
-        self.dfsAux(d, lista, [])
-        return lista
+        '''
+        Faz a busca em profundidade a partir de um vértice.
+        :param d: O vértice de onde a busca começa.
+        :return: Uma lista com os vértices na ordem em que foram visitados.
+        '''
+        return [v for v, aresta in self.iter_dfs(d)]
 
     def conexo(self, inicio):
-        a = self.dfs(inicio)
-        for i in self.N:
-            if i not in a:
-                return False
-        return True
+        '''
+        Verifica se o grafo é conexo, consultando a quantidade de componentes mantida a cada aresta adicionada ou removida.
+        :param inicio: Um vértice do grafo.
+        :return: Um valor booleano que indica se o grafo é conexo.
+        :raises: VerticeInvalidoException se o vértice não existir
+        '''
+        if inicio not in self.indices:
+            raise VerticeInvalidoException('O vértice ' + str(inicio) + ' é inválido')
+        # Os índices de vértices repetidos em N não têm arestas e não contam como componentes
+        return self.__conectividade_dinamica().quantidade_componentes - (self.len - len(self.indices)) == 1
+
+    def componentes(self):
+        '''
+        Rotula cada vértice com o número da sua componente conexa. As componentes são numeradas na ordem em que
+        aparece o primeiro vértice de cada uma na lista de vértices.
+        :return: Uma tupla (rotulos, tamanhos), onde rotulos é um dicionário que associa cada vértice ao número da sua
+        componente e tamanhos[c] é a quantidade de vértices da componente c.
+        '''
+        conectividade = self.__conectividade_dinamica()
+        rotulos = {}
+        tamanhos = []
+        numeros = {}
+        for v in self.N:
+            representante = conectividade.representante(self.indices[v])
+            if representante not in numeros:
+                numeros[representante] = len(tamanhos)
+                tamanhos.append(conectividade.tamanho(self.indices[v]))
+            rotulos[v] = numeros[representante]
+        return rotulos, tamanhos
+
+    def mesma_componente(self, u, v):
+        '''
+        Verifica se existe um caminho entre dois vértices.
+        :param u: Um vértice
+        :param v: Outro vértice
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        for x in (u, v):
+            if x not in self.indices:
+                raise VerticeInvalidoException('O vértice ' + str(x) + ' é inválido')
+        return self.__conectividade_dinamica().conectados(self.indices[u], self.indices[v])
+
+    def __low_link(self):
+        '''
+        Percorre o grafo uma única vez calculando a ordem de descoberta e o low-link de cada vértice
+        (algoritmo de Tarjan), sem alterar as arestas.
+        :return: Uma tupla (pontes, articulacoes), com as pontes como pares de índices (i, p), i < p,
+        e os índices dos pontos de articulação, ambos em ordem crescente.
+        '''
+        descoberta = [-1] * self.len
+        low = [0] * self.len
+        pontes = []
+        articulacoes = set()
+        tempo = 0
+
+        for raiz in range(self.len):
+            if descoberta[raiz] != -1:
+                continue
+
+            descoberta[raiz] = low[raiz] = tempo
+            tempo += 1
+            filhos_raiz = 0
+
+            pilha = [(raiz, -1, iter(self.__vizinhos(raiz)))]
+            while pilha:
+                v, pai, vizinhos = pilha[-1]
+                for j, quantidade in vizinhos:
+                    # Laços nunca são pontes, e a aresta que levou até v só conta como retorno se for paralela
+                    if j == v or (j == pai and quantidade == 1):
+                        continue
+                    if descoberta[j] == -1:
+                        descoberta[j] = low[j] = tempo
+                        tempo += 1
+                        pilha.append((j, v, iter(self.__vizinhos(j))))
+                        break
+                    low[v] = min(low[v], descoberta[j])
+                else:
+                    pilha.pop()
+                    if pai == -1:
+                        continue
+
+                    low[pai] = min(low[pai], low[v])
+                    if low[v] > descoberta[pai]:
+                        pontes.append((min(pai, v), max(pai, v)))
+                    if pai == raiz:
+                        filhos_raiz += 1
+                    elif low[v] >= descoberta[pai]:
+                        articulacoes.add(pai)
+
+            if filhos_raiz > 1:
+                articulacoes.add(raiz)
+
+        return sorted(pontes), sorted(articulacoes)
 
     def pontes(self):
-        aux = []
-        for i in range(self.len):
-            for p in range(self.len):
-                if self.M[i][p] != '-' and self.M[i][p] > 0:
-                    self.M = self.copy(self.perc)
-                    self.M[i][p] -= 1
-                    if not self.conexo(self.N[p]):
-                        aux.append(["%s-%s" % (self.N[i], self.N[p])])
-        self.M = self.copy(self.perc)
-        return aux
+        '''
+        Encontra as pontes do grafo, ou seja, as arestas cuja remoção aumenta o número de componentes.
+        Arestas com paralelas e laços nunca são pontes.
+        :return: Uma lista em que cada ponte aparece como uma lista com a aresta no formato X-Y.
+        '''
+        pontes, articulacoes = self.__low_link()
+        return [["%s%s%s" % (self.N[i], self.SEPARADOR_ARESTA, self.N[p])] for i, p in pontes]
+
+    def pontos_articulacao(self):
+        '''
+        Encontra os pontos de articulação do grafo, ou seja, os vértices cuja remoção aumenta o número de componentes.
+        :return: Uma lista com os pontos de articulação na ordem de V.
+        '''
+        pontes, articulacoes = self.__low_link()
+        return [self.N[i] for i in articulacoes]
 
     def graus(self):
 
@@ -351,40 +632,69 @@ class Grafo:
         else:
             return []
 
-    def remover(self, aresta):
-        a = self.N.index(aresta[0])
-        b = self.N.index(aresta[-1])
-        if a <= b:
-            self.M[a][b] -= 1
-        else:
-            self.M[b][a] -= 1
+    def euler(self):
+        '''
+        Encontra um caminho ou circuito euleriano com o algoritmo de Hierholzer, usando uma pilha explícita.
+        O grafo não é alterado: as arestas ainda não percorridas são contadas numa cópia local das multiplicidades.
+        :return: Uma lista com a sequência de vértices que percorre cada aresta (inclusive paralelas e laços)
+        exatamente uma vez, ou False se o grafo não tiver caminho euleriano.
+        '''
+        if self.len == 0:
+            return False
 
-    def euler_rec(self, d, aux, pontes):
-        ai = self.arestas_sobre_vertice(d)
-        if len(ai) == 0:
-            return
-        aresta = ai[0]
-        if (aresta not in pontes) or (aresta in pontes and len(ai) == 1):
-            aux.append(aresta[-1])
-            ai.pop(0)
-            self.remover(aresta)
-            self.euler_rec(aux[-1], aux, pontes)
+        vizinhos = []
+        restantes = []
+        impares = []
+        total = 0
+        for i in range(self.len):
+            lista = self.__vizinhos(i)
+            vizinhos.append([j for j, quantidade in lista])
+            restantes.append(dict(lista))
+
+            # Laços não mudam a paridade do vértice
+            grau = 0
+            for j, quantidade in lista:
+                if j != i:
+                    grau += quantidade
+                if j >= i:
+                    total += quantidade
+            if grau % 2 == 1:
+                impares.append(i)
+
+        if len(impares) not in (0, 2):
+            return False
 
+        if impares:
+            inicio = impares[0]
         else:
-            ai[0], ai[-1] = ai[-1], ai[0]
-
-    def euler(self):
-        aux = []
-
-        for i in self.escolhas_euler():
-            aux = [i]
-            self.euler_rec(i, aux, self.pontes())
-            self.M = self.copy(self.perc)
-            if len(aux) == len(self.N):
-                break
-        if aux == []:
+            inicio = 0
+            while inicio < self.len - 1 and not vizinhos[inicio]:
+                inicio += 1
+
+        # proximo[v] aponta para o primeiro vizinho de v que ainda pode ter arestas não percorridas
+        proximo = [0] * self.len
+        pilha = [inicio]
+        caminho = []
+        while pilha:
+            v = pilha[-1]
+            while proximo[v] < len(vizinhos[v]) and restantes[v][vizinhos[v][proximo[v]]] == 0:
+                proximo[v] += 1
+
+            if proximo[v] == len(vizinhos[v]):
+                caminho.append(self.N[pilha.pop()])
+            else:
+                j = vizinhos[v][proximo[v]]
+                restantes[v][j] -= 1
+                if j != v:
+                    restantes[j][v] -= 1
+                pilha.append(j)
+
+        # Se sobraram arestas, elas estão em outra componente e não há caminho euleriano
+        if len(caminho) != total + 1:
             return False
-        return aux
+
+        caminho.reverse()
+        return caminho
 
     def ciclo_hamilton_rec(self, d, lista):
         aux = self.arestas_sobre_vertice(d)
@@ -404,7 +714,6 @@ class Grafo:
         for i in self.N:
             l = [i]
             self.ciclo_hamilton_rec(i, l)
-            self.M = self.copy(self.perc)
             if len(l) == self.quantVertices + 1:
                 return l
         return False
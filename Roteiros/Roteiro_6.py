@@ -13,12 +13,13 @@ class Grafo:
     SEPARADOR_ARESTA = '-'
     __maior_vertice = 0
 
-    def __init__(self, V=None, A=None):
+    def __init__(self, V=None, A=None, armazenamento='lista'):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param V: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices
+        :param armazenamento: 'lista' guarda uma matriz de adjacência V x V; 'esparsa' guarda, para cada vértice, só os sucessores e a quantidade de arestas até cada um deles.
         '''
 
         if V == None:
@@ -26,23 +27,19 @@ class Grafo:
         if A == None:
             A = dict()
 
-        for v in V:
-            if not(Grafo.verticeValido(v)):
-                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
-            if len(v) > self.__maior_vertice:
-                self.__maior_vertice = len(v)
-
-        self.N = list(V)
-        M = []
+        self.__inicializa(V, True, armazenamento)
+        self.len = len(self.N)
+        self.quantVertices = len(self.N)
 
-        for k in range(len(V)):
-            M.append(list())
-            for l in range(len(V)):
-                M[k].append(0)
-        self.M = M
         for i in A.values():
             self.adicionaAresta(i)
 
+        # A lista de adjacência é construída já no formato correto, então só a matriz precisa ser verificada
+        if self.armazenamento == 'esparsa':
+            return
+
+        M = self.M
+
         if len(M) != len(V):
             raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
 
@@ -64,8 +61,119 @@ class Grafo:
                     raise ArestaInvalidaException('A aresta ' + aresta + ' é inválida')
 
         self.M = M
-        self.len = len(self.N)
-        self.quantVertices = len(self.N)
+
+    @classmethod
+    def from_edges(cls, V, arestas, validate='fast', armazenamento='lista'):
+        '''
+        Constrói um Grafo a partir de uma lista de vértices e de uma coleção de arestas, preenchendo a matriz em uma única passada.
+        Diferente do construtor, não verifica todos os pares de vértices: cada vértice e cada aresta são validados uma única vez.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param arestas: As arestas no formato X-Y. Pode ser uma lista de strings ou um dicionário no mesmo formato do construtor.
+        :param validate: 'fast' valida cada vértice e cada aresta uma única vez; 'none' confia nos dados e não valida nada.
+        :param armazenamento: 'lista' ou 'esparsa', como no construtor.
+        :return: O Grafo construído.
+        :raises: VerticeInvalidoException se algum vértice for inválido ou repetido, ArestaInvalidaException se alguma aresta for inválida.
+        '''
+        if validate not in ('fast', 'none'):
+            raise ValueError("O parâmetro validate deve ser 'fast' ou 'none'")
+        valida = validate == 'fast'
+
+        if isinstance(arestas, dict):
+            arestas = arestas.values()
+
+        grafo = cls.__new__(cls)
+        grafo.__inicializa(V, valida, armazenamento)
+        grafo.len = len(grafo.N)
+        grafo.quantVertices = len(grafo.N)
+
+        if valida and len(grafo.indices) != len(grafo.N):
+            for v in grafo.N:
+                if grafo.N.count(v) > 1:
+                    raise VerticeInvalidoException('O vértice {} já existe'.format(v))
+
+        for a in arestas:
+            if valida and not(grafo.arestaValida(a)):
+                raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+            grafo.__soma_aresta(grafo.__indice_primeiro_vertice_aresta(a), grafo.__indice_segundo_vertice_aresta(a), 1)
+
+        return grafo
+
+    def __inicializa(self, V, valida=True, armazenamento='lista'):
+        '''
+        Inicializa a lista de vértices, o índice dos vértices e uma matriz (ou lista) de adjacência sem nenhuma aresta.
+        :param V: Uma lista dos vértices (ou nodos) do grafo.
+        :param valida: Indica se cada vértice deve ser verificado antes de ser incluído.
+        :param armazenamento: 'lista' ou 'esparsa'.
+        :raises: VerticeInvalidoException se algum vértice não estiver no formato válido.
+        '''
+        if armazenamento not in ('lista', 'esparsa'):
+            raise ValueError("O armazenamento deve ser 'lista' ou 'esparsa'")
+        self.armazenamento = armazenamento
+
+        for v in V:
+            if valida and not(Grafo.verticeValido(v)):
+                raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
+            if len(v) > self.__maior_vertice:
+                self.__maior_vertice = len(v)
+
+        self.N = list(V)
+
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(self.N)):
+            if self.N[i] not in self.indices:
+                self.indices[self.N[i]] = i
+
+        if armazenamento == 'esparsa':
+            # Para cada vértice, um dicionário que associa o índice de cada sucessor à quantidade de arestas que saem do vértice até ele
+            self.M = None
+            self.adjacencia = []
+            for k in range(len(self.N)):
+                self.adjacencia.append({})
+            return
+
+        M = []
+        for k in range(len(self.N)):
+            M.append([0] * len(self.N))
+        self.M = M
+
+    def __soma_aresta(self, i_a1, i_a2, quantidade):
+        '''
+        Soma uma quantidade ao número de arestas que saem do vértice de índice i_a1 e chegam no vértice de índice i_a2.
+        :param i_a1: O índice do vértice de origem
+        :param i_a2: O índice do vértice de destino
+        :param quantidade: O valor a ser somado (negativo para remover arestas)
+        '''
+        if self.armazenamento == 'esparsa':
+            total = self.adjacencia[i_a1].get(i_a2, 0) + quantidade
+            if total > 0:
+                self.adjacencia[i_a1][i_a2] = total
+            else:
+                self.adjacencia[i_a1].pop(i_a2, None)
+        else:
+            self.M[i_a1][i_a2] += quantidade
+
+    def __multiplicidade(self, i_a1, i_a2):
+        '''
+        Retorna a quantidade de arestas que saem do vértice de índice i_a1 e chegam no vértice de índice i_a2.
+        :param i_a1: O índice do vértice de origem
+        :param i_a2: O índice do vértice de destino
+        :return: O número de arestas de i_a1 para i_a2
+        '''
+        if self.armazenamento == 'esparsa':
+            return self.adjacencia[i_a1].get(i_a2, 0)
+        return self.M[i_a1][i_a2]
+
+    def __sucessores(self, i):
+        '''
+        Retorna os índices dos vértices que recebem alguma aresta saindo do vértice de índice i.
+        No armazenamento 'esparsa' só os sucessores são percorridos; na matriz é preciso percorrer a linha do vértice.
+        :param i: O índice do vértice
+        :return: Uma lista com os índices dos sucessores
+        '''
+        if self.armazenamento == 'esparsa':
+            return list(self.adjacencia[i])
+        return [j for j, quantidade in enumerate(self.M[i]) if quantidade]
 
     def arestaValida(self, aresta=''):
         '''
@@ -111,7 +219,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def __primeiro_vertice_aresta(self, a: str):
         '''
@@ -135,7 +243,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do primeiro vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__primeiro_vertice_aresta(a))
+        return self.indices[self.__primeiro_vertice_aresta(a)]
 
     def __indice_segundo_vertice_aresta(self, a: str):
         '''
@@ -143,7 +251,7 @@ class Grafo:
         :param a: A aresta a ser analisada
         :return: O índice do segundo vértice da aresta na lista de vértices
         '''
-        return self.N.index(self.__segundo_vertice_aresta(a))
+        return self.indices[self.__segundo_vertice_aresta(a)]
 
     def existeAresta(self, a: str):
         '''
@@ -153,10 +261,9 @@ class Grafo:
         '''
         existe = False
         if Grafo.arestaValida(self, a):
-            for i in range(len(self.M)):
-                for j in range(len(self.M)):
-                    if self.M[self.__indice_primeiro_vertice_aresta(a)][self.__indice_segundo_vertice_aresta(a)]:
-                        existe = True
+            if self.__multiplicidade(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a)):
+                existe = True
+        return existe
 
     def adicionaAresta(self, a):
         '''
@@ -165,9 +272,7 @@ class Grafo:
         :raise: lança uma exceção caso a aresta não estiver em um formato válido
         '''
         if self.arestaValida(a):
-            i_a1 = self.__indice_primeiro_vertice_aresta(a)
-            i_a2 = self.__indice_segundo_vertice_aresta(a)
-            self.M[i_a1][i_a2] += 1
+            self.__soma_aresta(self.__indice_primeiro_vertice_aresta(a), self.__indice_segundo_vertice_aresta(a), 1)
         else:
             raise ArestaInvalidaException('A aresta {} é inválida'.format(a))
 
@@ -190,10 +295,10 @@ class Grafo:
 
         grafo_str += '\n'
 
-        for l in range(len(self.M)):
+        for l in range(self.len):
             grafo_str += self.N[l] + ' '
-            for c in range(len(self.M)):
-                grafo_str += str(self.M[l][c]) + ' '
+            for c in range(self.len):
+                grafo_str += str(self.__multiplicidade(l, c)) + ' '
             grafo_str += '\n'
         return grafo_str
 
@@ -215,16 +320,201 @@ class Grafo:
 #                                                       ROTEIRO 6
 # ======================================================================================================================
 
+    def __componentes_fortes(self):
+        '''
+        Encontra as componentes fortemente conexas com o algoritmo de Tarjan, usando uma pilha explícita.
+        :return: Uma tupla (componente, quantidade), onde componente[i] é o número da componente do vértice i.
+        As componentes são numeradas em ordem topológica reversa: uma aresta entre componentes diferentes
+        sempre sai de uma componente de número maior e chega numa de número menor.
+        '''
+        descoberta = [-1] * self.len
+        low = [0] * self.len
+        na_pilha = [False] * self.len
+        componente = [-1] * self.len
+        pilha = []
+        tempo = 0
+        quantidade = 0
+
+        for raiz in range(self.len):
+            if descoberta[raiz] != -1:
+                continue
+
+            descoberta[raiz] = low[raiz] = tempo
+            tempo += 1
+            pilha.append(raiz)
+            na_pilha[raiz] = True
+
+            # Cada elemento de chamadas percorre os sucessores de um vértice do caminho atual
+            chamadas = [(raiz, iter(self.__sucessores(raiz)))]
+            while chamadas:
+                v, sucessores = chamadas[-1]
+                for w in sucessores:
+                    if descoberta[w] == -1:
+                        descoberta[w] = low[w] = tempo
+                        tempo += 1
+                        pilha.append(w)
+                        na_pilha[w] = True
+                        chamadas.append((w, iter(self.__sucessores(w))))
+                        break
+                    if na_pilha[w] and descoberta[w] < low[v]:
+                        low[v] = descoberta[w]
+                else:
+                    chamadas.pop()
+                    if chamadas:
+                        pai = chamadas[-1][0]
+                        if low[v] < low[pai]:
+                            low[pai] = low[v]
+
+                    # v é a raiz de uma componente, formada pelos vértices empilhados depois dele
+                    if low[v] == descoberta[v]:
+                        w = -1
+                        while w != v:
+                            w = pilha.pop()
+                            na_pilha[w] = False
+                            componente[w] = quantidade
+                        quantidade += 1
+
+        return componente, quantidade
+
+    def __condensacao(self):
+        '''
+        Contrai cada componente fortemente conexa em um único vértice, formando um grafo acíclico.
+        :return: Uma tupla (componente, quantidade, sucessores, ciclica), onde sucessores[c] é a lista, sem repetições,
+        das componentes que recebem alguma aresta saindo da componente c e ciclica[c] indica se a componente tem um ciclo,
+        ou seja, mais de um vértice ou um laço.
+        '''
+        componente, quantidade = self.__componentes_fortes()
+        conjuntos = [set() for c in range(quantidade)]
+        ciclica = [False] * quantidade
+        for v in range(self.len):
+            c = componente[v]
+            for w in self.__sucessores(v):
+                conjuntos[c].add(componente[w])
+        for c in range(quantidade):
+            if c in conjuntos[c]:
+                ciclica[c] = True
+                conjuntos[c].discard(c)
+        return componente, quantidade, [sorted(conjunto) for conjunto in conjuntos], ciclica
+
+    def componentes_fortes(self):
+        '''
+        Decompõe o grafo em componentes fortemente conexas, em tempo O(V + E).
+        As componentes são numeradas em ordem topológica: toda aresta entre componentes diferentes sai de uma componente
+        de número menor e chega numa de número maior.
+        :return: Uma tupla (componentes, condensacao). componentes é um dicionário que associa cada vértice ao número
+        da sua componente, e condensacao é um Grafo acíclico, com o mesmo armazenamento deste, cujos vértices são os
+        números das componentes e que tem uma aresta X-Y sempre que alguma aresta sai da componente X e chega na Y.
+        '''
+        componente, quantidade, sucessores, ciclica = self.__condensacao()
+
+        # O algoritmo de Tarjan numera as componentes na ordem topológica reversa
+        ultima = quantidade - 1
+        componentes = {}
+        for v in range(self.len):
+            componentes[self.N[v]] = ultima - componente[v]
+
+        condensacao = Grafo.from_edges([str(c) for c in range(quantidade)], [], validate='none',
+                                       armazenamento=self.armazenamento)
+        for c in range(quantidade):
+            for d in sucessores[c]:
+                condensacao.__soma_aresta(ultima - c, ultima - d, 1)
+
+        return componentes, condensacao
+
+    def indice_alcancabilidade(self):
+        '''
+        Constrói um índice para responder muitas consultas do tipo "u alcança v" sem montar a matriz de alcançabilidade.
+        O índice guarda o grafo das componentes fortemente conexas e dois intervalos por componente, então ocupa
+        espaço proporcional a V + E e é construído em tempo quase linear.
+        :return: Um objeto do tipo IndiceAlcancabilidade
+        '''
+        componente, quantidade, sucessores, ciclica = self.__condensacao()
+        return IndiceAlcancabilidade(self.N, componente, sucessores, ciclica)
+
     def warshall(self):
-        E = self.copy(self.M)
-        for i in range(0, self.len):
-            for j in range(0, self.len):
-                if E[j][i] == 1:
-                    for k in range(0, self.len):
-                        E[j][k] = max(E[j][k], E[i][k])
+        '''
+        Calcula o fecho transitivo do grafo. Cada linha da matriz de alcançabilidade é um inteiro usado como conjunto
+        de bits, e as linhas são montadas por componente fortemente conexa, das componentes sem saída para as demais,
+        de modo que cada aresta entre componentes custa uma única operação OR.
+        Todos os vértices de uma componente compartilham a mesma linha.
+        :return: Um objeto do tipo Alcancabilidade
+        '''
+        componente, quantidade = self.__componentes_fortes()
+        membros = [[] for c in range(quantidade)]
+        for v in range(self.len):
+            membros[componente[v]].append(v)
+
+        alcance = [0] * quantidade
+        for c in range(quantidade):
+            linha = 0
+            # Uma componente alcança os próprios vértices se tiver um ciclo, ou seja, mais de um vértice ou um laço
+            ciclica = len(membros[c]) > 1
+            for v in membros[c]:
+                for w in self.__sucessores(v):
+                    if componente[w] != c:
+                        linha |= alcance[componente[w]] | (1 << w)
+                    else:
+                        ciclica = True
+            if ciclica:
+                for v in membros[c]:
+                    linha |= 1 << v
+            alcance[c] = linha
+
+        return Alcancabilidade(self.N, [alcance[componente[v]] for v in range(self.len)])
+
+
+class Alcancabilidade:
+    '''
+    Matriz de alcançabilidade de um grafo direcionado. Cada linha é um inteiro usado como conjunto de bits:
+    o bit j da linha i indica que existe um caminho, com pelo menos uma aresta, do vértice i até o vértice j.
+    '''
+
+    def __init__(self, N, linhas):
+        self.N = N
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+        self.linhas = linhas
+
+    def __indice(self, vertice):
+        '''
+        Retorna o índice de um vértice.
+        :param vertice: O vértice
+        :return: O índice do vértice na lista de vértices
+        :raises: VerticeInvalidoException se o vértice não existir
+        '''
+        if vertice not in self.indices:
+            raise VerticeInvalidoException('O vértice ' + str(vertice) + ' é inválido')
+        return self.indices[vertice]
 
+    def alcanca(self, u, v):
+        '''
+        Verifica se existe um caminho, com pelo menos uma aresta, de u até v.
+        :param u: O vértice de origem
+        :param v: O vértice de destino
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        return (self.linhas[self.__indice(u)] >> self.__indice(v)) & 1 == 1
+
+    def alcancaveis(self, u):
+        '''
+        Retorna os vértices alcançáveis a partir de u por um caminho com pelo menos uma aresta.
+        :param u: O vértice de origem
+        :return: Uma lista com os vértices na ordem de N
+        :raises: VerticeInvalidoException se o vértice não existir
+        '''
+        linha = self.linhas[self.__indice(u)]
+        return [self.N[j] for j in range(len(self.N)) if (linha >> j) & 1]
+
+    def __str__(self):
+        '''
+        Fornece uma representação do tipo String da matriz de alcançabilidade, no mesmo formato da matriz do grafo.
+        :return: Uma string que representa a matriz
+        '''
         # Dá o espaçamento correto de acordo com o tamanho do string do maior vértice
-        espaco = ' ' * (self.__maior_vertice)
+        espaco = ' ' * max([len(v) for v in self.N] + [0])
 
         grafo_str = espaco + ' '
 
@@ -235,14 +525,176 @@ class Grafo:
 
         grafo_str += '\n'
 
-        for l in range(self.len):
+        for l in range(len(self.N)):
             grafo_str += self.N[l] + ' '
-            for c in range(len(E)):
-                grafo_str += str(E[l][c]) + ' '
+            for c in range(len(self.N)):
+                grafo_str += str((self.linhas[l] >> c) & 1) + ' '
             grafo_str += '\n'
         return grafo_str
 
 
+class IndiceAlcancabilidade:
+    '''
+    Índice de alcançabilidade de um grafo direcionado, montado sobre o grafo acíclico das componentes fortemente conexas.
+    Cada componente recebe dois intervalos [baixo, pos], um para cada busca em profundidade sobre o grafo das componentes,
+    onde pos é a ordem de término da componente na busca e baixo é o menor pos entre as componentes que ela alcança.
+    Se u alcança v, os intervalos de v estão contidos nos de u; quando isso não acontece a resposta é negativa na hora.
+    Para as respostas positivas, algumas componentes com muitas arestas são escolhidas como centros, e cada componente
+    guarda, em conjuntos de bits, os centros que alcança e os centros que a alcançam: se algum centro aparece nos dois,
+    u alcança v. Nos outros casos, uma busca em profundidade que descarta as componentes cujos intervalos não contêm
+    os de v dá a resposta.
+    '''
+
+    # Quantidade máxima de centros usados nas respostas positivas
+    CENTROS = 64
+
+    def __init__(self, N, componente, sucessores, ciclica):
+        self.N = N
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+        self.componente = componente
+        self.sucessores = sucessores
+        self.ciclica = ciclica
+
+        # Os números das componentes do algoritmo de Tarjan já são uma ordem de término de uma busca em profundidade
+        quantidade = len(sucessores)
+        self.baixo = list(range(quantidade))
+        for c in range(quantidade):
+            for d in sucessores[c]:
+                if self.baixo[d] < self.baixo[c]:
+                    self.baixo[c] = self.baixo[d]
+
+        # A segunda busca percorre as componentes e os sucessores na ordem inversa, gerando intervalos diferentes
+        self.pos = [-1] * quantidade
+        self.baixo_pos = [0] * quantidade
+        tempo = 0
+        for raiz in range(quantidade - 1, -1, -1):
+            if self.pos[raiz] != -1:
+                continue
+            self.pos[raiz] = -2
+            chamadas = [(raiz, reversed(sucessores[raiz]))]
+            while chamadas:
+                c, proximos = chamadas[-1]
+                for d in proximos:
+                    if self.pos[d] == -1:
+                        self.pos[d] = -2
+                        chamadas.append((d, reversed(sucessores[d])))
+                        break
+                else:
+                    chamadas.pop()
+                    self.pos[c] = tempo
+                    menor = tempo
+                    for d in sucessores[c]:
+                        if self.baixo_pos[d] < menor:
+                            menor = self.baixo_pos[d]
+                    self.baixo_pos[c] = menor
+                    tempo += 1
+
+        # Os centros são as componentes com o maior produto entre as arestas que entram e as que saem
+        entrada = [0] * quantidade
+        for c in range(quantidade):
+            for d in sucessores[c]:
+                entrada[d] += 1
+        ordem = sorted(range(quantidade), key=lambda c: (entrada[c] + 1) * (len(sucessores[c]) + 1), reverse=True)
+        self.centro = [0] * quantidade
+        for k in range(min(self.CENTROS, quantidade)):
+            self.centro[ordem[k]] = 1 << k
+
+        # Centros alcançados a partir de cada componente, incluindo ela mesma, das componentes sem saída para as demais
+        self.centros_alcancados = list(self.centro)
+        for c in range(quantidade):
+            for d in sucessores[c]:
+                self.centros_alcancados[c] |= self.centros_alcancados[d]
+
+        # Centros que alcançam cada componente, incluindo ela mesma, na ordem topológica
+        self.centros_alcancam = list(self.centro)
+        for c in range(quantidade - 1, -1, -1):
+            for d in sucessores[c]:
+                self.centros_alcancam[d] |= self.centros_alcancam[c]
+
+        # Marca das componentes visitadas na última consulta, para não precisar limpar a lista a cada busca
+        self.__visitada = [0] * quantidade
+        self.__consulta = 0
+
+    def __indice(self, vertice):
+        '''
+        Retorna o índice de um vértice.
+        :param vertice: O vértice
+        :return: O índice do vértice na lista de vértices
+        :raises: VerticeInvalidoException se o vértice não existir
+        '''
+        if vertice not in self.indices:
+            raise VerticeInvalidoException('O vértice ' + str(vertice) + ' é inválido')
+        return self.indices[vertice]
+
+    def __contem(self, c, d):
+        '''
+        Verifica se os intervalos da componente c contêm os da componente d. Se não contiverem, c não alcança d.
+        :param c: A componente de origem
+        :param d: A componente de destino
+        :return: Um valor booleano
+        '''
+        return (self.baixo[c] <= self.baixo[d] and d <= c and
+                self.baixo_pos[c] <= self.baixo_pos[d] and self.pos[d] <= self.pos[c])
+
+    def alcanca(self, u, v):
+        '''
+        Verifica se existe um caminho, com pelo menos uma aresta, de u até v.
+        :param u: O vértice de origem
+        :param v: O vértice de destino
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        origem = self.componente[self.__indice(u)]
+        destino = self.componente[self.__indice(v)]
+        if origem == destino:
+            return self.ciclica[origem]
+        if not self.__contem(origem, destino):
+            return False
+        if self.centros_alcancados[origem] & self.centros_alcancam[destino]:
+            return True
+
+        self.__consulta += 1
+        visitada = self.__visitada
+        visitada[origem] = self.__consulta
+        pilha = [origem]
+        while pilha:
+            c = pilha.pop()
+            for d in self.sucessores[c]:
+                if d == destino:
+                    return True
+                if visitada[d] != self.__consulta and self.__contem(d, destino):
+                    visitada[d] = self.__consulta
+                    pilha.append(d)
+        return False
+
+    def alcancaveis(self, u):
+        '''
+        Retorna os vértices alcançáveis a partir de u por um caminho com pelo menos uma aresta.
+        :param u: O vértice de origem
+        :return: Uma lista com os vértices na ordem de N
+        :raises: VerticeInvalidoException se o vértice não existir
+        '''
+        origem = self.componente[self.__indice(u)]
+        self.__consulta += 1
+        visitada = self.__visitada
+        alcancadas = set()
+        if self.ciclica[origem]:
+            alcancadas.add(origem)
+        visitada[origem] = self.__consulta
+        pilha = [origem]
+        while pilha:
+            c = pilha.pop()
+            for d in self.sucessores[c]:
+                if visitada[d] != self.__consulta:
+                    visitada[d] = self.__consulta
+                    alcancadas.add(d)
+                    pilha.append(d)
+        return [self.N[j] for j in range(len(self.N)) if self.componente[j] in alcancadas]
+
+
 # ======================================================================================================================
 #                                                       Testes
 # ======================================================================================================================
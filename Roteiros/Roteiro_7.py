@@ -1,4 +1,9 @@
+import heapq
+import pickle
 import unittest
+from array import array
+from collections import OrderedDict
+from multiprocessing import Pool, shared_memory
 
 
 class VerticeInvalidoException(Exception):
@@ -13,12 +18,13 @@ class Grafo:
     QTDE_MAX_SEPARADOR = 1
     SEPARADOR_ARESTA = '-'
 
-    def __init__(self, N=[], A={}):
+    def __init__(self, N=[], A={}, pesos=None):
         '''
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param N: Uma lista dos vértices (ou nodos) do grafo.
         :param V: Uma dicionário que guarda as arestas do grafo. A chave representa o nome da aresta e o valor é uma string que contém dois vértices separados por um traço.
+        :param pesos: Um dicionário opcional com o peso de cada aresta, indexado pelo nome da aresta. Arestas sem peso valem 1.
         '''
         for v in N:
             if not (Grafo.verticeValido(v)):
@@ -26,19 +32,44 @@ class Grafo:
 
         self.N = N
 
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(N)):
+            if N[i] not in self.indices:
+                self.indices[N[i]] = i
+
         for a in A:
             if not (self.arestaValida(A[a])):
                 raise ArestaInvalidaException('A aresta ' + A[a] + ' é inválida')
         self.len = len(N)
         self.A = A
 
+        self.pesos = {}
+        if pesos is not None:
+            for a in pesos:
+                if a not in A or not Grafo.pesoValido(pesos[a]):
+                    raise ArestaInvalidaException('O peso da aresta ' + str(a) + ' é inválido')
+                self.pesos[a] = pesos[a]
+
+        # Lista de adjacência com pesos usada pelos algoritmos de caminho mínimo, montada sob demanda
+        self.__adjacencia = None
+
+        # Cache opcional das árvores de caminhos mínimos, ativado por *usa_cache*
+        self.__cache = None
+        self.__limite_cache = 0
+        self.__acertos = 0
+        self.__falhas = 0
+
+        # Número de vértices fechados pela última busca de caminho mínimo
+        self.fechados = 0
+
     def arestaValida(self, aresta=''):
         '''
         Verifica se uma aresta passada como parâmetro está dentro do padrão estabelecido.
         Uma aresta é representada por um string com o formato a-b, onde:
-        a é um substring de aresta que é o nome de um vértice adjacente   aresta.
+        a é um substring de aresta que é o nome de um vértice adjacente à aresta.
         - é um caractere separador. Uma aresta só pode ter um único caractere como esse.
-        b é um substring de aresta que é o nome do outro vértice adjacente   aresta.
+        b é um substring de aresta que é o nome do outro vértice adjacente à aresta.
         Além disso, uma aresta só é válida se conectar dois vértices existentes no grafo.
         :param aresta: A aresta que se quer verificar se está no formato correto.
         :return: Um valor booleano que indica se a aresta está no formato correto.
@@ -61,6 +92,15 @@ class Grafo:
 
         return True
 
+    @classmethod
+    def pesoValido(self, peso=1):
+        '''
+        Verifica se um peso pode ser usado numa aresta. O peso deve ser um número real não negativo.
+        :param peso: O peso a ser analisado.
+        :return: Um valor booleano que indica se o peso é válido.
+        '''
+        return isinstance(peso, (int, float)) and not isinstance(peso, bool) and peso >= 0
+
     @classmethod
     def verticeValido(self, vertice=''):
         '''
@@ -77,7 +117,7 @@ class Grafo:
         :param vertice: O vértice que deve ser verificado.
         :return: Um valor booleano que indica se o vértice existe no grafo.
         '''
-        return Grafo.verticeValido(vertice) and self.N.count(vertice) > 0
+        return Grafo.verticeValido(vertice) and vertice in self.indices
 
     def existeAresta(self, aresta=''):
         '''
@@ -100,20 +140,119 @@ class Grafo:
         :raises: VerticeInvalidoException se o vértice passado como parâmetro não puder ser adicionado
         '''
         if self.verticeValido(v) and not self.existeVertice(v):
+            self.indices[v] = len(self.N)
             self.N.append(v)
+            self.len = len(self.N)
+            self.__grafo_alterado()
         else:
             raise VerticeInvalidoException('O vértice ' + v + ' é inválido')
 
-    def adicionaAresta(self, nome, a):
+    def adicionaAresta(self, nome, a, peso=1):
         '''
         Adiciona uma aresta no Grafo caso a aresta seja válida e não exista outra aresta com o mesmo nome
         :param v: A aresta a ser adicionada
+        :param peso: O peso da aresta
         :raises: ArestaInvalidaException se a aresta passada como parâmetro não puder ser adicionada
         '''
-        if self.arestaValida(a):
+        if self.arestaValida(a) and Grafo.pesoValido(peso):
             self.A[nome] = a
+            self.pesos[nome] = peso
+            self.__grafo_alterado()
         else:
-            ArestaInvalidaException('A aresta ' + self.A[a] + ' é inválida')
+            raise ArestaInvalidaException('A aresta ' + a + ' é inválida')
+
+    def peso(self, nome):
+        '''
+        Retorna o peso de uma aresta.
+        :param nome: O nome da aresta
+        :return: O peso da aresta, ou 1 se nenhum peso foi definido
+        '''
+        return self.pesos.get(nome, 1)
+
+    def __grafo_alterado(self):
+        '''
+        Descarta a lista de adjacência e as árvores de caminhos mínimos guardadas, que deixam de valer quando o grafo muda.
+        '''
+        self.__adjacencia = None
+        if self.__cache is not None:
+            self.__cache.clear()
+
+    def usa_cache(self, entradas=128):
+        '''
+        Ativa o cache das árvores de caminhos mínimos. Cada entrada guarda a árvore de uma origem (e, no *Dijkstra* com
+        energia, dos parâmetros de energia), e quando o limite é atingido a entrada usada há mais tempo é descartada.
+        O cache é esvaziado sempre que um vértice ou uma aresta é adicionado ao grafo.
+        Com o cache ativo as buscas percorrem todo o grafo a partir da origem, para que a árvore sirva a qualquer destino.
+        :param entradas: O número máximo de árvores guardadas. Com 0 o cache é desativado.
+        :raises: ValueError se entradas não for um inteiro não negativo
+        '''
+        if not isinstance(entradas, int) or entradas < 0:
+            raise ValueError('O número de entradas do cache deve ser um inteiro não negativo')
+
+        self.__cache = OrderedDict() if entradas > 0 else None
+        self.__limite_cache = entradas
+        self.__acertos = 0
+        self.__falhas = 0
+
+    def estatisticas_cache(self):
+        '''
+        Retorna os contadores do cache das árvores de caminhos mínimos.
+        :return: Um dicionário com os acertos, as falhas, o número de entradas guardadas e o limite de entradas
+        '''
+        return {'acertos': self.__acertos,
+                'falhas': self.__falhas,
+                'entradas': len(self.__cache) if self.__cache is not None else 0,
+                'limite': self.__limite_cache}
+
+    def __consulta_cache(self, chave):
+        '''
+        Procura uma árvore de caminhos mínimos no cache, marcando-a como a usada mais recentemente.
+        :param chave: A chave da árvore
+        :return: A árvore guardada, ou None se ela não estiver no cache ou se o cache estiver desativado
+        '''
+        if self.__cache is None:
+            return None
+        if chave in self.__cache:
+            self.__acertos += 1
+            self.__cache.move_to_end(chave)
+            return self.__cache[chave]
+        self.__falhas += 1
+        return None
+
+    def __guarda_cache(self, chave, arvore):
+        '''
+        Guarda uma árvore de caminhos mínimos no cache, descartando a usada há mais tempo se o limite for ultrapassado.
+        :param chave: A chave da árvore
+        :param arvore: A árvore a ser guardada
+        '''
+        if self.__cache is None:
+            return
+        self.__cache[chave] = arvore
+        if len(self.__cache) > self.__limite_cache:
+            self.__cache.popitem(last=False)
+
+    def __lista_adjacencia(self):
+        '''
+        Monta (ou reaproveita) a lista de adjacência com pesos do grafo, indexada pelos índices dos vértices.
+        As arestas são percorridas nos dois sentidos, laços são ignorados e entre arestas paralelas fica só a de menor peso.
+        :return: Uma lista em que a posição i tem uma lista de tuplas (índice do vizinho, peso)
+        '''
+        if self.__adjacencia is None:
+            menores = [{} for i in range(self.len)]
+            for nome in self.A:
+                i_traco = self.A[nome].index(Grafo.SEPARADOR_ARESTA)
+                i_a1 = self.indices[self.A[nome][:i_traco]]
+                i_a2 = self.indices[self.A[nome][i_traco + 1:]]
+                if i_a1 == i_a2:
+                    continue
+
+                peso = self.peso(nome)
+                if peso < menores[i_a1].get(i_a2, peso + 1):
+                    menores[i_a1][i_a2] = peso
+                    menores[i_a2][i_a1] = peso
+
+            self.__adjacencia = [list(vizinhos.items()) for vizinhos in menores]
+        return self.__adjacencia
 
     def arestas_sobre_vertice(self, d, lista):
 
@@ -134,102 +273,783 @@ class Grafo:
 #                                                       ROTEIRO 7
 # ======================================================================================================================
 
-    def remove_parallel(self):
-        temp = []
-        for i in self.A.values():
-            if i not in temp and i[0] != i[-1] and i[::-1] not in temp:
-                temp.append(i)
-        return temp
-
-    def DijkstraHead(self):
-        temp = self.remove_parallel()
-        mapa = {}
-        for i in self.N:
-            arestas = self.arestas_sobre_vertice(i, temp)
-            mapa[i] = [arestas, False, len(self.A.values()) + 1, '', 0]
-        return mapa
-
-    def Dijkstra(self, w, v, gasosa, postos):
-        u = w
-        dados = self.DijkstraHead()
-        # dados[vertice] = [arestas, Fi, Beta, pi, energy, limite de energia]
-
-        fis = []
-        # fi de u vira 1
-        dados[u][1] = True
-
-        # Beta de u = 0
-        dados[u][2] = 0
-        dados[u][4] = gasosa
-        while u != v and len(fis) < self.len:
-
-            # Para todos os outros vértices 𝞫(r) ⇽ ∞, 𝞿(r) ⇽ 0, 𝞹(r) ⇽ 0 e w ⇽ u
-            for i in dados[u][0]:
-                if dados[i[-1]][2] > dados[u][2] + 1:
-                    dados[i[-1]][2] = dados[u][2] + 1
-                    dados[i[-1]][3] = u
-                    dados[i[-1]][4] = dados[i[0]][4] - 1
-
-            # Ache um vértice r* tal que 𝞿(r*)=0, 𝞫(r*)<∞ e 𝞫(r*)=min𝞿(r) = 0(𝞫(r))
-            menorcaminho = len(self.A.values()) + 1
-            menorvertice = ''
-
-            for p in dados.keys():
-                if p in postos:
-                    dados[p][4] = 5
-                aux = dados[p]
-                if aux[1] == False and aux[2] < menorcaminho and aux[4]-1 >= 0:
-                    menorcaminho = aux[2]
-                    menorvertice = p
-
-            # Se r* não existe, não há caminho u-v e o algoritmo deve parar
-            if menorvertice == '':
-                break
-            # Faça 𝞿(r*) = 1 e w = r*
+    def __valida_vertices(self, vertices):
+        '''
+        Verifica se todos os vértices passados existem no grafo.
+        :param vertices: Os vértices a serem verificados
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        for vertice in vertices:
+            if not self.existeVertice(vertice):
+                raise VerticeInvalidoException('O vértice ' + str(vertice) + ' é inválido')
+
+    def __busca(self, origem, destinos=None):
+        '''
+        Executa o algoritmo de Dijkstra a partir de uma origem, usando um heap binário como fila de prioridade.
+        A busca para assim que todos os destinos forem fechados.
+        :param origem: O índice do vértice de origem
+        :param destinos: Um conjunto com os índices dos vértices de destino, ou None para percorrer todo o grafo
+        :return: Uma tupla (distancia, anterior, fechado) de listas indexadas pelos índices dos vértices
+        '''
+        adjacencia = self.__lista_adjacencia()
+        distancia = [float('inf')] * self.len
+        anterior = [-1] * self.len
+        fechado = [False] * self.len
+        distancia[origem] = 0
+        faltam = len(destinos) if destinos is not None else self.len
+        self.fechados = 0
 
-            dados[menorvertice][1] = True
-            u = menorvertice
-            if u in postos:
-                dados[u][4] = 5
+        heap = [(0, origem)]
+        while heap and faltam > 0:
+            d, u = heapq.heappop(heap)
+            # Entradas antigas de vértices que já foram fechados com uma distância menor são descartadas
+            if fechado[u]:
+                continue
+            fechado[u] = True
+            self.fechados += 1
+            if destinos is None or u in destinos:
+                faltam -= 1
 
+            for r, peso in adjacencia[u]:
+                if d + peso < distancia[r]:
+                    distancia[r] = d + peso
+                    anterior[r] = u
+                    heapq.heappush(heap, (distancia[r], r))
+
+        return distancia, anterior, fechado
+
+    def __arvore(self, origem, destinos):
+        '''
+        Retorna a árvore de caminhos mínimos de uma origem, usando o cache quando ele estiver ativo.
+        :param origem: O índice do vértice de origem
+        :param destinos: Um conjunto com os índices dos vértices que precisam ser fechados
+        :return: Uma tupla (distancia, anterior, fechado), como em *__busca*
+        '''
+        chave = ('dijkstra', origem)
+        arvore = self.__consulta_cache(chave)
+        if arvore is None:
+            arvore = self.__busca(origem, None if self.__cache is not None else destinos)
+            self.__guarda_cache(chave, arvore)
+        else:
+            self.fechados = 0
+        return arvore
 
-        aux = []
-        aux.append(v)
-        while v != w:
-            if v == '':
-                print("Nao a caminho possivel :(")
+    def __busca_bidirecional(self, origem, destino):
+        '''
+        Executa o algoritmo de Dijkstra ao mesmo tempo a partir da origem e do destino, expandindo sempre o lado
+        com a menor distância na fila. A busca para quando a soma das menores distâncias das duas filas não é
+        menor que o melhor caminho já encontrado.
+        :param origem: O índice do vértice de origem
+        :param destino: O índice do vértice de destino
+        :return: Uma tupla (caminho, distancia) com os índices dos vértices do caminho, ou None se não houver caminho
+        '''
+        adjacencia = self.__lista_adjacencia()
+        # A posição 0 de cada par é a busca a partir da origem e a posição 1 a busca a partir do destino
+        distancia = ([float('inf')] * self.len, [float('inf')] * self.len)
+        anterior = ([-1] * self.len, [-1] * self.len)
+        fechado = ([False] * self.len, [False] * self.len)
+        distancia[0][origem] = 0
+        distancia[1][destino] = 0
+        heaps = ([(0, origem)], [(0, destino)])
+        self.fechados = 0
+
+        melhor = 0 if origem == destino else float('inf')
+        encontro = origem
+        while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < melhor:
+            lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[lado])
+            if fechado[lado][u]:
+                continue
+            fechado[lado][u] = True
+            self.fechados += 1
+
+            for r, peso in adjacencia[u]:
+                if d + peso < distancia[lado][r]:
+                    distancia[lado][r] = d + peso
+                    anterior[lado][r] = u
+                    heapq.heappush(heaps[lado], (distancia[lado][r], r))
+
+                # A aresta u-r liga as duas buscas se r já foi alcançado pelo outro lado
+                if d + peso + distancia[1 - lado][r] < melhor:
+                    melhor = d + peso + distancia[1 - lado][r]
+                    encontro = r
+
+        if melhor == float('inf'):
+            return None
+
+        caminho = [encontro]
+        while caminho[-1] != origem:
+            caminho.append(anterior[0][caminho[-1]])
+        caminho.reverse()
+        while caminho[-1] != destino:
+            caminho.append(anterior[1][caminho[-1]])
+        return caminho, melhor
+
+    def __busca_a_estrela(self, origem, destino, heuristica):
+        '''
+        Executa o algoritmo A*, que ordena a fila pela distância já percorrida somada à estimativa da heurística.
+        Um vértice pode ser reaberto se for alcançado depois por um caminho menor, então a resposta é ótima
+        para qualquer heurística admissível (que nunca superestima a distância até o destino).
+        :param origem: O índice do vértice de origem
+        :param destino: O índice do vértice de destino
+        :param heuristica: Uma função heuristica(u, v) que estima a distância entre os vértices u e v
+        :return: Uma tupla (caminho, distancia) com os índices dos vértices do caminho, ou None se não houver caminho
+        '''
+        adjacencia = self.__lista_adjacencia()
+        distancia = [float('inf')] * self.len
+        anterior = [-1] * self.len
+        estimativa = [None] * self.len
+        distancia[origem] = 0
+        self.fechados = 0
+
+        # Entre entradas com a mesma estimativa, a de maior distância percorrida sai primeiro
+        heap = [(heuristica(self.N[origem], self.N[destino]), 0, origem)]
+        while heap:
+            f, d, u = heapq.heappop(heap)
+            d = -d
+            # Entradas de caminhos que já foram superados são descartadas
+            if d > distancia[u]:
+                continue
+            self.fechados += 1
+            if u == destino:
+                caminho = [destino]
+                while caminho[-1] != origem:
+                    caminho.append(anterior[caminho[-1]])
+                caminho.reverse()
+                return caminho, d
+
+            for r, peso in adjacencia[u]:
+                if d + peso < distancia[r]:
+                    distancia[r] = d + peso
+                    anterior[r] = u
+                    if estimativa[r] is None:
+                        estimativa[r] = heuristica(self.N[r], self.N[destino])
+                    heapq.heappush(heap, (distancia[r] + estimativa[r], -distancia[r], r))
+
+        return None
+
+    def distancias(self, origem, destinos=None):
+        '''
+        Calcula, com uma única busca, o caminho mínimo de uma origem até vários destinos.
+        :param origem: O vértice de origem
+        :param destinos: Uma lista com os vértices de destino, ou None para todos os vértices do grafo
+        :return: Um dicionário que associa cada destino a uma tupla (distancia, anterior), onde anterior é o vértice
+        que vem antes do destino no caminho mínimo. Destinos inalcançáveis têm distância infinita e anterior None,
+        assim como a própria origem tem anterior None.
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        if destinos is None:
+            destinos = self.N
+        self.__valida_vertices([origem])
+        self.__valida_vertices(destinos)
+
+        distancia, anterior, fechado = self.__arvore(self.indices[origem], {self.indices[v] for v in destinos})
+
+        tabela = {}
+        for v in destinos:
+            i = self.indices[v]
+            tabela[v] = (distancia[i], self.N[anterior[i]] if anterior[i] != -1 else None)
+        return tabela
+
+    def matriz_distancias(self, origens=None, destinos=None):
+        '''
+        Calcula a tabela de distâncias mínimas entre cada origem e cada destino, com uma busca por origem.
+        A lista de adjacência é montada uma única vez e reaproveitada por todas as buscas.
+        :param origens: Uma lista com os vértices de origem, ou None para todos os vértices do grafo
+        :param destinos: Uma lista com os vértices de destino, ou None para todos os vértices do grafo
+        :return: Uma lista de listas em que a posição [i][j] é a distância de origens[i] até destinos[j],
+        ou infinito se não houver caminho
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        if origens is None:
+            origens = self.N
+        if destinos is None:
+            destinos = self.N
+        self.__valida_vertices(origens)
+        self.__valida_vertices(destinos)
+
+        i_destinos = [self.indices[v] for v in destinos]
+        alvos = set(i_destinos)
+
+        matriz = []
+        for w in origens:
+            distancia, anterior, fechado = self.__arvore(self.indices[w], alvos)
+            matriz.append([distancia[i] for i in i_destinos])
+        return matriz
+
+    def hierarquia_contracao(self, limite_testemunha=50):
+        '''
+        Pré-processa o grafo numa hierarquia de contração, que responde consultas de caminho mínimo fechando
+        poucos vértices. A hierarquia é uma cópia: ela não acompanha vértices ou arestas adicionados depois.
+        :param limite_testemunha: Quantos vértices cada busca por caminhos alternativos pode fechar durante a contração.
+        Valores menores deixam o pré-processamento mais rápido, ao custo de atalhos desnecessários.
+        :return: Um objeto do tipo HierarquiaContracao
+        '''
+        return HierarquiaContracao.constroi(list(self.N), self.__lista_adjacencia(), limite_testemunha)
+
+    def distancias_paralelas(self, origens=None, destinos=None, processos=None, lote=1):
+        '''
+        Calcula as distâncias mínimas de várias origens até os destinos, distribuindo as buscas entre processos.
+        A lista de adjacência é copiada uma única vez para memória compartilhada no formato CSR (início da lista de
+        cada vértice, vizinhos e pesos), e cada tarefa enviada aos processos leva só o índice da origem.
+        :param origens: Uma lista com os vértices de origem, ou None para todos os vértices do grafo
+        :param destinos: Uma lista com os vértices de destino, ou None para todos os vértices do grafo
+        :param processos: O número de processos, ou None para usar o número de CPUs
+        :param lote: Quantas origens são enviadas de uma vez para cada processo
+        :return: Um gerador de tuplas (origem, distancias), onde distancias é a lista das distâncias até cada destino,
+        na ordem de destinos. As tuplas são geradas na ordem em que as buscas terminam.
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        '''
+        if origens is None:
+            origens = self.N
+        if destinos is None:
+            destinos = self.N
+        self.__valida_vertices(origens)
+        self.__valida_vertices(destinos)
+
+        adjacencia = self.__lista_adjacencia()
+        inicio = array('q', [0])
+        vizinhos = array('q')
+        pesos = array('d')
+        for lista in adjacencia:
+            for r, peso in lista:
+                vizinhos.append(r)
+                pesos.append(peso)
+            inicio.append(len(vizinhos))
+
+        blocos = {}
+        try:
+            for chave, dados in (('inicio', inicio), ('vizinhos', vizinhos), ('pesos', pesos)):
+                # Um bloco de memória compartilhada não pode ter tamanho zero
+                blocos[chave] = shared_memory.SharedMemory(create=True, size=max(1, len(dados) * dados.itemsize))
+                blocos[chave].buf[:len(dados) * dados.itemsize] = dados.tobytes()
+
+            descricao = {chave: (blocos[chave].name, len(dados), dados.typecode)
+                         for chave, dados in (('inicio', inicio), ('vizinhos', vizinhos), ('pesos', pesos))}
+            i_destinos = tuple(self.indices[v] for v in destinos)
+
+            with Pool(processos, _inicia_processo, (descricao,)) as pool:
+                tarefas = ((self.indices[w], i_destinos) for w in origens)
+                for origem, distancias in pool.imap_unordered(_busca_compartilhada, tarefas, lote):
+                    yield self.N[origem], distancias
+        finally:
+            for bloco in blocos.values():
+                bloco.close()
+                bloco.unlink()
+
+    def caminho_minimo(self, w, v, modo='dijkstra', heuristica=None):
+        '''
+        Encontra o caminho de menor peso entre dois vértices, usando um heap binário como fila de prioridade.
+        O número de vértices fechados pela busca fica em *fechados*.
+        :param w: O vértice de origem
+        :param v: O vértice de destino
+        :param modo: 'dijkstra' para a busca a partir da origem (que usa o cache, se ativo), 'bidirecional' para buscar
+        ao mesmo tempo a partir da origem e do destino, ou 'a_estrela' para o algoritmo A*
+        :param heuristica: No modo 'a_estrela', uma função heuristica(u, v) que estima a distância entre os vértices
+        u e v sem superestimá-la, por exemplo a distância em linha reta entre as coordenadas dos vértices
+        :return: Uma tupla (caminho, distancia), onde caminho é a lista de vértices de w até v,
+        ou False se não houver caminho entre eles.
+        :raises: VerticeInvalidoException se algum dos vértices não existir no grafo
+        :raises: ValueError se o modo for desconhecido ou se o modo 'a_estrela' for usado sem heurística
+        '''
+        if modo not in ('dijkstra', 'bidirecional', 'a_estrela'):
+            raise ValueError('O modo ' + str(modo) + ' é inválido')
+        if modo == 'a_estrela' and heuristica is None:
+            raise ValueError('O modo a_estrela precisa de uma heurística')
+
+        self.__valida_vertices((w, v))
+        origem = self.indices[w]
+        destino = self.indices[v]
+
+        if modo != 'dijkstra':
+            if modo == 'bidirecional':
+                resultado = self.__busca_bidirecional(origem, destino)
+            else:
+                resultado = self.__busca_a_estrela(origem, destino, heuristica)
+
+            if resultado is None:
                 return False
-            t = dados[v][3]
-            aux.append(t)
-            v = t
+            caminho, distancia = resultado
+            return [self.N[i] for i in caminho], distancia
+
+        distancia, anterior, fechado = self.__arvore(origem, {destino})
+        if not fechado[destino]:
+            return False
+
+        caminho = [destino]
+        while caminho[-1] != origem:
+            caminho.append(anterior[caminho[-1]])
+
+        return [self.N[i] for i in reversed(caminho)], distancia[destino]
+
+    def __arestas_com_consumo(self, consumo):
+        '''
+        Monta a lista de adjacência usada pelo *Dijkstra* com energia, com o peso e o consumo de cada aresta.
+        Arestas paralelas são mantidas, porque uma pode ser mais curta e a outra gastar menos energia.
+        :param consumo: Um dicionário com o consumo de energia de cada aresta, indexado pelo nome da aresta
+        :return: Uma lista em que a posição i tem uma lista de tuplas (índice do vizinho, peso, consumo)
+        :raises: ArestaInvalidaException se algum consumo não for um número não negativo
+        '''
+        arestas = [[] for i in range(self.len)]
+        for nome in self.A:
+            custo = consumo.get(nome, 1)
+            if not Grafo.pesoValido(custo):
+                raise ArestaInvalidaException('O consumo da aresta ' + str(nome) + ' é inválido')
+
+            i_traco = self.A[nome].index(Grafo.SEPARADOR_ARESTA)
+            i_a1 = self.indices[self.A[nome][:i_traco]]
+            i_a2 = self.indices[self.A[nome][i_traco + 1:]]
+            if i_a1 == i_a2:
+                continue
+
+            arestas[i_a1].append((i_a2, self.peso(nome), custo))
+            arestas[i_a2].append((i_a1, self.peso(nome), custo))
+        return arestas
+
+    def Dijkstra(self, w, v, gasosa, postos, capacidade=5, consumo=None):
+        '''
+        Encontra o caminho de menor peso entre dois vértices para um veículo com energia limitada.
+        A busca é feita sobre os pares (vértice, energia restante) com um heap binário. Um rótulo é descartado
+        quando o mesmo vértice já foi fechado com uma distância menor ou igual e pelo menos a mesma energia.
+        Percorrer uma aresta gasta o seu consumo de energia, que não pode ficar negativa, e ao passar por um
+        posto de recarga (inclusive na origem) a energia sobe até a capacidade do tanque; se o veículo tiver mais
+        energia do que isso, ela não muda.
+        :param w: O vértice de origem
+        :param v: O vértice de destino
+        :param gasosa: A energia inicial do veículo
+        :param postos: Os vértices onde o veículo pode recarregar
+        :param capacidade: A energia até a qual um posto recarrega o veículo
+        :param consumo: Um dicionário opcional com o consumo de energia de cada aresta, indexado pelo nome da aresta. Arestas sem consumo gastam 1.
+        :return: Um dicionário com o caminho ('caminho'), a distância percorrida ('distancia'), os postos de recarga
+        por onde o caminho passa ('recargas') e a energia na chegada ('energia'), ou False se não houver caminho possível.
+        :raises: VerticeInvalidoException se a origem, o destino ou algum posto não existir no grafo
+        '''
+        self.__valida_vertices([w, v] + list(postos))
+
+        if consumo is None:
+            consumo = {}
+        recarga = [False] * self.len
+        for p in postos:
+            recarga[self.indices[p]] = True
+
+        origem = self.indices[w]
+        destino = self.indices[v]
+
+        chave = ('energia', origem, gasosa, frozenset(self.indices[p] for p in postos), capacidade, frozenset(consumo.items()))
+        arvore = self.__consulta_cache(chave)
+        if arvore is None:
+            arestas = self.__arestas_com_consumo(consumo)
+            arvore = self.__busca_energia(origem, None if self.__cache is not None else destino,
+                                          gasosa, recarga, capacidade, arestas)
+            self.__guarda_cache(chave, arvore)
+
+        rotulos, primeiro = arvore
+        atual = primeiro[destino]
+        if atual == -1:
+            return False
+
+        caminho = []
+        while atual != -1:
+            caminho.append(rotulos[atual][0])
+            atual = rotulos[atual][2]
+        caminho.reverse()
+
+        return {'caminho': [self.N[i] for i in caminho],
+                'distancia': rotulos[primeiro[destino]][3],
+                'recargas': [self.N[i] for i in caminho[:-1] if recarga[i]],
+                'energia': rotulos[primeiro[destino]][1]}
+
+    def __busca_energia(self, origem, destino, gasosa, recarga, capacidade, arestas):
+        '''
+        Executa a busca do *Dijkstra* com energia sobre os pares (vértice, energia restante).
+        :param origem: O índice do vértice de origem
+        :param destino: O índice do vértice de destino, ou None para percorrer todos os vértices alcançáveis
+        :param gasosa: A energia inicial do veículo
+        :param recarga: Uma lista que indica, para cada índice, se o vértice é um posto de recarga
+        :param capacidade: A energia até a qual um posto recarrega o veículo
+        :param arestas: A lista de adjacência montada por *__arestas_com_consumo*
+        :return: Uma tupla (rotulos, primeiro). Cada rótulo é (índice do vértice, energia, índice do rótulo anterior,
+        distância), e primeiro[i] é o índice do primeiro rótulo fechado no vértice i, o de menor distância, ou -1.
+        '''
+        rotulos = [(origem, max(capacidade, gasosa) if recarga[origem] else gasosa, -1, 0)]
+        primeiro = [-1] * self.len
+        # Maior energia com que cada vértice já foi fechado
+        melhor_energia = [-1] * self.len
+
+        heap = [(0, -rotulos[0][1], 0)]
+        while heap:
+            d, energia, atual = heapq.heappop(heap)
+            u, energia = rotulos[atual][0], -energia
+            if energia <= melhor_energia[u]:
+                continue
+            melhor_energia[u] = energia
+            if primeiro[u] == -1:
+                primeiro[u] = atual
+                if u == destino:
+                    break
+
+            for r, peso, custo in arestas[u]:
+                if custo > energia:
+                    continue
+                restante = max(capacidade, energia - custo) if recarga[r] else energia - custo
+                if restante <= melhor_energia[r]:
+                    continue
+                rotulos.append((r, restante, atual, d + peso))
+                heapq.heappush(heap, (d + peso, -restante, len(rotulos) - 1))
+
+        return rotulos, primeiro
+
+class HierarquiaContracao:
+    '''
+    Hierarquia de contração de um grafo não direcionado com pesos. Cada vértice recebe uma ordem, e para cada vértice
+    são guardadas só as arestas para vértices de ordem maior, incluindo os atalhos criados durante a contração.
+    As arestas ficam em formato CSR: as arestas do vértice i estão nas posições inicio[i] até inicio[i + 1] de
+    alvos, pesos e meios, onde meios guarda o vértice contraído que deu origem ao atalho, ou -1 numa aresta original.
+    Se todos os pesos do grafo forem inteiros, os pesos e as distâncias da hierarquia também são; senão, são reais.
+    '''
+
+    def __init__(self, N, ordem, inicio, alvos, pesos, meios):
+        self.N = N
+        self.indices = {}
+        for i in range(len(N)):
+            self.indices[N[i]] = i
+        self.ordem = ordem
+        self.inicio = inicio
+        self.alvos = alvos
+        self.pesos = pesos
+        self.meios = meios
+
+        # Número de vértices fechados pela última consulta
+        self.fechados = 0
+
+    @classmethod
+    def constroi(cls, N, adjacencia, limite_testemunha=50):
+        '''
+        Contrai os vértices um a um, na ordem dada pela diferença de arestas (atalhos criados menos arestas removidas)
+        somada à profundidade do vértice na hierarquia. As prioridades são recalculadas quando o vértice sai do heap.
+        :param N: A lista dos vértices
+        :param adjacencia: Uma lista em que a posição i tem uma lista de tuplas (índice do vizinho, peso), sem
+        laços e sem arestas paralelas
+        :param limite_testemunha: Quantos vértices cada busca por caminhos alternativos pode fechar
+        :return: Um objeto do tipo HierarquiaContracao
+        '''
+        quantidade = len(N)
+        # Arestas entre os vértices ainda não contraídos: vizinho -> (peso, vértice do meio ou -1)
+        restante = [{r: (peso, -1) for r, peso in adjacencia[v]} for v in range(quantidade)]
+        profundidade = [0] * quantidade
+        subida = [None] * quantidade
+        ordem = array('q', [0] * quantidade)
+
+        heap = []
+        for v in range(quantidade):
+            atalhos = cls.__atalhos(restante, v, limite_testemunha)
+            heap.append((len(atalhos) - len(restante[v]), v))
+        heapq.heapify(heap)
+
+        posicao = 0
+        while heap:
+            prioridade, v = heapq.heappop(heap)
+            atalhos = cls.__atalhos(restante, v, limite_testemunha)
+            prioridade = len(atalhos) - len(restante[v]) + profundidade[v]
+            if heap and prioridade > heap[0][0]:
+                heapq.heappush(heap, (prioridade, v))
+                continue
+
+            ordem[v] = posicao
+            posicao += 1
+
+            # Todos os vizinhos restantes serão contraídos depois de v, então as arestas de v são as de subida
+            subida[v] = restante[v]
+            restante[v] = {}
+            for u in subida[v]:
+                del restante[u][v]
+                profundidade[u] = max(profundidade[u], profundidade[v] + 1)
+            for u, w, peso in atalhos:
+                if peso < restante[u].get(w, (float('inf'), -1))[0]:
+                    restante[u][w] = (peso, v)
+                    restante[w][u] = (peso, v)
+
+        inicio = array('q', [0])
+        alvos = array('q')
+        pesos = []
+        meios = array('q')
+        for v in range(quantidade):
+            for r in sorted(subida[v]):
+                alvos.append(r)
+                pesos.append(subida[v][r][0])
+                meios.append(subida[v][r][1])
+            inicio.append(len(alvos))
+
+        # Os pesos ficam num array de inteiros de 64 bits se todos forem inteiros, para que as distâncias saiam exatas
+        # como em caminho_minimo, e num de números reais se algum não for. Um atalho inteiro que não cabe em 64 bits
+        # faria o array falhar, então aí os pesos continuam numa lista
+        if not all(isinstance(peso, int) for peso in pesos):
+            pesos = array('d', pesos)
+        elif all(-2 ** 63 <= peso < 2 ** 63 for peso in pesos):
+            pesos = array('q', pesos)
+
+        return cls(N, ordem, inicio, alvos, pesos, meios)
+
+    @staticmethod
+    def __atalhos(restante, v, limite_testemunha):
+        '''
+        Calcula os atalhos necessários para contrair um vértice: um atalho u-w é criado quando o caminho u-v-w
+        é menor que qualquer caminho alternativo encontrado pela busca limitada que ignora v.
+        :param restante: As arestas entre os vértices ainda não contraídos
+        :param v: O índice do vértice a ser contraído
+        :param limite_testemunha: Quantos vértices cada busca por caminhos alternativos pode fechar
+        :return: Uma lista de tuplas (u, w, peso)
+        '''
+        vizinhos = [(u, restante[v][u][0]) for u in restante[v]]
+        atalhos = []
+        for k in range(len(vizinhos) - 1):
+            u, peso_u = vizinhos[k]
+            limite = peso_u + max(peso_w for w, peso_w in vizinhos[k + 1:])
+
+            distancia = {u: 0}
+            heap = [(0, u)]
+            fechados = 0
+            while heap and fechados < limite_testemunha:
+                d, x = heapq.heappop(heap)
+                if d > distancia[x]:
+                    continue
+                if d > limite:
+                    break
+                fechados += 1
+                for r in restante[x]:
+                    if r != v and d + restante[x][r][0] < distancia.get(r, float('inf')):
+                        distancia[r] = d + restante[x][r][0]
+                        heapq.heappush(heap, (distancia[r], r))
+
+            for w, peso_w in vizinhos[k + 1:]:
+                if distancia.get(w, float('inf')) > peso_u + peso_w:
+                    atalhos.append((u, w, peso_u + peso_w))
+        return atalhos
+
+    def salva(self, caminho):
+        '''
+        Grava a hierarquia num arquivo.
+        :param caminho: O caminho do arquivo
+        '''
+        with open(caminho, 'wb') as arquivo:
+            pickle.dump({'N': self.N, 'ordem': self.ordem, 'inicio': self.inicio, 'alvos': self.alvos,
+                         'pesos': self.pesos, 'meios': self.meios}, arquivo, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def carrega(cls, caminho):
+        '''
+        Lê uma hierarquia gravada por *salva*. Como o arquivo é lido com pickle, só devem ser abertos arquivos confiáveis.
+        :param caminho: O caminho do arquivo
+        :return: Um objeto do tipo HierarquiaContracao
+        '''
+        with open(caminho, 'rb') as arquivo:
+            dados = pickle.load(arquivo)
+        return cls(dados['N'], dados['ordem'], dados['inicio'], dados['alvos'], dados['pesos'], dados['meios'])
+
+    def __busca(self, origem, destino):
+        '''
+        Faz a busca bidirecional subindo na hierarquia a partir da origem e a partir do destino.
+        :param origem: O índice do vértice de origem
+        :param destino: O índice do vértice de destino
+        :return: Uma tupla (distancia, encontro, anterior), onde encontro é o vértice mais alto do caminho e
+        anterior guarda, para cada lado, o dicionário vértice -> (vértice anterior, meio da aresta usada),
+        ou None se não houver caminho
+        '''
+        distancia = ({origem: 0}, {destino: 0})
+        anterior = ({origem: None}, {destino: None})
+        fechado = (set(), set())
+        heaps = ([(0, origem)], [(0, destino)])
+        self.fechados = 0
+
+        melhor = float('inf')
+        encontro = -1
+        while heaps[0] or heaps[1]:
+            if not heaps[1] or (heaps[0] and heaps[0][0][0] <= heaps[1][0][0]):
+                lado = 0
+            else:
+                lado = 1
+            if heaps[lado][0][0] >= melhor:
+                break
+
+            d, u = heapq.heappop(heaps[lado])
+            if u in fechado[lado]:
+                continue
+            fechado[lado].add(u)
+            self.fechados += 1
+
+            if u in distancia[1 - lado] and d + distancia[1 - lado][u] < melhor:
+                melhor = d + distancia[1 - lado][u]
+                encontro = u
+
+            for k in range(self.inicio[u], self.inicio[u + 1]):
+                r = self.alvos[k]
+                if d + self.pesos[k] < distancia[lado].get(r, float('inf')):
+                    distancia[lado][r] = d + self.pesos[k]
+                    anterior[lado][r] = (u, self.meios[k])
+                    heapq.heappush(heaps[lado], (distancia[lado][r], r))
+
+        if encontro == -1:
+            return None
+        return melhor, encontro, anterior
+
+    def __meio(self, a, b):
+        '''
+        Retorna o vértice do meio da aresta a-b, que fica guardada no vértice de menor ordem.
+        :param a: O índice de um dos vértices
+        :param b: O índice do outro vértice
+        :return: O índice do vértice do meio, ou -1 se a aresta for original
+        '''
+        if self.ordem[a] > self.ordem[b]:
+            a, b = b, a
+        for k in range(self.inicio[a], self.inicio[a + 1]):
+            if self.alvos[k] == b:
+                return self.meios[k]
+        raise ArestaInvalidaException('A aresta entre ' + self.N[a] + ' e ' + self.N[b] + ' não está na hierarquia')
+
+    def __valida_vertices(self, vertices):
+        '''
+        Verifica se todos os vértices passados existem na hierarquia.
+        :param vertices: Os vértices a serem verificados
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        for vertice in vertices:
+            if vertice not in self.indices:
+                raise VerticeInvalidoException('O vértice ' + str(vertice) + ' é inválido')
+
+    def distancia(self, w, v):
+        '''
+        Calcula a distância mínima entre dois vértices, sem montar o caminho.
+        :param w: O vértice de origem
+        :param v: O vértice de destino
+        :return: A distância mínima, inteira se todos os pesos forem inteiros, ou infinito se não houver caminho
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        self.__valida_vertices((w, v))
+        resultado = self.__busca(self.indices[w], self.indices[v])
+        return resultado[0] if resultado is not None else float('inf')
+
+    def caminho_minimo(self, w, v):
+        '''
+        Encontra o caminho mínimo entre dois vértices, desfazendo os atalhos para chegar às arestas originais.
+        :param w: O vértice de origem
+        :param v: O vértice de destino
+        :return: Uma tupla (caminho, distancia), onde caminho é a lista de vértices de w até v,
+        ou False se não houver caminho entre eles.
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        self.__valida_vertices((w, v))
+        resultado = self.__busca(self.indices[w], self.indices[v])
+        if resultado is None:
+            return False
+        melhor, encontro, anterior = resultado
+
+        # Arestas da hierarquia da origem até o encontro e do encontro até o destino
+        arestas = []
+        x = encontro
+        while anterior[0][x] is not None:
+            u, meio = anterior[0][x]
+            arestas.append((u, x, meio))
+            x = u
+        arestas.reverse()
+        x = encontro
+        while anterior[1][x] is not None:
+            u, meio = anterior[1][x]
+            arestas.append((x, u, meio))
+            x = u
+
+        caminho = [self.indices[w]]
+        for a, b, meio in arestas:
+            pilha = [(a, b, meio)]
+            while pilha:
+                a, b, meio = pilha.pop()
+                if meio == -1:
+                    caminho.append(b)
+                else:
+                    pilha.append((meio, b, self.__meio(meio, b)))
+                    pilha.append((a, meio, self.__meio(a, meio)))
+
+        return [self.N[i] for i in caminho], melhor
+
+
+# Lista de adjacência em formato CSR compartilhada com os processos de *distancias_paralelas*
+_compartilhado = {}
+
+
+def _inicia_processo(descricao):
+    '''
+    Liga um processo de *distancias_paralelas* aos blocos de memória compartilhada com a lista de adjacência.
+    :param descricao: Um dicionário que associa cada array ao nome do bloco, ao número de elementos e ao tipo
+    '''
+    for chave, (nome, tamanho, tipo) in descricao.items():
+        bloco = shared_memory.SharedMemory(name=nome)
+        _compartilhado[chave] = bloco
+        _compartilhado[chave + '_dados'] = bloco.buf[:tamanho * array(tipo).itemsize].cast(tipo)
+
+
+def _busca_compartilhada(tarefa):
+    '''
+    Executa o algoritmo de Dijkstra sobre a lista de adjacência compartilhada.
+    :param tarefa: Uma tupla (índice da origem, tupla com os índices dos destinos)
+    :return: Uma tupla (índice da origem, lista com a distância até cada destino)
+    '''
+    origem, destinos = tarefa
+    inicio = _compartilhado['inicio_dados']
+    vizinhos = _compartilhado['vizinhos_dados']
+    pesos = _compartilhado['pesos_dados']
+
+    quantidade = len(inicio) - 1
+    distancia = [float('inf')] * quantidade
+    fechado = [False] * quantidade
+    distancia[origem] = 0.0
+    alvos = set(destinos)
+    faltam = len(alvos)
+
+    heap = [(0.0, origem)]
+    while heap and faltam > 0:
+        d, u = heapq.heappop(heap)
+        if fechado[u]:
+            continue
+        fechado[u] = True
+        if u in alvos:
+            faltam -= 1
+
+        for k in range(inicio[u], inicio[u + 1]):
+            r = vizinhos[k]
+            if d + pesos[k] < distancia[r]:
+                distancia[r] = d + pesos[k]
+                heapq.heappush(heap, (distancia[r], r))
+
+    return origem, [distancia[i] for i in destinos]
 
-        for i in aux[::-1]:
-            print(i, end=' ')
-            if (i != u):
-                print("-", end=' ')
-        print()
 
 # ======================================================================================================================
 #                                                       TESTE
 # ======================================================================================================================
 
 
-grafo = Grafo(['A','B','C','D','E','F','G','H','I','J','K','L','M','N','O','P','Q','R','S','T','U','V','X','W','Y','Z','a','b','c','d','e','f','g'],
-              {'a0': 'A-B', 'a1': 'A-C', 'a2': 'A-D', 'a3': 'B-C', 'a4': 'B-E', 'a5': 'C-F', 'a6': 'D-H', 'a7': 'D-L',
-               'a8': 'E-I', 'a9': 'E-F', 'a10': 'F-G', 'a11': 'F-J', 'a12': 'F-K', 'a13': 'G-K', 'a14': 'G-D',
-               'a15': 'H-G', 'a16': 'I-M', 'a17': 'J-N', 'a18': 'K-L', 'a19': 'K-O', 'a20': 'L-P', 'a21': 'M-Q',
-               'a22': 'N-R', 'a23': 'O-R', 'a24': 'O-Q', 'a25': 'O-S', 'a26': 'P-R', 'a27': 'P-T', 'a28': 'R-U',
-               'a29': 'R-S', 'a30': 'S-W', 'a31': 'S-T', 'a32': 'T-X', 'a33': 'U-Y', 'a34': 'U-Z', 'a35': 'V-R',
-               'a36': 'W-V', 'a37': 'W-a', 'a38': 'W-b', 'a39': 'X-b', 'a40': 'X-c', 'a41': 'Z-e', 'a42': 'c-f',
-               'a43': 'f-e', 'a44': 'e-d', 'a45': 'e-g'})
+# Os processos de distancias_paralelas importam este módulo, então o exemplo só roda quando ele é executado diretamente
+if __name__ == '__main__':
+    grafo = Grafo(['A','B','C','D','E','F','G','H','I','J','K','L','M','N','O','P','Q','R','S','T','U','V','X','W','Y','Z','a','b','c','d','e','f','g'],
+                  {'a0': 'A-B', 'a1': 'A-C', 'a2': 'A-D', 'a3': 'B-C', 'a4': 'B-E', 'a5': 'C-F', 'a6': 'D-H', 'a7': 'D-L',
+                   'a8': 'E-I', 'a9': 'E-F', 'a10': 'F-G', 'a11': 'F-J', 'a12': 'F-K', 'a13': 'G-K', 'a14': 'G-D',
+                   'a15': 'H-G', 'a16': 'I-M', 'a17': 'J-N', 'a18': 'K-L', 'a19': 'K-O', 'a20': 'L-P', 'a21': 'M-Q',
+                   'a22': 'N-R', 'a23': 'O-R', 'a24': 'O-Q', 'a25': 'O-S', 'a26': 'P-R', 'a27': 'P-T', 'a28': 'R-U',
+                   'a29': 'R-S', 'a30': 'S-W', 'a31': 'S-T', 'a32': 'T-X', 'a33': 'U-Y', 'a34': 'U-Z', 'a35': 'V-R',
+                   'a36': 'W-V', 'a37': 'W-a', 'a38': 'W-b', 'a39': 'X-b', 'a40': 'X-c', 'a41': 'Z-e', 'a42': 'c-f',
+                   'a43': 'f-e', 'a44': 'e-d', 'a45': 'e-g'})
 
 
-inicio = 'A'
+    inicio = 'A'
 
-fim = 'd'
+    fim = 'd'
 
-pontos_de_recarga = ['I', 'R', 'X', 'f']
+    pontos_de_recarga = ['I', 'R', 'X', 'f']
 
-energia_inicial = 3
+    energia_inicial = 3
 
-grafo.Dijkstra(inicio, fim, energia_inicial, pontos_de_recarga)
\ No newline at end of file
+    rota = grafo.Dijkstra(inicio, fim, energia_inicial, pontos_de_recarga)
+    if rota:
+        print(' - '.join(rota['caminho']))
+        print('Recargas:', rota['recargas'])
+    else:
+        print("Nao a caminho possivel :(")
@@ -1,3 +1,7 @@
+import heapq
+from array import array
+from collections import deque
+
 class VerticeInvalidoException(Exception):
     pass
 
@@ -20,7 +24,8 @@ class Grafo:
         Constrói um objeto do tipo Grafo. Se nenhum parâmetro for passado, cria um Grafo vazio.
         Se houver alguma aresta ou algum vértice inválido, uma exceção é lançada.
         :param V: Uma lista dos vértices (ou nodos) do grafo.
-        :param V: Uma matriz de adjacência que guarda as arestas do grafo. Cada entrada da matriz tem um inteiro que indica a quantidade de arestas que ligam aqueles vértices
+        :param A: Um dicionário com as arestas do grafo. Cada valor é uma tupla ('X-Y', peso); a matriz guarda em M[X][Y] o menor peso entre as arestas de X para Y.
+        :raises: ArestaInvalidaException se alguma aresta ligar vértices que não existem no grafo
         '''
 
         if V == None:
@@ -33,46 +38,105 @@ class Grafo:
                 self.__maior_vertice = len(v)
 
         self.N = list(V)
-        M = []
-
-        for k in range(len(V)):
-            M.append(list())
-            for l in range(len(V)):
-                cond = False
-                for j in A.values():
-                    if j[0][0] == V[k] and j[0][-1] == V[l]:
-                        try:
-                            if M[k][l] > j[1]:
-                                M[k][l] = j[1]
-                        except:
-                            M[k].append(j[1])
-                        cond = True
-                if not cond:
-                    M[k].append(0)
-        self.M = M
 
-        if len(M) != len(V):
-            raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+        # Associa o nome de cada vértice ao seu índice na lista de vértices
+        self.indices = {}
+        for i in range(len(self.N)):
+            if self.N[i] not in self.indices:
+                self.indices[self.N[i]] = i
 
-        for c in M:
-            if len(c) != len(V):
-                raise MatrizInvalidaException('A matriz passada como parâmetro não tem o tamanho correto')
+        self.len = len(self.N)
+        self.A = A
+        self.__monta_matriz()
 
-        for i in range(len(V)):
-            for j in range(len(V)):
-                '''
-                Verifica se os índices passados como parâmetro representam um elemento da matriz abaixo da diagonal principal.
-                Além disso, verifica se o referido elemento é um traço "-". Isso indica que a matriz é não direcionada e foi construída corretamente.
-                '''
-                # if i>j and not(M[i][j] == '-'):
-                #     raise MatrizInvalidaException('A matriz não representa uma matriz não direcionada')
+        # Floresta de conjuntos disjuntos com as componentes conexas, atualizada a cada aresta adicionada.
+        # As arestas são tratadas como não direcionadas, como em kruskall
+        self.__pai = list(range(self.len))
+        self.__tamanho = [1] * self.len
+        self.__quantidade_componentes = len(self.indices)
+        self.__componentes_desatualizadas = True
 
-                aresta = V[i] + Grafo.SEPARADOR_ARESTA + V[j]
+    def __par(self, aresta):
+        '''
+        Encontra os índices dos vértices de uma aresta no formato X-Y.
+        :param aresta: A aresta
+        :return: Uma tupla (índice de X, índice de Y)
+        :raises: ArestaInvalidaException se a aresta não estiver no formato X-Y ou ligar vértices que não existem no grafo
+        '''
+        i_traco = aresta.find(Grafo.SEPARADOR_ARESTA)
+        if i_traco == -1 or aresta[:i_traco] not in self.indices or aresta[i_traco + 1:] not in self.indices:
+            raise ArestaInvalidaException('A aresta ' + str(aresta) + ' é inválida')
+        return self.indices[aresta[:i_traco]], self.indices[aresta[i_traco + 1:]]
+
+    @staticmethod
+    def __cabe_em_64_bits(peso):
+        '''
+        Verifica se um peso inteiro cabe num elemento de um array('q').
+        :param peso: O peso inteiro
+        :return: Um valor booleano
+        '''
+        return -2 ** 63 <= peso < 2 ** 63
+
+    def __monta_matriz(self):
+        '''
+        Monta a matriz de pesos percorrendo as arestas de A uma única vez.
+        :raises: ArestaInvalidaException se alguma aresta ligar vértices que não existem no grafo
+        '''
+        # Guarda o menor peso de cada par ordenado de vértices
+        menores = {}
+        inteiros = True
+        grandes = False
+        for nome in self.A:
+            aresta, peso = self.A[nome]
+            par = self.__par(aresta)
+            if par not in menores or peso < menores[par]:
+                menores[par] = peso
+            if not isinstance(peso, int):
+                inteiros = False
+            elif not Grafo.__cabe_em_64_bits(peso):
+                grandes = True
+
+        # Cada linha da matriz é um array de inteiros de 64 bits, ou de números reais se algum peso não for inteiro.
+        # Um peso inteiro que não cabe em 64 bits faria o array perder precisão ou falhar, então aí as linhas são listas
+        if grandes:
+            M = [[0] * len(self.N) for k in range(len(self.N))]
+        else:
+            linha_vazia = array('q' if inteiros else 'd', [0]) * len(self.N)
+            M = [array(linha_vazia.typecode, linha_vazia) for k in range(len(self.N))]
+        for (k, l), peso in menores.items():
+            M[k][l] = peso
 
         self.M = M
-        self.len = len(self.N)
-        self.A = A
-        self.Cond = True
+
+    def adicionaAresta(self, nome, a, peso=1):
+        '''
+        Adiciona uma aresta ao grafo, atualizando a matriz de pesos e as componentes conexas sem percorrer o grafo.
+        Se já existir uma aresta com o mesmo nome, ela é substituída.
+        :param nome: O nome da aresta
+        :param a: A aresta no formato X-Y
+        :param peso: O peso da aresta
+        :raises: ArestaInvalidaException se a aresta ligar vértices que não existem no grafo
+        '''
+        i, j = self.__par(a)
+
+        if nome in self.A:
+            # A aresta antiga pode ser a de menor peso entre os vértices ou a única que liga duas componentes
+            self.A[nome] = (a, peso)
+            self.__monta_matriz()
+            self.__componentes_desatualizadas = True
+            return
+
+        self.A[nome] = (a, peso)
+        if isinstance(self.M[i], array):
+            if isinstance(peso, int) and not Grafo.__cabe_em_64_bits(peso):
+                self.M = [list(linha) for linha in self.M]
+            elif not isinstance(peso, int) and self.M[i].typecode == 'q':
+                self.M = [array('d', linha) for linha in self.M]
+        if self.M[i][j] == 0 or peso < self.M[i][j]:
+            self.M[i][j] = peso
+
+        if not self.__componentes_desatualizadas:
+            self.__liga(i, j)
 
     def __str__(self):
         '''
@@ -85,24 +149,83 @@ class Grafo:
 
         return self.tostring(self.M)
 
-    def dfsAux(self, d, lista, arestasv, matriz):
-        aux = self.arestas_sobre_vertice(d, matriz)
-        for aresta in aux:
-            if aresta[-1] not in lista:
-                lista.append(aresta[-1])
-                self.dfsAux(aresta[-1], lista, arestasv, matriz)
+    def __vizinhos(self, i):
+        '''
+        Gera os índices dos vértices que recebem uma aresta saindo do vértice de índice i.
+        :param i: O índice do vértice.
+        '''
+        linha = self.M[i]
+        for j in range(self.len):
+            if linha[j] > 0:
+                yield j
+
+    def iter_dfs(self, d):
+        '''
+        Gera os vértices da busca em profundidade à medida que são descobertos, usando uma pilha explícita.
+        :param d: O vértice de onde a busca começa.
+        :return: Um gerador de tuplas (vertice, aresta), onde aresta é a aresta no formato X-Y usada para
+        chegar ao vértice, ou None para o vértice inicial.
+        '''
+        visitado = [False] * self.len
+        visitado[self.indices[d]] = True
+        yield d, None
+
+        # Cada elemento da pilha percorre os vizinhos de um vértice do caminho atual
+        pilha = [(self.indices[d], self.__vizinhos(self.indices[d]))]
+        while pilha:
+            pai, vizinhos = pilha[-1]
+            for j in vizinhos:
+                if not visitado[j]:
+                    visitado[j] = True
+                    yield self.N[j], "%s%s%s" % (self.N[pai], self.SEPARADOR_ARESTA, self.N[j])
+                    pilha.append((j, self.__vizinhos(j)))
+                    break
+            else:
+                pilha.pop()
+
+    def iter_bfs(self, d):
+        '''
+        Gera os vértices da busca em largura à medida que são descobertos.
+        :param d: O vértice de onde a busca começa.
+        :return: Um gerador de tuplas (vertice, aresta), onde aresta é a aresta no formato X-Y usada para
+        chegar ao vértice, ou None para o vértice inicial.
+        '''
+        visitado = [False] * self.len
+        visitado[self.indices[d]] = True
+        yield d, None
+
+        fila = deque([self.indices[d]])
+        while fila:
+            pai = fila.popleft()
+            for j in self.__vizinhos(pai):
+                if not visitado[j]:
+                    visitado[j] = True
+                    yield self.N[j], "%s%s%s" % (self.N[pai], self.SEPARADOR_ARESTA, self.N[j])
+                    fila.append(j)
 
     def dfs(self, d, matriz):
-        lista = [d]
-        self.dfsAux(d, lista, [], matriz)
-        return lista
+        '''
+        Faz a busca em profundidade a partir de um vértice.
+        :param d: O vértice de onde a busca começa.
+        :param matriz: Mantido por compatibilidade; a busca usa a matriz do grafo.
+        :return: Uma lista com os vértices na ordem em que foram visitados.
+        '''
+        return [v for v, aresta in self.iter_dfs(d)]
 
     def conexo(self, inicio, matriz):
-        a = self.dfs(inicio, matriz)
-        for i in self.N:
-            if i not in a:
-                return False
-        return True
+        '''
+        Verifica se todos os vértices são alcançáveis a partir de inicio.
+        A busca para assim que todos os vértices forem alcançados.
+        :param inicio: O vértice de onde a busca começa.
+        :param matriz: Mantido por compatibilidade; a busca usa a matriz do grafo.
+        :return: Um valor booleano.
+        '''
+        alcancados = 0
+        for v, aresta in self.iter_dfs(inicio):
+            alcancados += 1
+            if alcancados == self.len:
+                return True
+        return False
 
     def copy(self, m):
         aux = []
@@ -114,7 +237,7 @@ class Grafo:
 
     def arestas_sobre_vertice(self, d, matriz):
         lista = []
-        aux = self.N.index(d)
+        aux = self.indices[d]
         for i in range(self.len):
             if self.M[aux][i] > 0:
                 lista.append("%s-%s" % (d, self.N[i]))
@@ -137,12 +260,13 @@ class Grafo:
         for l in range(self.len):
             grafo_str += self.N[l] + ' '
             for c in range(self.len):
-                grafo_str += str(matriz[l][c]) + ' '
+                # Posições sem aresta aparecem como 0 também nas matrizes de números reais
+                grafo_str += (str(matriz[l][c]) if matriz[l][c] != 0 else '0') + ' '
             grafo_str += '\n'
         return grafo_str
 
     def grau(self, d):
-        aux = self.N.index(d)
+        aux = self.indices[d]
         soma = 0
         for i in range(self.len):
             if i > aux:
@@ -155,67 +279,87 @@ class Grafo:
     #                                                       ROTEIRO 8
     # ======================================================================================================================
 
-    def verticeNaArvore(self, ind, matriz):
-
-        cond = False
-        for i in range(self.len):
-            if matriz[i][self.N.index(ind)] > 0 or matriz[self.N.index(ind)][i] > 0:
-                cond = True
-        return cond
-
-    def adicionarAresta(self, inicio, fim, matriz):
-
-        matriz[self.N.index(inicio)][self.N.index(fim)] = self.M[self.N.index(inicio)][self.N.index(fim)]
-
-    def arestas_fora_da_arvore(self, matriz):
-        aux = []
-        for i in self.N:
-            if self.Cond:
-                self.Cond = False
-                for p in self.arestas_sobre_vertice(i, self.M):
-                    aux.append(p)
-                break
-            if self.verticeNaArvore(i, matriz):
-                for p in self.arestas_sobre_vertice(i, self.M):
-                    if not self.aresta_na_matriz(p, matriz):
-                        aux.append(p)
-        return aux
-
-    def aresta_na_matriz(self, i, matriz):
-        cond = False
-        if matriz[self.N.index(i[0])][self.N.index(i[-1])] > 0:
-            cond = True
-        return cond
+    def __arestas(self):
+        '''
+        Lê as arestas de A, cujos valores são tuplas ('X-Y', peso).
+        :return: Uma lista de tuplas (índice de X, índice de Y, peso) na ordem de A
+        '''
+        arestas = []
+        for nome in self.A:
+            aresta, peso = self.A[nome]
+            i_traco = aresta.index(Grafo.SEPARADOR_ARESTA)
+            arestas.append((self.indices[aresta[:i_traco]], self.indices[aresta[i_traco + 1:]], peso))
+        return arestas
 
+    def __resultado_arvore(self, arvore, tostring):
+        '''
+        Formata as arestas de uma árvore geradora.
+        :param arvore: Uma lista de tuplas (índice de X, índice de Y, peso)
+        :param tostring: Se verdadeiro, retorna a matriz da árvore formatada por *tostring*
+        :return: Uma tupla (arestas, peso total), onde arestas é uma lista de tuplas ('X-Y', peso), ou a matriz formatada
+        '''
+        if tostring:
+            matriz = [[0] * self.len for i in range(self.len)]
+            for i, j, peso in arvore:
+                matriz[i][j] = peso
+            return self.tostring(matriz)
 
-    def prim_recurcivo(self, u, matriz):
+        arestas = []
+        total = 0
+        for i, j, peso in arvore:
+            arestas.append(("%s%s%s" % (self.N[i], Grafo.SEPARADOR_ARESTA, self.N[j]), peso))
+            total += peso
+        return arestas, total
 
-        for i in self.arestas_fora_da_arvore(matriz):
-            menoraresta = ''
-            menorpeso = float("inf")
-            if not self.verticeNaArvore(i[-1], matriz) and u == i[0]:
-                peso = matriz[self.N.index(u)][self.N.index(i[-1])]
-                if peso < menorpeso:
-                    menorpeso = peso
-                    menoraresta = i
-                self.adicionarAresta(menoraresta[0], menoraresta[-1], matriz)
-                self.prim_recurcivo(menoraresta[-1], matriz)
+    def Prim(self, inicio, tostring=False):
+        '''
+        Encontra a árvore geradora mínima da componente de inicio com o algoritmo de Prim, usando um heap com as arestas
+        que saem da árvore. As arestas são tratadas como não direcionadas; laços são ignorados.
+        :param inicio: O vértice onde a árvore começa
+        :param tostring: Se verdadeiro, retorna a matriz da árvore formatada por *tostring*
+        :return: Uma tupla (arestas, peso total), onde arestas é a lista de tuplas ('X-Y', peso) na ordem em que
+        entraram na árvore, com X e Y na ordem em que a aresta foi declarada, ou a matriz formatada
+        :raises: VerticeInvalidoException se o vértice inicial não existir no grafo
+        '''
+        if inicio not in self.indices:
+            raise VerticeInvalidoException('O vértice ' + str(inicio) + ' é inválido')
+
+        arestas = self.__arestas()
+        incidentes = [[] for i in range(self.len)]
+        for k in range(len(arestas)):
+            i, j, peso = arestas[k]
+            if i != j:
+                incidentes[i].append(k)
+                incidentes[j].append(k)
+
+        na_arvore = [False] * self.len
+        raiz = self.indices[inicio]
+        na_arvore[raiz] = True
+
+        # Cada entrada do heap é (peso, índice da aresta, vértice que a aresta alcança)
+        heap = []
+        for k in incidentes[raiz]:
+            i, j, peso = arestas[k]
+            heap.append((peso, k, j if i == raiz else i))
+        heapq.heapify(heap)
+
+        arvore = []
+        while heap and len(arvore) < self.len - 1:
+            peso, k, v = heapq.heappop(heap)
+            if na_arvore[v]:
+                continue
+            na_arvore[v] = True
+            arvore.append(arestas[k])
 
-    def Prim(self, inicio):
+            for k in incidentes[v]:
+                i, j, peso = arestas[k]
+                r = j if i == v else i
+                if not na_arvore[r]:
+                    heapq.heappush(heap, (peso, k, r))
 
-        # Função que inicia e implanta as variaveis necessarias para a recursividade de prim
+        return self.__resultado_arvore(arvore, tostring)
 
-        Matriz_temp = []
-        for i in range(self.len):
-            Matriz_temp.append([])
-            for p in range(self.len):
-                Matriz_temp[i].append(0)
-
-        self.Cond = True
-        self.prim_recurcivo(inicio, Matriz_temp)
-        return self.tostring(Matriz_temp)
-
-    def ModifiedPrim(self):
+    def ModifiedPrim(self, tostring=False):
         # Prim começando do vertice com menor peso
         menorEdge = ''
         menorgrau = float("inf")
@@ -228,60 +372,120 @@ class Grafo:
         if menorgrau == 0:
             return "Nao a spanning tree"
 
-        return self.Prim(menorEdge)
-
-    def kruskall(self):
+        return self.Prim(menorEdge, tostring)
 
-        Matriz_temp = []
-        for i in range(self.len):
-            Matriz_temp.append([])
-            for p in range(self.len):
-                Matriz_temp[i].append(0)
+    def __raiz(self, pai, x):
+        '''
+        Encontra o representante do conjunto de x numa floresta de conjuntos disjuntos, comprimindo o caminho percorrido.
+        :param pai: A lista com o pai de cada elemento
+        :param x: O elemento
+        :return: O representante do conjunto
+        '''
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    def __une(self, pai, tamanho, a, b):
+        '''
+        Une os conjuntos de a e b, pendurando o menor conjunto no maior.
+        :param pai: A lista com o pai de cada elemento
+        :param tamanho: A lista com o tamanho do conjunto de cada representante
+        :param a: Um elemento
+        :param b: Outro elemento
+        :return: False se a e b já estavam no mesmo conjunto, True caso contrário
+        '''
+        a = self.__raiz(pai, a)
+        b = self.__raiz(pai, b)
+        if a == b:
+            return False
+        if tamanho[a] < tamanho[b]:
+            a, b = b, a
+        pai[b] = a
+        tamanho[a] += tamanho[b]
+        return True
 
-        # separação e sort das arestas
-        lista = []
-        while len(lista) < len(self.A.values()):
-            maior = float("inf")
-            tmaior = []
-            for i in self.A.values():
-                if i[1] < maior and list(i) not in lista:
-                    maior = i[1]
-                    tmaior = list(i)
-
-            lista.append(tmaior)
-
-        # Raizes das arvores
-        Arvores = []
-        for i in self.N:
-            Arvores.append([i])
+    def __liga(self, a, b):
+        '''
+        Une as componentes conexas dos vértices de índices a e b.
+        :param a: O índice de um dos vértices
+        :param b: O índice do outro vértice
+        '''
+        if self.__une(self.__pai, self.__tamanho, a, b):
+            self.__quantidade_componentes -= 1
 
-        for i in lista:
+    def __atualiza_componentes(self):
+        '''
+        Monta a floresta de componentes a partir das arestas de A, se ela ainda não foi montada ou se alguma aresta foi
+        substituída desde a última vez. Depois disso, cada aresta adicionada só une duas componentes.
+        '''
+        if not self.__componentes_desatualizadas:
+            return
+        self.__pai = list(range(self.len))
+        self.__tamanho = [1] * self.len
+        self.__quantidade_componentes = len(self.indices)
+        for i, j, peso in self.__arestas():
+            self.__liga(i, j)
+        self.__componentes_desatualizadas = False
+
+    def componentes(self):
+        '''
+        Rotula cada vértice com o número da sua componente conexa, tratando as arestas como não direcionadas.
+        As componentes são numeradas na ordem em que aparece o primeiro vértice de cada uma na lista de vértices.
+        :return: Uma tupla (rotulos, tamanhos), onde rotulos é um dicionário que associa cada vértice ao número da sua
+        componente e tamanhos[c] é a quantidade de vértices da componente c.
+        '''
+        self.__atualiza_componentes()
+        rotulos = {}
+        tamanhos = []
+        numeros = {}
+        for v in self.N:
+            raiz = self.__raiz(self.__pai, self.indices[v])
+            if raiz not in numeros:
+                numeros[raiz] = len(tamanhos)
+                tamanhos.append(self.__tamanho[raiz])
+            rotulos[v] = numeros[raiz]
+        return rotulos, tamanhos
+
+    def mesma_componente(self, u, v):
+        '''
+        Verifica se existe um caminho entre dois vértices, tratando as arestas como não direcionadas.
+        :param u: Um vértice
+        :param v: Outro vértice
+        :return: Um valor booleano
+        :raises: VerticeInvalidoException se algum dos vértices não existir
+        '''
+        for x in (u, v):
+            if x not in self.indices:
+                raise VerticeInvalidoException('O vértice ' + str(x) + ' é inválido')
+        self.__atualiza_componentes()
+        return self.__raiz(self.__pai, self.indices[u]) == self.__raiz(self.__pai, self.indices[v])
 
-            for o in range(len(Arvores)):
+    def kruskall(self, tostring=False):
+        '''
+        Encontra a floresta geradora mínima com o algoritmo de Kruskal: as arestas são ordenadas uma única vez pelo peso
+        e cada uma entra na floresta se ligar dois conjuntos diferentes de uma floresta de conjuntos disjuntos.
+        As arestas são tratadas como não direcionadas; laços são ignorados.
+        :param tostring: Se verdadeiro, retorna a matriz da floresta formatada por *tostring*
+        :return: Uma tupla (arestas, peso total), onde arestas é a lista de tuplas ('X-Y', peso) em ordem crescente
+        de peso, com X e Y na ordem em que a aresta foi declarada, ou a matriz formatada
+        '''
+        arestas = self.__arestas()
+        arestas.sort(key=lambda aresta: aresta[2])
 
-                if i[0][0] in Arvores[o]:
-                    break
+        pai = list(range(self.len))
+        tamanho = [1] * self.len
 
-            for p in range(len(Arvores)):
-                if i[0][-1] in Arvores[p]:
+        floresta = []
+        for aresta in arestas:
+            if self.__une(pai, tamanho, aresta[0], aresta[1]):
+                floresta.append(aresta)
+                if len(floresta) == self.len - 1:
                     break
 
-            if o == p:
-                continue
-
-            for j in Arvores[p]:
-                Arvores[o].append(j)
-            Arvores[o].append(i)
-
-            del Arvores[p]
-
-        arestas = []
-        for i in Arvores[0]:
-
-            if len(i) > 1:
-                self.adicionarAresta(i[0][0], i[0][-1], Matriz_temp)
-
-        return self.tostring(Matriz_temp)
+        return self.__resultado_arvore(floresta, tostring)
 
 
 # ======================================================================================================================
@@ -308,4 +512,4 @@ g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
             {'a1': ('J-C', 1), 'a2': ('C-E', 5), 'a3': ('C-E', 2), 'a4': ('C-P', 1), 'a5': ('C-P', 2),
              'a6': ('C-M', 3), 'a7': ('C-T', 2), 'a8': ('M-T', 1), 'a9': ('T-Z', 1)})
 
-print(g_p.ModifiedPrim())
+print(g_p.ModifiedPrim(tostring=True))
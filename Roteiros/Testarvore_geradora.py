@@ -0,0 +1,86 @@
+import unittest
+from Roteiro_8 import Grafo, VerticeInvalidoException, ArestaInvalidaException
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba com pesos e arestas paralelas
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
+                         {'a1': ('J-C', 1), 'a2': ('C-E', 5), 'a3': ('C-E', 2), 'a4': ('C-P', 1), 'a5': ('C-P', 2),
+                          'a6': ('C-M', 3), 'a7': ('C-T', 2), 'a8': ('M-T', 1), 'a9': ('T-Z', 1)})
+
+        # Grafo desconexo com laço
+        self.g_d = Grafo(['A', 'B', 'C', 'D'], {'a1': ('A-A', 1), 'a2': ('A-B', 4), 'a3': ('C-D', 2)})
+
+    def test_matriz(self):
+        # Entre as arestas paralelas C-E e C-P fica o menor peso, só na direção declarada
+        self.assertEqual(list(self.g_p.M[1]), [0, 0, 2, 1, 3, 2, 0])
+        self.assertEqual(list(self.g_p.M[2]), [0] * 7)
+        self.assertEqual(self.g_p.M[0].typecode, 'q')
+
+        g = Grafo(['AB', 'CD'], {'a1': ('AB-CD', 2.5), 'a2': ('AB-CD', 4)})
+        self.assertEqual(g.M[0].typecode, 'd')
+        self.assertEqual(list(g.M[0]), [0, 2.5])
+        self.assertEqual(str(g), '   AB CD\nAB 0 2.5 \nCD 0 0 \n')
+
+        with self.assertRaises(ArestaInvalidaException):
+            Grafo(['A', 'B'], {'a1': ('A-C', 1)})
+
+    def test_matriz_pesos_grandes(self):
+        # Pesos inteiros fora dos 64 bits ficam em listas, sem perder precisão
+        g = Grafo(['A', 'B', 'C'], {'a1': ('A-B', 2 ** 70), 'a2': ('B-C', 1)})
+        self.assertEqual(g.M[0], [0, 2 ** 70, 0])
+        self.assertEqual(g.kruskall(), ([('B-C', 1), ('A-B', 2 ** 70)], 2 ** 70 + 1))
+
+        g = Grafo(['A', 'B', 'C'], {'a1': ('A-B', 3), 'a2': ('B-C', 1), 'a3': ('C-A', 2 ** 63)})
+        self.assertEqual(g.M[2], [2 ** 63, 0, 0])
+        self.assertEqual(g.Prim('A'), ([('A-B', 3), ('B-C', 1)], 4))
+
+        # adicionaAresta troca as linhas pela forma mais larga quando o peso exige
+        g = Grafo(['A', 'B', 'C'], {'a1': ('A-B', 3), 'a2': ('B-C', 1)})
+        g.adicionaAresta('a3', 'C-A', 2 ** 63)
+        self.assertEqual(list(g.M[2]), [2 ** 63, 0, 0])
+        g.adicionaAresta('a4', 'C-A', 0.5)
+        self.assertEqual(g.Prim('A'), ([('C-A', 0.5), ('B-C', 1)], 1.5))
+
+    def test_prim(self):
+        self.assertEqual(self.g_p.Prim('J'),
+                         ([('J-C', 1), ('C-P', 1), ('C-E', 2), ('C-T', 2), ('M-T', 1), ('T-Z', 1)], 8))
+        self.assertEqual(self.g_p.Prim('Z')[1], 8)
+        self.assertEqual(self.g_d.Prim('A'), ([('A-B', 4)], 4))
+        self.assertEqual(self.g_d.Prim('D'), ([('C-D', 2)], 2))
+
+    def test_prim_tostring(self):
+        self.assertEqual(self.g_d.Prim('A', tostring=True),
+                         '  A B C D\nA 0 4 0 0 \nB 0 0 0 0 \nC 0 0 0 0 \nD 0 0 0 0 \n')
+        self.assertEqual(self.g_p.ModifiedPrim(), self.g_p.Prim('J'))
+
+    def test_prim_vertice_invalido(self):
+        with self.assertRaises(VerticeInvalidoException):
+            self.g_p.Prim('X')
+
+    def test_kruskall(self):
+        self.assertEqual(self.g_p.kruskall(),
+                         ([('J-C', 1), ('C-P', 1), ('M-T', 1), ('T-Z', 1), ('C-E', 2), ('C-T', 2)], 8))
+        # Floresta geradora de um grafo desconexo
+        self.assertEqual(self.g_d.kruskall(), ([('C-D', 2), ('A-B', 4)], 6))
+        self.assertEqual(self.g_p.kruskall(tostring=True), self.g_p.Prim('J', tostring=True))
+
+    def test_componentes(self):
+        self.assertEqual(self.g_d.componentes(), ({'A': 0, 'B': 0, 'C': 1, 'D': 1}, [2, 2]))
+        self.assertTrue(self.g_d.mesma_componente('D', 'C'))
+        self.assertFalse(self.g_d.mesma_componente('A', 'D'))
+
+        self.g_d.adicionaAresta('a4', 'D-B', 2.5)
+        self.assertEqual(self.g_d.componentes(), ({'A': 0, 'B': 0, 'C': 0, 'D': 0}, [4]))
+        self.assertEqual(self.g_d.kruskall(), ([('C-D', 2), ('D-B', 2.5), ('A-B', 4)], 8.5))
+
+        # Substituir a única aresta entre as duas metades separa o grafo de novo
+        self.g_d.adicionaAresta('a4', 'A-A', 1)
+        self.assertEqual(self.g_d.componentes()[1], [2, 2])
+        self.assertEqual(list(self.g_d.M[3]), [0, 0, 0, 0])
+
+        with self.assertRaises(ArestaInvalidaException):
+            self.g_d.adicionaAresta('a5', 'A-X')
+        with self.assertRaises(VerticeInvalidoException):
+            self.g_d.mesma_componente('A', 'X')
@@ -0,0 +1,55 @@
+import unittest
+from Roteiro_3 import Grafo
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo da Paraíba, com arestas paralelas entre C e E
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
+                         {'a1': 'J-C', 'a2': 'C-E', 'a3': 'C-E', 'a4': 'C-P', 'a6': 'C-M', 'a7': 'C-T', 'a8': 'M-T', 'a9': 'T-Z'})
+
+        # Árvore
+        self.g_a = Grafo(['A', 'B', 'C', 'D'], {'a1': 'A-B', 'a2': 'B-C', 'a3': 'B-D'})
+
+        # Grafo só com um laço
+        self.g_l = Grafo(['A', 'B'], {'a1': 'A-A'})
+
+    def test_ha_ciclo(self):
+        self.assertEqual(self.g_l.ha_ciclo(), ['A', 'a1', 'A'])
+        self.assertEqual(self.g_p.ha_ciclo(), ['C', 'a2', 'E', 'a3', 'C'])
+        self.assertFalse(self.g_a.ha_ciclo())
+
+    def test_ha_ciclo_paralelas(self):
+        g = Grafo(['A', 'B'], {'a1': 'A-B', 'a2': 'B-A'})
+        self.assertEqual(g.ha_ciclo(), ['A', 'a1', 'B', 'a2', 'A'])
+
+    def test_base_de_ciclos(self):
+        self.assertEqual(self.g_a.ha_ciclo(base=True), [])
+        self.assertEqual(self.g_l.ha_ciclo(base=True), [['A', 'a1', 'A']])
+        self.assertEqual(self.g_p.ha_ciclo(base=True),
+                         [['C', 'a2', 'E', 'a3', 'C'], ['C', 'a6', 'M', 'a8', 'T', 'a7', 'C']])
+
+        # Duas componentes: um triângulo com um laço e um par de arestas paralelas. A base tem E - V + 2 ciclos
+        g = Grafo(['A', 'B', 'C', 'D', 'E'],
+                  {'a1': 'A-B', 'a2': 'B-C', 'a3': 'C-A', 'a4': 'C-C', 'a5': 'D-E', 'a6': 'D-E'})
+        base = g.ha_ciclo(base=True)
+        self.assertEqual(len(base), 6 - 5 + 2)
+        self.assertIn(['A', 'a1', 'B', 'a2', 'C', 'a3', 'A'], base)
+        self.assertIn(['C', 'a4', 'C'], base)
+        self.assertIn(['D', 'a5', 'E', 'a6', 'D'], base)
+
+    def test_ciclo_longo(self):
+        # Um caminho maior que o limite de recursão do Python, fechado num ciclo no fim
+        V = [str(i) for i in range(3000)]
+        A = {}
+        for i in range(2999):
+            A['a%d' % i] = '%d-%d' % (i, i + 1)
+        g = Grafo(V, A)
+        self.assertFalse(g.ha_ciclo())
+
+        g.adicionaAresta('z', '2999-0')
+        ciclo = g.ha_ciclo()
+        self.assertEqual(len(ciclo), 2 * 3000 + 1)
+        self.assertEqual(ciclo[:3], ['0', 'a0', '1'])
+        self.assertEqual(ciclo[-3:], ['2999', 'z', '0'])
+        self.assertEqual(len(g.ha_ciclo(base=True)), 1)
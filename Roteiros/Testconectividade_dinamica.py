@@ -0,0 +1,63 @@
+import random
+import unittest
+from conectividade_dinamica import ConectividadeDinamica
+
+class TestConectividadeDinamica(unittest.TestCase):
+
+    def componentes(self, quantidade, arestas):
+        # Componentes calculadas percorrendo todas as arestas, para comparar com a estrutura
+        componente = [-1] * quantidade
+        for inicio in range(quantidade):
+            if componente[inicio] != -1:
+                continue
+            componente[inicio] = inicio
+            pilha = [inicio]
+            while pilha:
+                u = pilha.pop()
+                for a, b in arestas:
+                    for x, y in ((a, b), (b, a)):
+                        if x == u and componente[y] == -1:
+                            componente[y] = inicio
+                            pilha.append(y)
+        return componente
+
+    def test_paralelas_e_lacos(self):
+        c = ConectividadeDinamica(3)
+        c.adiciona_aresta(0, 1)
+        c.adiciona_aresta(1, 0)
+        c.adiciona_aresta(2, 2)
+        self.assertEqual(c.quantidade_componentes, 2)
+        self.assertTrue(c.remove_aresta(0, 1))
+        self.assertTrue(c.conectados(0, 1))
+        self.assertTrue(c.remove_aresta(0, 1))
+        self.assertFalse(c.conectados(0, 1))
+        self.assertFalse(c.remove_aresta(0, 1))
+        self.assertTrue(c.remove_aresta(2, 2))
+        self.assertEqual(c.quantidade_componentes, 3)
+
+        self.assertEqual(c.adiciona_vertice(), 3)
+        c.adiciona_aresta(3, 0)
+        self.assertTrue(c.conectados(0, 3))
+        self.assertEqual(c.tamanho(3), 2)
+        self.assertEqual(c.tamanho(2), 1)
+
+    def test_aleatorio(self):
+        gerador = random.Random(7)
+        quantidade = 12
+        c = ConectividadeDinamica(quantidade)
+        arestas = []
+        for passo in range(2000):
+            if arestas and gerador.random() < 0.45:
+                u, v = arestas.pop(gerador.randrange(len(arestas)))
+                self.assertTrue(c.remove_aresta(u, v))
+            else:
+                u, v = gerador.randrange(quantidade), gerador.randrange(quantidade)
+                arestas.append((u, v))
+                c.adiciona_aresta(u, v)
+
+            componente = self.componentes(quantidade, arestas)
+            self.assertEqual(c.quantidade_componentes, len(set(componente)))
+            for u in range(quantidade):
+                self.assertEqual(c.tamanho(u), componente.count(componente[u]))
+                for v in range(quantidade):
+                    self.assertEqual(c.conectados(u, v), componente[u] == componente[v])
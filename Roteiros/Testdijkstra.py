@@ -0,0 +1,171 @@
+import os
+import tempfile
+import unittest
+from Roteiro_7 import Grafo, HierarquiaContracao, VerticeInvalidoException, ArestaInvalidaException
+
+class TestGrafo(unittest.TestCase):
+
+    def setUp(self):
+        # Grafo com pesos: o caminho direto A-D é mais caro que A-B-C-D
+        self.g_p = Grafo(['A', 'B', 'C', 'D', 'E'],
+                         {'a1': 'A-B', 'a2': 'B-C', 'a3': 'C-D', 'a4': 'A-D', 'a5': 'B-D'},
+                         {'a1': 1, 'a2': 2.5, 'a3': 1, 'a4': 10, 'a5': 4})
+
+        # Grafo sem pesos, com uma aresta paralela e um laço
+        self.g_u = Grafo(['J', 'C', 'E', 'P'], {'a1': 'J-C', 'a2': 'C-E', 'a3': 'E-C', 'a4': 'C-C'})
+
+    def test_caminho_minimo(self):
+        self.assertEqual(self.g_p.caminho_minimo('A', 'D'), (['A', 'B', 'C', 'D'], 4.5))
+        self.assertEqual(self.g_p.caminho_minimo('D', 'A'), (['D', 'C', 'B', 'A'], 4.5))
+        self.assertEqual(self.g_p.caminho_minimo('B', 'B'), (['B'], 0))
+        self.assertEqual(self.g_u.caminho_minimo('J', 'E'), (['J', 'C', 'E'], 2))
+
+    def test_modos_caminho_minimo(self):
+        # Coordenadas dos vértices, com os pesos sempre maiores ou iguais à distância em linha reta
+        coordenadas = {'A': (0, 0), 'B': (1, 0), 'C': (2, 2), 'D': (3, 2), 'E': (9, 9)}
+
+        def heuristica(u, v):
+            (x1, y1), (x2, y2) = coordenadas[u], coordenadas[v]
+            return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+
+        for modo in ('bidirecional', 'a_estrela'):
+            self.assertEqual(self.g_p.caminho_minimo('A', 'D', modo, heuristica), (['A', 'B', 'C', 'D'], 4.5))
+            self.assertEqual(self.g_p.caminho_minimo('D', 'D', modo, heuristica), (['D'], 0))
+            self.assertFalse(self.g_p.caminho_minimo('A', 'E', modo, heuristica))
+
+        self.g_p.caminho_minimo('A', 'B', 'a_estrela', heuristica)
+        self.assertEqual(self.g_p.fechados, 2)
+
+        with self.assertRaises(ValueError):
+            self.g_p.caminho_minimo('A', 'D', 'a_estrela')
+        with self.assertRaises(ValueError):
+            self.g_p.caminho_minimo('A', 'D', 'largura')
+
+    def test_caminho_inexistente(self):
+        self.assertFalse(self.g_p.caminho_minimo('A', 'E'))
+        self.assertFalse(self.g_u.caminho_minimo('P', 'J'))
+        with self.assertRaises(VerticeInvalidoException):
+            self.g_p.caminho_minimo('A', 'Z')
+
+    def test_distancias(self):
+        self.assertEqual(self.g_p.distancias('A', ['D', 'C', 'E', 'A']),
+                         {'D': (4.5, 'C'), 'C': (3.5, 'B'), 'E': (float('inf'), None), 'A': (0, None)})
+        self.assertEqual(self.g_u.distancias('E'), {'J': (2, 'C'), 'C': (1, 'E'), 'E': (0, None), 'P': (float('inf'), None)})
+        self.assertEqual(self.g_u.distancias('E', []), {})
+
+    def test_matriz_distancias(self):
+        self.assertEqual(self.g_p.matriz_distancias(['A', 'D'], ['B', 'D', 'E']),
+                         [[1, 4.5, float('inf')], [3.5, 0, float('inf')]])
+        self.assertEqual(self.g_u.matriz_distancias(),
+                         [[0, 1, 2, float('inf')], [1, 0, 1, float('inf')], [2, 1, 0, float('inf')],
+                          [float('inf'), float('inf'), float('inf'), 0]])
+
+    def test_distancias_paralelas(self):
+        resultado = dict(self.g_p.distancias_paralelas(['A', 'D', 'E'], ['B', 'D', 'E'], processos=2))
+        self.assertEqual(resultado, {'A': [1, 4.5, float('inf')], 'D': [3.5, 0, float('inf')], 'E': [float('inf'), float('inf'), 0]})
+        self.assertEqual([resultado[w] for w in ['A', 'D', 'E']],
+                         self.g_p.matriz_distancias(['A', 'D', 'E'], ['B', 'D', 'E']))
+        # As distâncias vêm dos arrays de números reais, inclusive a da origem até ela mesma
+        self.assertEqual([type(d) for d in resultado['D']], [float, float, float])
+
+    def test_hierarquia_contracao(self):
+        hierarquia = self.g_p.hierarquia_contracao()
+        for w in self.g_p.N:
+            for v in self.g_p.N:
+                self.assertEqual(hierarquia.caminho_minimo(w, v), self.g_p.caminho_minimo(w, v))
+        self.assertEqual(hierarquia.distancia('A', 'D'), 4.5)
+        self.assertEqual(hierarquia.distancia('A', 'E'), float('inf'))
+        with self.assertRaises(VerticeInvalidoException):
+            hierarquia.distancia('A', 'Z')
+
+        with tempfile.TemporaryDirectory() as pasta:
+            arquivo = os.path.join(pasta, 'hierarquia.ch')
+            hierarquia.salva(arquivo)
+            carregada = HierarquiaContracao.carrega(arquivo)
+        self.assertEqual(carregada.caminho_minimo('D', 'A'), (['D', 'C', 'B', 'A'], 4.5))
+
+    def test_hierarquia_pesos_inteiros(self):
+        # Com pesos inteiros as distâncias da hierarquia são exatas, como as de caminho_minimo
+        g = Grafo(['A', 'B', 'C'], {'a1': 'A-B', 'a2': 'B-C'}, {'a1': 2 ** 60 + 1, 'a2': 1})
+        hierarquia = g.hierarquia_contracao()
+        self.assertEqual(hierarquia.distancia('A', 'C'), 2 ** 60 + 2)
+        self.assertEqual(hierarquia.caminho_minimo('A', 'C'), g.caminho_minimo('A', 'C'))
+        self.assertIsInstance(hierarquia.distancia('A', 'C'), int)
+
+        # B é contraído primeiro, e o atalho A-C passa dos 64 bits mas continua exato
+        g = Grafo(['B', 'A', 'C'], {'a1': 'A-B', 'a2': 'B-C'}, {'a1': 2 ** 63 - 1, 'a2': 2 ** 63 - 1})
+        hierarquia = g.hierarquia_contracao()
+        self.assertIn(2 ** 64 - 2, hierarquia.pesos)
+        self.assertEqual(hierarquia.distancia('C', 'A'), 2 ** 64 - 2)
+
+        self.assertIsInstance(self.g_u.hierarquia_contracao().distancia('J', 'E'), int)
+        self.assertIsInstance(self.g_p.hierarquia_contracao().distancia('A', 'B'), float)
+
+    def test_adiciona_aresta(self):
+        self.g_p.caminho_minimo('A', 'D')
+        self.g_p.adicionaAresta('a6', 'A-E', 0.5)
+        self.g_p.adicionaAresta('a7', 'E-D', 1)
+        self.assertEqual(self.g_p.caminho_minimo('A', 'D'), (['A', 'E', 'D'], 1.5))
+        self.assertEqual(self.g_p.peso('a7'), 1)
+
+        with self.assertRaises(ArestaInvalidaException):
+            self.g_p.adicionaAresta('a8', 'A-B', -1)
+        with self.assertRaises(ArestaInvalidaException):
+            Grafo(['A', 'B'], {'a1': 'A-B'}, {'a1': 'um'})
+
+    def test_dijkstra_energia(self):
+        # Com energia 2 o caminho A-B-C-D não chega ao fim sem recarregar em C
+        rota = self.g_p.Dijkstra('A', 'D', 2, ['C'], capacidade=3)
+        self.assertEqual(rota, {'caminho': ['A', 'B', 'C', 'D'], 'distancia': 4.5, 'recargas': ['C'], 'energia': 2})
+
+        # Sem posto, A-B-C-D gasta energia demais e A-B-D é o menor caminho possível
+        rota = self.g_p.Dijkstra('A', 'D', 2, [])
+        self.assertEqual(rota['caminho'], ['A', 'B', 'D'])
+        self.assertEqual(rota['distancia'], 5)
+        self.assertEqual(rota['recargas'], [])
+
+        # Com energia 1 só resta a aresta direta, a não ser que ela gaste mais do que isso
+        self.assertEqual(self.g_p.Dijkstra('A', 'D', 1, [])['caminho'], ['A', 'D'])
+        self.assertFalse(self.g_p.Dijkstra('A', 'D', 1, [], consumo={'a4': 3}))
+
+    def test_dijkstra_energia_acima_da_capacidade(self):
+        # Um posto nunca tira energia de um veículo que tem mais do que a capacidade, nem na origem
+        consumo = {'a4': 5, 'a5': 5}
+        rota = self.g_p.Dijkstra('A', 'D', 3, ['B'], capacidade=1, consumo=consumo)
+        self.assertEqual(rota, {'caminho': ['A', 'B', 'C', 'D'], 'distancia': 4.5, 'recargas': ['B'], 'energia': 0})
+        rota = self.g_p.Dijkstra('A', 'D', 3, ['A'], capacidade=1, consumo=consumo)
+        self.assertEqual(rota['caminho'], ['A', 'B', 'C', 'D'])
+        self.assertEqual(rota['energia'], 0)
+
+        # Com pouca energia o posto ainda recarrega até a capacidade
+        rota = self.g_p.Dijkstra('A', 'D', 1, ['B'], capacidade=2, consumo=consumo)
+        self.assertEqual(rota['caminho'], ['A', 'B', 'C', 'D'])
+        self.assertEqual(rota['energia'], 0)
+
+    def test_dijkstra_energia_invalido(self):
+        with self.assertRaises(VerticeInvalidoException):
+            self.g_p.Dijkstra('A', 'D', 2, ['Z'])
+        with self.assertRaises(ArestaInvalidaException):
+            self.g_p.Dijkstra('A', 'D', 2, [], consumo={'a1': -1})
+
+    def test_cache(self):
+        self.assertEqual(self.g_p.estatisticas_cache(), {'acertos': 0, 'falhas': 0, 'entradas': 0, 'limite': 0})
+        self.g_p.usa_cache(2)
+
+        self.assertEqual(self.g_p.caminho_minimo('A', 'D'), (['A', 'B', 'C', 'D'], 4.5))
+        self.assertEqual(self.g_p.distancias('A', ['C']), {'C': (3.5, 'B')})
+        self.g_p.caminho_minimo('D', 'A')
+        self.g_p.Dijkstra('A', 'D', 2, ['C'], capacidade=3)
+        self.assertEqual(self.g_p.estatisticas_cache(), {'acertos': 1, 'falhas': 3, 'entradas': 2, 'limite': 2})
+
+        # A árvore de A foi a usada há mais tempo e saiu do cache
+        self.g_p.caminho_minimo('A', 'B')
+        self.assertEqual(self.g_p.estatisticas_cache()['falhas'], 4)
+
+        # Adicionar uma aresta esvazia o cache
+        self.g_p.adicionaAresta('a6', 'A-C', 1)
+        self.assertEqual(self.g_p.estatisticas_cache()['entradas'], 0)
+        self.assertEqual(self.g_p.caminho_minimo('A', 'D'), (['A', 'C', 'D'], 2))
+
+        with self.assertRaises(ValueError):
+            self.g_p.usa_cache(-1)
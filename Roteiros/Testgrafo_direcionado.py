@@ -0,0 +1,78 @@
+import unittest
+from Roteiro_6 import Grafo, VerticeInvalidoException
+
+class TestGrafo(unittest.TestCase):
+
+    # Parâmetros de armazenamento usados na construção de todos os grafos do teste
+    opcoes = {}
+
+    def setUp(self):
+        # Grafo acíclico
+        self.g_a = Grafo(['A', 'B', 'C', 'D'], {'a1': 'A-B', 'a2': 'A-C', 'a3': 'B-C', 'a4': 'C-D'}, **self.opcoes)
+
+        # Grafo da Paraíba com ciclos entre C, E, P, M e T
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
+                         {'a1': 'J-C', 'a2': 'C-E', 'a3': 'E-C', 'a4': 'C-P', 'a5': 'P-C', 'a6': 'C-M', 'a7': 'T-C',
+                          'a8': 'M-T', 'a9': 'T-Z'}, **self.opcoes)
+
+        # Grafo com laço, aresta paralela e vértice isolado
+        self.g_l = Grafo(['A', 'B', 'C'], {'a1': 'A-A', 'a2': 'A-B', 'a3': 'A-B'}, **self.opcoes)
+
+    def test_warshall(self):
+        fecho = self.g_a.warshall()
+        self.assertTrue(fecho.alcanca('A', 'D'))
+        self.assertFalse(fecho.alcanca('D', 'A'))
+        self.assertFalse(fecho.alcanca('A', 'A'))
+        self.assertEqual(fecho.alcancaveis('B'), ['C', 'D'])
+        self.assertEqual(str(fecho), '  A B C D\nA 0 1 1 1 \nB 0 0 1 1 \nC 0 0 0 1 \nD 0 0 0 0 \n')
+
+        fecho = self.g_p.warshall()
+        self.assertTrue(fecho.alcanca('C', 'C'))
+        self.assertTrue(fecho.alcanca('E', 'Z'))
+        self.assertFalse(fecho.alcanca('Z', 'J'))
+        self.assertEqual(fecho.alcancaveis('J'), ['C', 'E', 'P', 'M', 'T', 'Z'])
+
+        fecho = self.g_l.warshall()
+        self.assertEqual(fecho.alcancaveis('A'), ['A', 'B'])
+        self.assertEqual(fecho.alcancaveis('C'), [])
+        with self.assertRaises(VerticeInvalidoException):
+            fecho.alcanca('A', 'X')
+
+    def test_indice_alcancabilidade(self):
+        for g in (self.g_a, self.g_p, self.g_l):
+            fecho = g.warshall()
+            indice = g.indice_alcancabilidade()
+            for u in g.N:
+                self.assertEqual(indice.alcancaveis(u), fecho.alcancaveis(u))
+                for v in g.N:
+                    self.assertEqual(indice.alcanca(u, v), fecho.alcanca(u, v))
+
+        indice = self.g_p.indice_alcancabilidade()
+        self.assertTrue(indice.alcanca('J', 'Z'))
+        self.assertFalse(indice.alcanca('Z', 'T'))
+        with self.assertRaises(VerticeInvalidoException):
+            indice.alcanca('X', 'J')
+
+    def test_componentes_fortes(self):
+        componentes, condensacao = self.g_p.componentes_fortes()
+        self.assertEqual(componentes, {'J': 0, 'C': 1, 'E': 1, 'P': 1, 'M': 1, 'T': 1, 'Z': 2})
+        self.assertEqual(condensacao.N, ['0', '1', '2'])
+        self.assertEqual(condensacao.armazenamento, self.g_p.armazenamento)
+        self.assertTrue(condensacao.existeAresta('0-1'))
+        self.assertTrue(condensacao.existeAresta('1-2'))
+        self.assertFalse(condensacao.existeAresta('1-1'))
+        self.assertFalse(condensacao.existeAresta('0-2'))
+
+        # Num grafo acíclico cada vértice é uma componente, em ordem topológica
+        componentes, condensacao = self.g_a.componentes_fortes()
+        self.assertEqual(componentes, {'A': 0, 'B': 1, 'C': 2, 'D': 3})
+        self.assertEqual(str(condensacao), '  0 1 2 3\n0 0 1 1 0 \n1 0 0 1 0 \n2 0 0 0 1 \n3 0 0 0 0 \n')
+
+        # Arestas paralelas viram uma só aresta e o laço desaparece
+        componentes, condensacao = self.g_l.componentes_fortes()
+        self.assertEqual(str(condensacao), '  0 1 2\n0 0 0 0 \n1 0 0 1 \n2 0 0 0 \n')
+        self.assertEqual(componentes, {'A': 1, 'B': 2, 'C': 0})
+
+
+class TestGrafoEsparso(TestGrafo):
+    opcoes = {'armazenamento': 'esparsa'}
@@ -0,0 +1,134 @@
+import unittest
+from Roteiro_5 import Grafo
+
+class TestGrafo(unittest.TestCase):
+
+    # Parâmetros de armazenamento usados na construção de todos os grafos do teste
+    opcoes = {}
+
+    def setUp(self):
+        # Grafo da Paraíba
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
+                         {'a1': 'J-C', 'a2': 'C-E', 'a3': 'C-E', 'a4': 'C-P', 'a5': 'C-P', 'a6': 'C-M', 'a7': 'C-T', 'a8': 'M-T', 'a9': 'T-Z'}, **self.opcoes)
+
+        # Ciclo com quatro vértices
+        self.g_c = Grafo(['A', 'B', 'C', 'D'], {'a1': 'A-B', 'a2': 'A-D', 'a3': 'B-C', 'a4': 'C-D'}, **self.opcoes)
+
+        # Grafo desconexo com laço
+        self.g_d = Grafo(['A', 'B', 'C'], {'a1': 'A-A', 'a2': 'A-B'}, **self.opcoes)
+
+    def test_grau(self):
+        self.assertEqual(self.g_p.grau('C'), 7)
+        self.assertEqual(self.g_p.grau('T'), 3)
+        self.assertEqual(self.g_d.grau('A'), 2)
+        self.assertEqual(self.g_d.grau('C'), 0)
+
+    def test_arestas_sobre_vertice(self):
+        self.assertEqual(self.g_p.arestas_sobre_vertice('C'), ['C-J', 'C-E', 'C-P', 'C-M', 'C-T'])
+        self.assertEqual(self.g_d.arestas_sobre_vertice('A'), ['A-A', 'A-B'])
+        self.assertEqual(self.g_d.arestas_sobre_vertice('C'), [])
+
+    def test_adiciona_remove_aresta(self):
+        self.g_d.adicionaVertice('DE')
+        self.g_d.adicionaAresta('DE-C')
+        self.assertTrue(self.g_d.existeAresta('C-DE'))
+        self.assertEqual(self.g_d.grau('DE'), 1)
+
+        self.g_p.remove_aresta('E-C')
+        self.assertTrue(self.g_p.existeAresta('C-E'))
+        self.g_p.remove_aresta('C-E')
+        self.assertFalse(self.g_p.existeAresta('C-E'))
+        self.assertEqual(self.g_p.grau('C'), 5)
+
+    def test_dfs(self):
+        self.assertEqual(self.g_p.dfs('J'), ['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        self.assertEqual(self.g_c.dfs('A'), ['A', 'B', 'C', 'D'])
+        self.assertEqual(self.g_d.dfs('A'), ['A', 'B'])
+
+    def test_dfs_caminho_longo(self):
+        # Um caminho maior que o limite de recursão do Python
+        V = [str(i) for i in range(3000)]
+        g = Grafo.from_edges(V, ['%d-%d' % (i, i + 1) for i in range(2999)], **self.opcoes)
+        self.assertEqual(g.dfs('0'), V)
+        self.assertTrue(g.conexo('1500'))
+
+    def test_iter_dfs(self):
+        self.assertEqual(list(self.g_c.iter_dfs('A')), [('A', None), ('B', 'A-B'), ('C', 'B-C'), ('D', 'C-D')])
+        busca = self.g_p.iter_dfs('J')
+        self.assertEqual(next(busca), ('J', None))
+        self.assertEqual(next(busca), ('C', 'J-C'))
+
+    def test_iter_bfs(self):
+        self.assertEqual(list(self.g_c.iter_bfs('A')), [('A', None), ('B', 'A-B'), ('D', 'A-D'), ('C', 'B-C')])
+        self.assertEqual([v for v, aresta in self.g_p.iter_bfs('Z')], ['Z', 'T', 'C', 'M', 'J', 'E', 'P'])
+        self.assertEqual(list(self.g_d.iter_bfs('C')), [('C', None)])
+
+    def test_conexo(self):
+        self.assertTrue(self.g_p.conexo('J'))
+        self.assertTrue(self.g_c.conexo('C'))
+        self.assertFalse(self.g_d.conexo('A'))
+
+    def test_componentes(self):
+        self.assertEqual(self.g_p.componentes(), ({'J': 0, 'C': 0, 'E': 0, 'P': 0, 'M': 0, 'T': 0, 'Z': 0}, [7]))
+        self.assertEqual(self.g_d.componentes(), ({'A': 0, 'B': 0, 'C': 1}, [2, 1]))
+        self.assertFalse(self.g_d.mesma_componente('A', 'C'))
+
+        # As componentes acompanham as arestas adicionadas e removidas
+        self.g_d.adicionaVertice('D')
+        self.g_d.adicionaAresta('C-D')
+        self.assertEqual(self.g_d.componentes(), ({'A': 0, 'B': 0, 'C': 1, 'D': 1}, [2, 2]))
+        self.g_d.adicionaAresta('B-C')
+        self.assertTrue(self.g_d.conexo('A'))
+        self.g_d.remove_aresta('A-B')
+        self.assertEqual(self.g_d.componentes(), ({'A': 0, 'B': 1, 'C': 1, 'D': 1}, [1, 3]))
+        self.assertFalse(self.g_d.conexo('A'))
+
+    def test_conectividade_dinamica(self):
+        # Fecha as arestas de um caminho uma a uma, reabrindo algumas
+        V = [str(i) for i in range(50)]
+        g = Grafo.from_edges(V, ['%d-%d' % (i, i + 1) for i in range(49)] + ['0-49'], **self.opcoes)
+        g.remove_aresta('10-11')
+        self.assertTrue(g.conexo('0'))
+        g.remove_aresta('30-31')
+        self.assertEqual(g.componentes()[1], [30, 20])
+        self.assertFalse(g.mesma_componente('10', '11'))
+        g.adicionaAresta('10-30')
+        self.assertEqual(g.componentes()[1], [50])
+        g.remove_aresta('0-49')
+        self.assertEqual(g.componentes()[1], [31, 19])
+        self.assertFalse(g.mesma_componente('0', '49'))
+        g.remove_aresta('30-10')
+        self.assertEqual(g.componentes()[1], [11, 20, 19])
+
+    def test_pontes(self):
+        self.assertEqual(self.g_p.pontes(), [['J-C'], ['T-Z']])
+        self.assertEqual(self.g_c.pontes(), [])
+        self.assertEqual(self.g_d.pontes(), [['A-B']])
+
+    def test_pontos_articulacao(self):
+        self.assertEqual(self.g_p.pontos_articulacao(), ['C', 'T'])
+        self.assertEqual(self.g_c.pontos_articulacao(), [])
+        self.assertEqual(self.g_d.pontos_articulacao(), [])
+
+    def test_euler(self):
+        self.assertEqual(self.g_c.euler(), ['A', 'B', 'C', 'D', 'A'])
+        self.assertEqual(self.g_d.euler(), ['A', 'A', 'B'])
+        self.assertFalse(self.g_p.euler())
+
+        # Caminho entre os dois vértices de grau ímpar, passando pelas paralelas
+        g = Grafo(['A', 'B', 'C'], {'a1': 'A-B', 'a2': 'A-B', 'a3': 'B-C', 'a4': 'C-C'}, **self.opcoes)
+        self.assertEqual(g.euler(), ['B', 'A', 'B', 'C', 'C'])
+        self.assertEqual(g.arestas_sobre_vertice('A'), ['A-B'])
+
+        # Arestas em duas componentes diferentes
+        g = Grafo(['A', 'B', 'C', 'D'], {'a1': 'A-B', 'a2': 'C-D'}, **self.opcoes)
+        self.assertFalse(g.euler())
+
+    def test_from_edges(self):
+        g = Grafo.from_edges(['J', 'C', 'E', 'P', 'M', 'T', 'Z'],
+                             ['J-C', 'C-E', 'C-E', 'C-P', 'C-P', 'C-M', 'C-T', 'M-T', 'T-Z'], **self.opcoes)
+        self.assertEqual(str(g), str(self.g_p))
+
+
+class TestGrafoEsparso(TestGrafo):
+    opcoes = {'armazenamento': 'esparsa'}
@@ -1,11 +1,14 @@
 import unittest
-from Roteiro_4 import Grafo
+from Roteiro_4 import Grafo, VerticeInvalidoException, ArestaInvalidaException, np
 
 class TestGrafo(unittest.TestCase):
 
+    # Parâmetros de armazenamento usados na construção de todos os grafos do teste
+    opcoes = {}
+
     def setUp(self):
         # Grafo da Paraíba
-        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        self.g_p = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'], **self.opcoes)
         #{'a1':'J-C', 'a2':'C-E', 'a3':'C-E', 'a4':'C-P', 'a5':'C-P', 'a6':'C-M', 'a7':'C-T', 'a8':'M-T', 'a9':'T-Z'}
         self.g_p.adicionaAresta('J-C')
         self.g_p.adicionaAresta('C-E')
@@ -19,7 +22,7 @@ class TestGrafo(unittest.TestCase):
 
 
         # Grafo da Paraíba sem arestas paralelas
-        self.g_p_sem_paralelas = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'])
+        self.g_p_sem_paralelas = Grafo(['J', 'C', 'E', 'P', 'M', 'T', 'Z'], **self.opcoes)
         self.g_p_sem_paralelas.adicionaAresta('J-C')
         self.g_p_sem_paralelas.adicionaAresta('C-E')
         self.g_p_sem_paralelas.adicionaAresta('C-P')
@@ -30,7 +33,7 @@ class TestGrafo(unittest.TestCase):
 
         # Grafos completos
         #self.g_c = Grafo(['J', 'C', 'E', 'P'], {'a1':'J-C', 'a3':'J-E', 'a4':'J-P', 'a6':'C-E', 'a7':'C-P', 'a8':'E-P'})
-        self.g_c = Grafo(['J', 'C', 'E', 'P'])
+        self.g_c = Grafo(['J', 'C', 'E', 'P'], **self.opcoes)
         self.g_c.adicionaAresta('J-C')
         self.g_c.adicionaAresta('J-E')
         self.g_c.adicionaAresta('J-P')
@@ -38,33 +41,33 @@ class TestGrafo(unittest.TestCase):
         self.g_c.adicionaAresta('C-P')
         self.g_c.adicionaAresta('E-P')
 
-        self.g_c3 = Grafo(['J'])
+        self.g_c3 = Grafo(['J'], **self.opcoes)
 
         # Grafos com laco
         #self.g_l1 = Grafo(['A', 'B', 'C', 'D'], {'a1':'A-A', 'a2':'B-A', 'a3':'A-A'})
-        self.g_l1 = Grafo(['A', 'B', 'C', 'D'])
+        self.g_l1 = Grafo(['A', 'B', 'C', 'D'], **self.opcoes)
         self.g_l1.adicionaAresta('A-A')
         self.g_l1.adicionaAresta('A-A')
         self.g_l1.adicionaAresta('B-A')
 
         #self.g_l2 = Grafo(['A', 'B', 'C', 'D'], {'a1':'A-B', 'a2':'B-B', 'a3':'B-A'})
-        self.g_l2 = Grafo(['A', 'B', 'C', 'D'])
+        self.g_l2 = Grafo(['A', 'B', 'C', 'D'], **self.opcoes)
         self.g_l2.adicionaAresta('A-B')
         self.g_l2.adicionaAresta('B-B')
         self.g_l2.adicionaAresta('B-A')
 
         #self.g_l3 = Grafo(['A', 'B', 'C', 'D'], {'a1':'C-A', 'a2':'C-C', 'a3':'D-D'})
-        self.g_l3 = Grafo(['A', 'B', 'C', 'D'])
+        self.g_l3 = Grafo(['A', 'B', 'C', 'D'], **self.opcoes)
         self.g_l3.adicionaAresta('C-A')
         self.g_l3.adicionaAresta('C-C')
         self.g_l3.adicionaAresta('D-D')
 
         #self.g_l4 = Grafo(['D'], {'a2':'D-D'})
-        self.g_l4 = Grafo(['D'])
+        self.g_l4 = Grafo(['D'], **self.opcoes)
         self.g_l4.adicionaAresta('D-D')
 
         #self.g_l5 = Grafo(['C', 'D'], {'a2':'D-C', 'a3':'C-C'})
-        self.g_l5 = Grafo(['C', 'D'])
+        self.g_l5 = Grafo(['C', 'D'], **self.opcoes)
         self.g_l5.adicionaAresta('D-C')
         self.g_l5.adicionaAresta('C-C')
 
@@ -129,3 +132,102 @@ class TestGrafo(unittest.TestCase):
         self.assertFalse((self.g_l3.eh_completo()))
         self.assertTrue((self.g_l4.eh_completo()))
         self.assertTrue((self.g_l5.eh_completo()))
+
+    def test_existe_aresta(self):
+        self.assertTrue(self.g_p.existeAresta('J-C'))
+        self.assertTrue(self.g_p.existeAresta('C-J'))
+        self.assertFalse(self.g_p.existeAresta('J-E'))
+        self.assertFalse(self.g_p.existeAresta('E-J'))
+        self.assertFalse(self.g_p.existeAresta('J-X'))
+
+    def test_adiciona_vertice(self):
+        self.g_p.adicionaVertice('JP')
+        self.assertTrue(self.g_p.existeVertice('JP'))
+        self.g_p.adicionaAresta('JP-C')
+        self.g_p.adicionaAresta('Z-JP')
+        self.assertEqual(self.g_p.grau('JP'), 2)
+        self.assertEqual(self.g_p.grau('C'), 8)
+        self.assertEqual(set(self.g_p.arestas_sobre_vertice('JP')), set(['C-JP', 'Z-JP']))
+
+    def test_from_edges(self):
+        arestas = ['J-C', 'C-E', 'C-E', 'C-P', 'C-P', 'C-M', 'C-T', 'M-T', 'T-Z']
+        for validate in ('fast', 'none'):
+            g = Grafo.from_edges(['J', 'C', 'E', 'P', 'M', 'T', 'Z'], arestas, validate, **self.opcoes)
+            self.assertEqual(str(g), str(self.g_p))
+            self.assertEqual(g.grau('C'), 7)
+
+        g = Grafo.from_edges(['A', 'B'], {'a1': 'B-A', 'a2': 'B-B'}, **self.opcoes)
+        self.assertEqual(g.grau('A'), 1)
+        self.assertEqual(g.grau('B'), 2)
+        self.assertTrue(g.ha_laco())
+
+        with self.assertRaises(ArestaInvalidaException):
+            Grafo.from_edges(['A', 'B'], ['A-C'])
+        with self.assertRaises(VerticeInvalidoException):
+            Grafo.from_edges(['A', 'B', 'A'], ['A-B'])
+        with self.assertRaises(VerticeInvalidoException):
+            Grafo.from_edges(['A', 'B-C'], [])
+
+    def test_remove_aresta(self):
+        self.g_p.remove_aresta('E-C')
+        self.assertEqual(self.g_p.grau('C'), 6)
+        self.assertTrue(self.g_p.existeAresta('C-E'))
+        self.g_p.remove_aresta('C-E')
+        self.assertFalse(self.g_p.existeAresta('C-E'))
+        # Remover uma aresta que não existe não altera o grafo
+        self.g_p.remove_aresta('C-E')
+        self.assertEqual(self.g_p.grau('E'), 0)
+
+    def test_limite_do_tipo(self):
+        # 300 arestas paralelas passam do limite do uint8, e o array é alargado em vez de dar a volta
+        g = Grafo(['A', 'B'], **self.opcoes)
+        g.mesma_componente('A', 'B')
+        for k in range(300):
+            g.adicionaAresta('A-B')
+        self.assertEqual(g.grau('A'), 300)
+        self.assertTrue(g.existeAresta('A-B'))
+        self.assertTrue(g.conexo())
+
+        g = Grafo.from_edges(['A', 'B', 'C'], ['A-B'] * 256 + ['C-B'] * 300 + ['C-C'] * 2, **self.opcoes)
+        self.assertEqual(g.grau('A'), 256)
+        self.assertEqual(g.grau('B'), 556)
+        self.assertTrue(g.existeAresta('B-C'))
+        self.assertTrue(g.conexo())
+        for k in range(256):
+            g.remove_aresta('B-A')
+        self.assertFalse(g.existeAresta('A-B'))
+        self.assertFalse(g.conexo())
+
+    def test_conectividade(self):
+        self.assertTrue(self.g_p.conexo())
+        self.assertTrue(self.g_p.mesma_componente('J', 'Z'))
+
+        # Com duas arestas entre C e E, remover uma não separa E
+        self.g_p.remove_aresta('C-E')
+        self.assertTrue(self.g_p.mesma_componente('E', 'J'))
+        self.g_p.remove_aresta('E-C')
+        self.assertFalse(self.g_p.mesma_componente('E', 'J'))
+        self.assertFalse(self.g_p.conexo())
+
+        # M-T está num ciclo, então a sua remoção não separa nada
+        self.g_p.adicionaAresta('E-Z')
+        self.g_p.remove_aresta('M-T')
+        self.assertTrue(self.g_p.conexo())
+        self.g_p.remove_aresta('C-T')
+        self.assertFalse(self.g_p.mesma_componente('M', 'T'))
+        self.assertTrue(self.g_p.mesma_componente('T', 'E'))
+
+        self.g_p.adicionaVertice('X')
+        self.assertFalse(self.g_p.mesma_componente('X', 'J'))
+        with self.assertRaises(VerticeInvalidoException):
+            self.g_p.mesma_componente('J', 'Y')
+
+
+@unittest.skipIf(np is None, 'numpy não está instalado')
+class TestGrafoNumpy(TestGrafo):
+    opcoes = {'armazenamento': 'numpy', 'dtype': 'uint8'}
+
+
+@unittest.skipIf(np is None, 'numpy não está instalado')
+class TestGrafoNumpySimetrica(TestGrafoNumpy):
+    opcoes = {'armazenamento': 'numpy', 'dtype': 'int32', 'simetrica': True}
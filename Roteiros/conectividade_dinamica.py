@@ -0,0 +1,474 @@
+import random
+
+
+class _No:
+    '''
+    Nó de uma árvore cartesiana (treap) que guarda o passeio de Euler de uma árvore da floresta geradora.
+    Um nó representa um vértice (vertice >= 0) ou uma das duas passagens por uma aresta da árvore (vertice == -1).
+    '''
+    __slots__ = ('esq', 'dir', 'pai', 'prioridade', 'vertice', 'aresta', 'marca', 'nos', 'vertices', 'marcados')
+
+    def __init__(self, vertice=-1, aresta=None):
+        self.esq = None
+        self.dir = None
+        self.pai = None
+        self.prioridade = random.random()
+        self.vertice = vertice
+        self.aresta = aresta
+        # Num vértice, indica que ele tem arestas fora da floresta neste nível;
+        # numa aresta, indica que o nível dela é este
+        self.marca = False
+        self.nos = 1
+        self.vertices = 1 if vertice >= 0 else 0
+        self.marcados = 0
+
+
+class _Aresta:
+    '''
+    Aresta usada por ConectividadeDinamica. passagens guarda, para cada nível em que a aresta faz parte da floresta,
+    os dois nós do passeio de Euler que passam por ela; uma lista vazia indica que a aresta está fora da floresta.
+    '''
+    __slots__ = ('u', 'v', 'nivel', 'passagens')
+
+    def __init__(self, u, v):
+        self.u = u
+        self.v = v
+        self.nivel = 0
+        self.passagens = []
+
+
+class ConectividadeDinamica:
+    '''
+    Conectividade de um grafo não direcionado que aceita inclusão e remoção de arestas, com o algoritmo de
+    Holm, de Lichtenberg e Thorup. Cada aresta tem um nível, e para cada nível i há uma floresta geradora das arestas de
+    nível maior ou igual a i, guardada como passeios de Euler em árvores cartesianas. Quando uma aresta da floresta é
+    removida, a substituta é procurada na menor das duas árvores que sobram, e as arestas examinadas sobem de nível,
+    o que limita o custo amortizado de cada operação a O(log² V); as consultas custam O(log V).
+    Os vértices são identificados pelos índices 0, 1, ..., quantidade - 1.
+    '''
+
+    def __init__(self, quantidade=0):
+        self.quantidade = quantidade
+        self.quantidade_componentes = quantidade
+
+        # nos[i][v] é o nó do vértice v no nível i, criado só quando o vértice aparece numa floresta daquele nível
+        self.nos = [[None] * quantidade]
+        # fora[i][v] é o conjunto das arestas de nível i, fora da floresta, que incidem no vértice v
+        self.fora = [[None] * quantidade]
+        # Para cada par de vértices (u, v) com u <= v, a lista das arestas que os ligam
+        self.pares = {}
+
+    def adiciona_vertice(self):
+        '''
+        Adiciona um vértice isolado.
+        :return: O índice do vértice
+        '''
+        for nivel in range(len(self.nos)):
+            self.nos[nivel].append(None)
+            self.fora[nivel].append(None)
+        self.quantidade += 1
+        self.quantidade_componentes += 1
+        return self.quantidade - 1
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #   Árvores cartesianas
+    # ------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __atualiza(x):
+        '''
+        Recalcula os totais da subárvore de x a partir dos filhos.
+        :param x: O nó
+        '''
+        nos = 1
+        vertices = 1 if x.vertice >= 0 else 0
+        marcados = 1 if x.marca else 0
+        if x.esq is not None:
+            nos += x.esq.nos
+            vertices += x.esq.vertices
+            marcados += x.esq.marcados
+        if x.dir is not None:
+            nos += x.dir.nos
+            vertices += x.dir.vertices
+            marcados += x.dir.marcados
+        x.nos = nos
+        x.vertices = vertices
+        x.marcados = marcados
+
+    @staticmethod
+    def __raiz(x):
+        '''
+        Encontra a raiz da árvore cartesiana que contém x.
+        :param x: O nó
+        :return: A raiz
+        '''
+        while x.pai is not None:
+            x = x.pai
+        return x
+
+    @staticmethod
+    def __posicao(x):
+        '''
+        Calcula a posição de x no passeio de Euler.
+        :param x: O nó
+        :return: A quantidade de nós antes de x
+        '''
+        posicao = x.esq.nos if x.esq is not None else 0
+        while x.pai is not None:
+            if x.pai.dir is x:
+                posicao += 1 + (x.pai.esq.nos if x.pai.esq is not None else 0)
+            x = x.pai
+        return posicao
+
+    @classmethod
+    def __junta(cls, a, b):
+        '''
+        Concatena dois passeios.
+        :param a: A raiz do primeiro passeio (ou None)
+        :param b: A raiz do segundo passeio (ou None)
+        :return: A raiz do passeio concatenado
+        '''
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        # Desce pela borda direita de a e pela borda esquerda de b, guardando os nós que terão os totais recalculados
+        caminho = []
+        raiz = None
+        pai = None
+        lado_direito = False
+        while a is not None and b is not None:
+            if a.prioridade > b.prioridade:
+                no = a
+                proximo_a, proximo_b = a.dir, b
+            else:
+                no = b
+                proximo_a, proximo_b = a, b.esq
+            if pai is None:
+                raiz = no
+            elif lado_direito:
+                pai.dir = no
+            else:
+                pai.esq = no
+            no.pai = pai
+            caminho.append(no)
+            pai = no
+            lado_direito = no is a
+            a, b = proximo_a, proximo_b
+
+        resto = a if a is not None else b
+        if lado_direito:
+            pai.dir = resto
+        else:
+            pai.esq = resto
+        resto.pai = pai
+
+        for no in reversed(caminho):
+            cls.__atualiza(no)
+        return raiz
+
+    @classmethod
+    def __separa(cls, x, incluso_na_esquerda):
+        '''
+        Divide o passeio que contém x em duas partes, antes e depois de x.
+        :param x: O nó onde o passeio é dividido
+        :param incluso_na_esquerda: Se verdadeiro, x fica no fim da primeira parte; senão, no começo da segunda
+        :return: Uma tupla (raiz da primeira parte, raiz da segunda parte), com None para uma parte vazia
+        '''
+        if incluso_na_esquerda:
+            direita = x.dir
+            x.dir = None
+            esquerda = x
+        else:
+            esquerda = x.esq
+            x.esq = None
+            direita = x
+        cls.__atualiza(x)
+
+        filho = x
+        pai = x.pai
+        x.pai = None
+        while pai is not None:
+            acima = pai.pai
+            pai.pai = None
+            if pai.dir is filho:
+                pai.dir = esquerda
+                if esquerda is not None:
+                    esquerda.pai = pai
+                cls.__atualiza(pai)
+                esquerda = pai
+            else:
+                pai.esq = direita
+                if direita is not None:
+                    direita.pai = pai
+                cls.__atualiza(pai)
+                direita = pai
+            filho = pai
+            pai = acima
+
+        if esquerda is not None:
+            esquerda.pai = None
+        if direita is not None:
+            direita.pai = None
+        return esquerda, direita
+
+    @classmethod
+    def __marcados(cls, raiz):
+        '''
+        Lista os nós marcados de um passeio, descendo só pelas subárvores que têm algum nó marcado.
+        :param raiz: A raiz do passeio
+        :return: Uma lista de nós
+        '''
+        encontrados = []
+        pilha = [raiz] if raiz is not None and raiz.marcados else []
+        while pilha:
+            x = pilha.pop()
+            if x.marca:
+                encontrados.append(x)
+            if x.esq is not None and x.esq.marcados:
+                pilha.append(x.esq)
+            if x.dir is not None and x.dir.marcados:
+                pilha.append(x.dir)
+        return encontrados
+
+    @staticmethod
+    def __marca(x, marca):
+        '''
+        Marca ou desmarca um nó, corrigindo os totais até a raiz.
+        :param x: O nó
+        :param marca: O novo valor da marca
+        '''
+        if x.marca == marca:
+            return
+        x.marca = marca
+        diferenca = 1 if marca else -1
+        while x is not None:
+            x.marcados += diferenca
+            x = x.pai
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #   Florestas por nível
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def __no(self, nivel, v):
+        '''
+        Retorna o nó do vértice v no nível dado, criando o nível e o nó se ainda não existirem.
+        :param nivel: O nível
+        :param v: O índice do vértice
+        :return: O nó
+        '''
+        while len(self.nos) <= nivel:
+            self.nos.append([None] * self.quantidade)
+            self.fora.append([None] * self.quantidade)
+        if self.nos[nivel][v] is None:
+            self.nos[nivel][v] = _No(v)
+        return self.nos[nivel][v]
+
+    def __reenraiza(self, x):
+        '''
+        Faz o passeio de Euler que contém o nó de vértice x começar em x.
+        :param x: O nó do vértice
+        :return: A raiz do passeio
+        '''
+        esquerda, direita = self.__separa(x, False)
+        return self.__junta(direita, esquerda)
+
+    def __liga(self, aresta, nivel):
+        '''
+        Inclui uma aresta na floresta de um nível, juntando as árvores dos seus dois vértices.
+        :param aresta: A aresta
+        :param nivel: O nível da floresta
+        '''
+        u, v = aresta.u, aresta.v
+        ida = _No(-1, aresta)
+        volta = _No(-1, aresta)
+        aresta.passagens.append((ida, volta))
+        passeio = self.__junta(self.__reenraiza(self.__no(nivel, u)), ida)
+        passeio = self.__junta(passeio, self.__reenraiza(self.__no(nivel, v)))
+        self.__junta(passeio, volta)
+        if nivel == aresta.nivel:
+            self.__marca(ida, True)
+
+    def __corta(self, aresta, nivel):
+        '''
+        Retira uma aresta da floresta de um nível, separando a árvore em duas.
+        :param aresta: A aresta
+        :param nivel: O nível da floresta
+        '''
+        ida, volta = aresta.passagens[nivel]
+        if self.__posicao(ida) > self.__posicao(volta):
+            ida, volta = volta, ida
+        antes, resto = self.__separa(ida, False)
+        resto = self.__separa(ida, True)[1]
+        meio, resto = self.__separa(volta, False)
+        depois = self.__separa(volta, True)[1]
+        self.__junta(antes, depois)
+
+    def __conectados_no_nivel(self, nivel, u, v):
+        '''
+        Verifica se dois vértices estão na mesma árvore da floresta de um nível.
+        :param nivel: O nível da floresta
+        :param u: O índice de um vértice
+        :param v: O índice do outro vértice
+        :return: Um valor booleano
+        '''
+        if u == v:
+            return True
+        if nivel >= len(self.nos) or self.nos[nivel][u] is None or self.nos[nivel][v] is None:
+            return False
+        return self.__raiz(self.nos[nivel][u]) is self.__raiz(self.nos[nivel][v])
+
+    def __inclui_fora(self, aresta, nivel):
+        '''
+        Registra uma aresta que não está na floresta como aresta do nível dado nos seus dois vértices.
+        :param aresta: A aresta
+        :param nivel: O nível
+        '''
+        aresta.nivel = nivel
+        for x in (aresta.u, aresta.v):
+            no = self.__no(nivel, x)
+            if self.fora[nivel][x] is None:
+                self.fora[nivel][x] = set()
+            self.fora[nivel][x].add(aresta)
+            self.__marca(no, True)
+
+    def __exclui_fora(self, aresta):
+        '''
+        Retira do nível atual o registro de uma aresta que não está na floresta.
+        :param aresta: A aresta
+        '''
+        nivel = aresta.nivel
+        for x in (aresta.u, aresta.v):
+            conjunto = self.fora[nivel][x]
+            conjunto.discard(aresta)
+            if not conjunto:
+                self.fora[nivel][x] = None
+                self.__marca(self.nos[nivel][x], False)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #   Operações
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def adiciona_aresta(self, u, v):
+        '''
+        Adiciona uma aresta entre os vértices u e v. Arestas paralelas e laços são aceitos.
+        :param u: O índice de um vértice
+        :param v: O índice do outro vértice
+        '''
+        if u > v:
+            u, v = v, u
+        aresta = _Aresta(u, v)
+        self.pares.setdefault((u, v), []).append(aresta)
+
+        if u == v:
+            return
+        if self.__conectados_no_nivel(0, u, v):
+            self.__inclui_fora(aresta, 0)
+        else:
+            self.__liga(aresta, 0)
+            self.quantidade_componentes -= 1
+
+    def remove_aresta(self, u, v):
+        '''
+        Remove uma das arestas entre os vértices u e v, dando preferência às que não estão na floresta.
+        :param u: O índice de um vértice
+        :param v: O índice do outro vértice
+        :return: False se não havia aresta entre os dois vértices, True caso contrário
+        '''
+        if u > v:
+            u, v = v, u
+        arestas = self.pares.get((u, v))
+        if not arestas:
+            return False
+
+        escolhida = len(arestas) - 1
+        for k in range(len(arestas)):
+            if not arestas[k].passagens:
+                escolhida = k
+                break
+        aresta = arestas[escolhida]
+        arestas[escolhida] = arestas[-1]
+        arestas.pop()
+        if not arestas:
+            del self.pares[(u, v)]
+
+        if u == v:
+            return True
+        if not aresta.passagens:
+            self.__exclui_fora(aresta)
+            return True
+
+        nivel = aresta.nivel
+        for i in range(nivel + 1):
+            self.__corta(aresta, i)
+        if not self.__substitui(u, v, nivel):
+            self.quantidade_componentes += 1
+        return True
+
+    def __substitui(self, u, v, nivel):
+        '''
+        Procura uma aresta que religue as árvores de u e v, do nível da aresta removida até o nível 0.
+        Em cada nível, as arestas da menor das duas árvores sobem um nível.
+        :param u: O índice de um vértice da aresta removida
+        :param v: O índice do outro vértice
+        :param nivel: O nível da aresta removida
+        :return: Um valor booleano que indica se uma aresta substituta foi encontrada
+        '''
+        for i in range(nivel, -1, -1):
+            raiz_u = self.__raiz(self.nos[i][u])
+            raiz_v = self.__raiz(self.nos[i][v])
+            menor = raiz_u if raiz_u.vertices <= raiz_v.vertices else raiz_v
+            lado = u if menor is raiz_u else v
+
+            # As arestas da floresta de nível i dentro da menor árvore sobem para o nível i + 1
+            for passagem in self.__marcados(menor):
+                if passagem.vertice >= 0:
+                    continue
+                aresta = passagem.aresta
+                self.__marca(passagem, False)
+                aresta.nivel = i + 1
+                self.__liga(aresta, i + 1)
+
+            # As marcas mudam enquanto as arestas de fora são examinadas, mas a raiz da menor árvore continua a mesma
+            for no in self.__marcados(self.__raiz(self.nos[i][lado])):
+                if no.vertice < 0:
+                    continue
+                for aresta in list(self.fora[i][no.vertice] or ()):
+                    self.__exclui_fora(aresta)
+                    outro = aresta.v if aresta.u == no.vertice else aresta.u
+                    if self.__raiz(self.__no(i, outro)) is not self.__raiz(no):
+                        # A aresta liga as duas árvores: entra na floresta em todos os níveis até i
+                        aresta.nivel = i
+                        for j in range(i + 1):
+                            self.__liga(aresta, j)
+                        return True
+                    self.__inclui_fora(aresta, i + 1)
+        return False
+
+    def conectados(self, u, v):
+        '''
+        Verifica se existe um caminho entre dois vértices.
+        :param u: O índice de um vértice
+        :param v: O índice do outro vértice
+        :return: Um valor booleano
+        '''
+        return self.__conectados_no_nivel(0, u, v)
+
+    def representante(self, v):
+        '''
+        Retorna um objeto que identifica a componente do vértice v enquanto o grafo não mudar.
+        :param v: O índice do vértice
+        :return: O mesmo objeto para todos os vértices de uma componente
+        '''
+        no = self.nos[0][v]
+        return self.__raiz(no) if no is not None else v
+
+    def tamanho(self, v):
+        '''
+        Retorna a quantidade de vértices da componente do vértice v.
+        :param v: O índice do vértice
+        :return: O tamanho da componente
+        '''
+        no = self.nos[0][v]
+        return self.__raiz(no).vertices if no is not None else 1